@@ -1,8 +1,10 @@
 
 from dataclasses import dataclass
-from typing import Generic, List, Optional, TypeVar
+import datetime
+import hashlib
+from typing import Dict, Generic, List, Optional, TypeVar
 
-from core.__seedwork.domain.repositories import SearchResult
+from core.__seedwork.domain.repositories import COUNT_EXACT, SearchResult
 
 
 Filter = TypeVar('Filter')
@@ -15,6 +17,8 @@ class SearchInput(Generic[Filter]):
     sort: Optional[str] = None
     sort_dir: Optional[str] = None
     filter: Optional[Filter] = None
+    cursor: Optional[str] = None
+    count_mode: Optional[str] = None
 
 
 Item = TypeVar('Item')
@@ -23,10 +27,14 @@ Item = TypeVar('Item')
 @dataclass(frozen=True, slots=True)
 class PaginationOutput(Generic[Item]):
     items: List[Item]
-    total: int
+    total: Optional[int]
     current_page: int
     per_page: int
-    last_page: int
+    last_page: Optional[int]
+    next_cursor: Optional[str] = None
+    has_more: Optional[bool] = None
+    count_mode: Optional[str] = None
+    total_capped: Optional[bool] = None
 
 
 Output = TypeVar('Output', bound=PaginationOutput)
@@ -41,10 +49,51 @@ class PaginationOutputMapper:
         return PaginationOutputMapper(output_child)
 
     def to_output(self, items: List[Item], result: SearchResult) -> PaginationOutput[Item]:
+        count_props = {} if result.count_mode == COUNT_EXACT else {
+            'has_more': result.has_more,
+            'count_mode': result.count_mode,
+            'total_capped': result.total_capped or None,
+        }
         return self.output_child(
             items=items,
             total=result.total,
             current_page=result.current_page,
             per_page=result.per_page,
-            last_page=result.last_page
+            last_page=result.last_page,
+            next_cursor=result.next_cursor,
+            **count_props
         )
+
+
+@dataclass(frozen=True, slots=True)
+class BatchItemOutput(Generic[Item]):
+    index: int
+    data: Optional[Item] = None
+    errors: Optional[Dict[str, List[str]]] = None
+    not_found: bool = False
+
+    @property
+    def succeeded(self) -> bool:
+        return self.errors is None
+
+
+@dataclass(frozen=True, slots=True)
+class BatchOutput(Generic[Item]):
+    items: List[BatchItemOutput[Item]]
+
+
+@dataclass(frozen=True, slots=True)
+class VersionOutput:
+    tag: str
+    updated_at: Optional[datetime.datetime]
+
+    @staticmethod
+    def from_parts(updated_at: Optional[datetime.datetime], *parts: int) -> 'VersionOutput':
+        timestamp = f'{updated_at.timestamp():.6f}' if updated_at else '0'
+        return VersionOutput('-'.join([*map(str, parts), timestamp]), updated_at)
+
+    # version of a representation that has no single updated_at, taken from
+    # the content served so the tag always matches the body it comes with
+    @staticmethod
+    def from_content(content: bytes) -> 'VersionOutput':
+        return VersionOutput(hashlib.blake2b(content, digest_size=16).hexdigest(), None)
@@ -0,0 +1,98 @@
+import datetime
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+from core.__seedwork.domain.events import DomainEvent
+from core.__seedwork.domain.repositories import InMemoryRepository
+
+
+@dataclass(frozen=True, slots=True)
+class EventMessage:
+    event_id: str
+    event_name: str
+    aggregate_id: str
+    occurred_on: datetime.datetime
+    payload: Dict[str, Any]
+
+    @staticmethod
+    def from_event(event: DomainEvent) -> 'EventMessage':
+        return EventMessage(
+            event_id=event.event_id,
+            event_name=event.event_name,
+            aggregate_id=event.aggregate_id,
+            occurred_on=event.occurred_on,
+            payload=event.to_payload()
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'event_id': self.event_id,
+            'event_name': self.event_name,
+            'aggregate_id': self.aggregate_id,
+            'occurred_on': self.occurred_on.isoformat(),
+            'payload': self.payload
+        }
+
+
+class EventPublisher(ABC):
+
+    # publishes the whole batch or raises; a relay retries the batch that
+    # raised, so consumers must tolerate messages they already got
+    @abstractmethod
+    def publish(self, messages: List[EventMessage]) -> None:
+        raise NotImplementedError()
+
+
+class InMemoryEventPublisher(EventPublisher):
+
+    def __init__(self) -> None:
+        self.messages: List[EventMessage] = []
+
+    def publish(self, messages: List[EventMessage]) -> None:
+        self.messages.extend(messages)
+
+
+class InMemoryEventRelay:
+    """
+    OutboxRelay for the in-memory repositories: drains the events they
+    stored into a publisher, which keeps their lists from growing forever.
+    """
+
+    def __init__(self, repositories: List[InMemoryRepository], publisher: EventPublisher) -> None:
+        self.repositories = repositories
+        self.publisher = publisher
+
+    # relays every event stored so far and returns how many it sent; the
+    # events are only drained once the publisher took them
+    def drain(self) -> int:
+        relayed = 0
+        for repository in self.repositories:
+            events = list(repository.events)
+            if events:
+                self.publisher.publish([EventMessage.from_event(event) for event in events])
+                repository.drain_events(len(events))
+            relayed += len(events)
+        return relayed
+
+
+class FileEventPublisher(EventPublisher):
+    """
+    Appends every message to path as a JSON line. Stands in for a broker in
+    development: `tail -f` the file to watch the events go by.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def publish(self, messages: List[EventMessage]) -> None:
+        lines = ''.join(
+            json.dumps(message.to_dict(), ensure_ascii=False, default=str) + '\n' for message in messages)
+        with self._lock, open(self.path, 'a', encoding='utf-8') as file:
+            file.write(lines)
+            file.flush()
+            os.fsync(file.fileno())
@@ -0,0 +1,202 @@
+import copy
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Tuple
+
+from core.__seedwork.domain.entities import Entity
+from core.__seedwork.domain.exceptions import NotFoundException
+from core.__seedwork.domain.repositories import InMemoryRepository, RepositoryInterface
+from core.__seedwork.domain.value_objects import UniqueEntityId
+
+
+class _Changes:
+    # the writes a unit holds for one repository, keyed by entity id
+    # pylint: disable=too-few-public-methods
+    __slots__ = ('new', 'dirty', 'removed')
+
+    def __init__(self) -> None:
+        self.new: Dict[str, Entity] = {}
+        self.dirty: Dict[str, Entity] = {}
+        self.removed: Dict[str, None] = {}
+
+
+class _UnitState(threading.local):
+    # a unit of work is shared like the repositories are, so what it holds
+    # belongs to the thread that opened it
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.depth = 0
+        self.pending = 0
+        self.changes: Dict[int, Tuple[RepositoryInterface, _Changes]] = {}
+        self.context: Any = None
+
+
+class UnitOfWork(ABC):
+    """
+    Groups the writes of any number of use cases in one transaction.
+    Inside `with unit_of_work:` inserts, updates and deletes are kept in
+    memory and flushed as bulk operations, one per repository and kind of
+    write, when the outermost block exits (or every flush_size writes, or on
+    flush()); an exception rolls all of them back. Nested blocks join the
+    one already open.
+
+    find_by_id() answers from the pending writes first, so a use case sees
+    the entities an earlier one created or changed in the same unit. Other
+    queries only see them once they are flushed. Outside a block every
+    method goes straight to the repository.
+    """
+
+    def __init__(self, flush_size: int = 1000) -> None:
+        self.flush_size = flush_size
+        self._state = _UnitState()
+
+    @property
+    def active(self) -> bool:
+        return self._state.depth > 0
+
+    def __enter__(self) -> 'UnitOfWork':
+        state = self._state
+        if not state.depth:
+            self._begin()
+        state.depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        state = self._state
+        state.depth -= 1
+        if state.depth:
+            return False
+
+        if exc_type is None:
+            try:
+                self.flush()
+            except BaseException as exception:
+                self._end(type(exception), exception, exception.__traceback__)
+                raise
+        else:
+            self._discard()
+        self._end(exc_type, exc_value, traceback)
+        return False
+
+    def insert(self, repository: RepositoryInterface, entity: Entity) -> None:
+        if not self.active:
+            repository.insert(entity)
+            return
+        self._changes(repository).new[entity.id] = entity
+        self._registered()
+
+    def update(self, repository: RepositoryInterface, entity: Entity) -> None:
+        if not self.active:
+            repository.update(entity)
+            return
+        changes = self._changes(repository)
+        if entity.id in changes.new:
+            changes.new[entity.id] = entity
+        else:
+            changes.dirty[entity.id] = entity
+        self._registered()
+
+    def delete(self, repository: RepositoryInterface, entity_id: str | UniqueEntityId) -> None:
+        if not self.active:
+            repository.delete(entity_id)
+            return
+        changes = self._changes(repository)
+        id_str = str(entity_id)
+        # an entity created in this unit never reaches the database
+        if changes.new.pop(id_str, None) is None:
+            changes.dirty.pop(id_str, None)
+            changes.removed[id_str] = None
+        self._registered()
+
+    def find_by_id(self, repository: RepositoryInterface, entity_id: str | UniqueEntityId) -> Entity:
+        state = self._state
+        if not state.depth:
+            return repository.find_by_id(entity_id)
+        if id(repository) in state.changes:
+            changes = state.changes[id(repository)][1]
+            id_str = str(entity_id)
+            entity = changes.new.get(id_str) or changes.dirty.get(id_str)
+            if entity is not None:
+                return entity
+            if id_str in changes.removed:
+                raise NotFoundException(f"Entity not found using ID '{id_str}'")
+        self._enlist(repository)
+        return self._loaded(repository.find_by_id(entity_id))
+
+    def flush(self) -> None:
+        state = self._state
+        changes, state.changes, state.pending = state.changes, {}, 0
+        # deletes go first so an id removed and created again ends up created
+        for repository, pending in changes.values():
+            if pending.removed:
+                repository.bulk_delete(list(pending.removed))
+            if pending.new:
+                repository.bulk_insert(list(pending.new.values()))
+            if pending.dirty:
+                repository.bulk_update(list(pending.dirty.values()))
+
+    def _changes(self, repository: RepositoryInterface) -> _Changes:
+        changes = self._state.changes
+        key = id(repository)
+        if key not in changes:
+            self._enlist(repository)
+            changes[key] = (repository, _Changes())
+        return changes[key][1]
+
+    def _registered(self) -> None:
+        state = self._state
+        state.pending += 1
+        if state.pending >= self.flush_size:
+            self.flush()
+
+    def _discard(self) -> None:
+        state = self._state
+        state.changes, state.pending = {}, 0
+
+    # called once a unit first reads from or writes to a repository
+    def _enlist(self, repository: RepositoryInterface) -> None:
+        pass
+
+    # what find_by_id hands out for an entity read from the repository
+    def _loaded(self, entity: Entity) -> Entity:
+        return entity
+
+    @abstractmethod
+    def _begin(self) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def _end(self, exc_type, exc_value, traceback) -> None:
+        raise NotImplementedError()
+
+
+class InMemoryUnitOfWork(UnitOfWork):
+    """
+    Unit of work for the in-memory repositories: each one is copied, items
+    and events, when the unit first reads from or writes to it and restored
+    on rollback. The repositories hand out the entities they store, so
+    find_by_id() gives a copy; a use case that changes it in place leaves
+    the stored entity alone until the unit flushes the update.
+    """
+
+    def _begin(self) -> None:
+        self._state.context = {}
+
+    def _enlist(self, repository: RepositoryInterface) -> None:
+        snapshots = self._state.context
+        if id(repository) not in snapshots and isinstance(repository, InMemoryRepository):
+            snapshots[id(repository)] = (repository, repository.items, repository.events_stored)
+
+    def _loaded(self, entity: Entity) -> Entity:
+        loaded = copy.copy(entity)
+        # pylint: disable=protected-access
+        return loaded._set('_events', list(entity._events) if entity._events is not None else None)
+
+    def _end(self, exc_type, exc_value, traceback) -> None:
+        snapshots, self._state.context = self._state.context, None
+        if exc_type is not None:
+            for repository, items, events in snapshots.values():
+                repository.items = items
+                repository.discard_events(events)
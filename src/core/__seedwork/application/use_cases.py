@@ -10,3 +10,10 @@ class UseCase(Generic[Input, Output], ABC):
     @abstractmethod
     def execute(self, input_param: Input) -> Output:
         raise NotImplementedError()
+
+
+class AsyncUseCase(Generic[Input, Output], ABC):
+
+    @abstractmethod
+    async def execute(self, input_param: Input) -> Output:
+        raise NotImplementedError()
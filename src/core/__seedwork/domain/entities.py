@@ -1,30 +1,145 @@
 from abc import ABC
-from dataclasses import dataclass, field, asdict, Field
-from typing import Any
+import copy
+from dataclasses import MISSING, dataclass, field, fields, asdict, is_dataclass, Field
+import datetime
+import decimal
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import uuid
 
+from core.__seedwork.domain.events import DomainEvent
 from core.__seedwork.domain.value_objects import UniqueEntityId
 
 
+# values of these types are immutable, so to_dict hands them out as they are
+# instead of deep-copying them like dataclasses.asdict does
+ATOMIC_TYPES = frozenset({
+    type(None), bool, int, float, complex, str, bytes,
+    datetime.datetime, datetime.date, datetime.time, datetime.timedelta,
+    decimal.Decimal, uuid.UUID
+})
+
+
+def copy_value(value: Any) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, tuple) and hasattr(value, '_fields'):
+        return type(value)(*[copy_value(item) for item in value])
+    if isinstance(value, (list, tuple)):
+        return type(value)(copy_value(item) for item in value)
+    if isinstance(value, dict):
+        return type(value)(
+            (copy_value(key), copy_value(item)) for key, item in value.items())
+    return copy.deepcopy(value)
+
+
+def compile_to_dict(entity_class: type) -> Callable[[Any], Dict[str, Any]]:
+    names = [
+        entity_field.name for entity_field in fields(entity_class)
+        if entity_field.name not in ('unique_entity_id', '_events')
+    ]
+    lines = ['def to_dict(self):']
+    items = []
+    for index, name in enumerate(names):
+        lines.append(f'    value_{index} = self.{name}')
+        items.append(
+            f"'{name}': value_{index} if value_{index}.__class__ in atomic_types "
+            f"else copy_value(value_{index})")
+    items.append("'id': self.id")
+    lines.append('    return {' + ', '.join(items) + '}')
+    namespace = {'atomic_types': ATOMIC_TYPES, 'copy_value': copy_value}
+    exec('\n'.join(lines), namespace)  # pylint: disable=exec-used
+    return namespace['to_dict']
+
+
+def compile_from_dict(entity_class: type) -> Callable[[type, Dict[str, Any]], Any]:
+    lines = [
+        'def from_dict(cls, data):',
+        '    props = {}',
+        "    if 'id' in data:",
+        "        props['unique_entity_id'] = unique_entity_id(data['id'])",
+    ]
+    for entity_field in fields(entity_class):
+        if not entity_field.init or entity_field.name == 'unique_entity_id':
+            continue
+        lines.append(f"    if '{entity_field.name}' in data:")
+        lines.append(
+            f"        props['{entity_field.name}'] = data['{entity_field.name}']")
+    lines.append('    return cls(**props)')
+    namespace = {'unique_entity_id': UniqueEntityId}
+    exec('\n'.join(lines), namespace)  # pylint: disable=exec-used
+    return namespace['from_dict']
+
+
 @dataclass(frozen=True, slots=True)
 class Entity(ABC):
 
     unique_entity_id: UniqueEntityId = field(default_factory=UniqueEntityId)
+    # recorded by the entity and taken by the repository that stores it;
+    # None until the first event so hydrated entities carry no list; a
+    # factory because slots leave no class attribute to hold a plain default
+    _events: Optional[List[DomainEvent]] = field(
+        default_factory=lambda: None, init=False, repr=False, compare=False)
 
     @property
     def id(self):
-        return str(self.unique_entity_id)
+        return self.unique_entity_id.id
+
+    @property
+    def events(self) -> Tuple[DomainEvent, ...]:
+        return tuple(self._events or ())
+
+    def record_event(self, event: DomainEvent) -> None:
+        if self._events is None:
+            self._set('_events', [])
+        self._events.append(event)
+
+    def pull_events(self) -> List[DomainEvent]:
+        events = self._events or []
+        self._set('_events', None)
+        return events
 
     def _set(self, name: str, value: Any):
         object.__setattr__(self, name, value)
         return self
 
     def to_dict(self):
-        entity_dict = asdict(self)
-        entity_dict.pop('unique_entity_id')
-        entity_dict['id'] = self.id
-        return entity_dict
+        return self.__class__.get_compiled('_to_dict', compile_to_dict)(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        return cls.get_compiled('_from_dict', compile_from_dict)(cls, data)
+
+    # the serialization functions are generated from the dataclass fields on
+    # first use and cached on each concrete class
+    @classmethod
+    def get_compiled(cls, name: str, compiler: Callable[[type], Callable]) -> Callable:
+        compiled = cls.__dict__.get(name)
+        if compiled is None:
+            compiled = compiler(cls)
+            setattr(cls, name, compiled)
+        return compiled
 
     @classmethod
     def get_field(cls, entity_field: str) -> Field:
         # pylint: disable = E1101
         return cls.__dataclass_fields__[entity_field]
+
+    # builds the entity from already validated state (e.g. a row read back
+    # from our own storage) without running __init__/__post_init__
+    @classmethod
+    def hydrate(cls, **props: Any):
+        entity = object.__new__(cls)
+        # pylint: disable = E1101
+        for entity_field in fields(cls):
+            name = entity_field.name
+            if name in props:
+                value = props[name]
+            elif entity_field.default is not MISSING:
+                value = entity_field.default
+            elif entity_field.default_factory is not MISSING:
+                value = entity_field.default_factory()
+            else:
+                raise TypeError(f"{cls.__name__}.hydrate() missing argument: '{name}'")
+            object.__setattr__(entity, name, value)
+        return entity
+
@@ -0,0 +1,33 @@
+import datetime
+import uuid
+from abc import ABC
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DomainEvent(ABC):
+    """
+    Something that happened to an aggregate. Subclasses add the data
+    consumers need as fields, which make up the payload; the event name is
+    the class name.
+    """
+
+    aggregate_id: str
+    event_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    occurred_on: datetime.datetime = field(
+        default_factory=lambda: datetime.datetime.now(datetime.timezone.utc))
+
+    @property
+    def event_name(self) -> str:
+        return self.__class__.__name__
+
+    def to_payload(self) -> Dict[str, Any]:
+        return {
+            event_field.name: getattr(self, event_field.name)
+            for event_field in fields(self)
+            if event_field.name not in DOMAIN_EVENT_FIELDS
+        }
+
+
+DOMAIN_EVENT_FIELDS = frozenset(event_field.name for event_field in fields(DomainEvent))
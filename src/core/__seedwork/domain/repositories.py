@@ -1,10 +1,18 @@
+import base64
+import datetime
+import json
 import math
+from bisect import bisect_left, bisect_right, insort
+import heapq
+from itertools import islice
+from operator import attrgetter, itemgetter
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Generic, List, TypeVar, Any, Optional
+from typing import Callable, Dict, Generic, Iterable, Iterator, List, Tuple, TypeVar, Any, Optional
 
 from core.__seedwork.domain.entities import Entity
-from core.__seedwork.domain.exceptions import NotFoundException
+from core.__seedwork.domain.events import DomainEvent
+from core.__seedwork.domain.exceptions import InvalidUuidException, NotFoundException
 from core.__seedwork.domain.value_objects import UniqueEntityId
 
 ET = TypeVar('ET', bound=Entity)
@@ -25,6 +33,10 @@ class RepositoryInterface(Generic[ET], ABC):
     def find_by_id(self, entity_id: str | UniqueEntityId) -> ET:
         raise NotImplementedError()
 
+    @abstractmethod
+    def find_by_ids(self, entity_ids: Iterable[str | UniqueEntityId]) -> List[ET]:
+        raise NotImplementedError()
+
     @abstractmethod
     def find_all(self) -> List[ET]:
         raise NotImplementedError()
@@ -37,6 +49,24 @@ class RepositoryInterface(Generic[ET], ABC):
     def delete(self, entity_id: str | UniqueEntityId) -> None:
         raise NotImplementedError()
 
+    @abstractmethod
+    def bulk_update(self, entities: Iterable[ET]) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def bulk_upsert(self, entities: Iterable[ET]) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def bulk_delete(self, entity_ids: Iterable[str | UniqueEntityId]) -> None:
+        raise NotImplementedError()
+
+
+def iter_batches(values: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    iterator = iter(values)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
 
 Input = TypeVar('Input')
 Output = TypeVar('Output')
@@ -50,8 +80,45 @@ class SearchableRepositoryInterface(Generic[ET, Input, Output], RepositoryInterf
         raise NotImplementedError()
 
 
+# coroutine counterparts of the interfaces above for ASGI deployments,
+# covering the operations the async use cases need
+class AsyncRepositoryInterface(Generic[ET], ABC):
+
+    @abstractmethod
+    async def insert(self, entity: ET) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def find_by_id(self, entity_id: str | UniqueEntityId) -> ET:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def find_all(self) -> List[ET]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def update(self, entity: ET) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def delete(self, entity_id: str | UniqueEntityId) -> None:
+        raise NotImplementedError()
+
+
+class AsyncSearchableRepositoryInterface(Generic[ET, Input, Output], AsyncRepositoryInterface[ET], ABC):
+    sortable_fields: List[str] = []
+
+    @abstractmethod
+    async def search(self, input_params: Input) -> Output:
+        raise NotImplementedError()
+
+
 Filter = TypeVar('Filter', str, Any)
 
+COUNT_EXACT = 'exact'
+COUNT_ESTIMATED = 'estimated'
+COUNT_NONE = 'none'
+
 
 @dataclass(slots=True, kw_only=True)
 class SearchParams(Generic[Filter]):
@@ -60,6 +127,8 @@ class SearchParams(Generic[Filter]):
     sort: Optional[str] = None
     sort_dir: Optional[str] = None
     filter: Optional[Filter] = None
+    cursor: Optional[str] = None
+    count_mode: Optional[str] = COUNT_EXACT
 
     def __post_init__(self):
         self._normalize_page()
@@ -67,6 +136,8 @@ class SearchParams(Generic[Filter]):
         self._normalize_sort()
         self._normalize_sort_dir()
         self._normalize_filter()
+        self._normalize_cursor()
+        self._normalize_count_mode()
 
     def _normalize_page(self):
         page = self._convert_to_int(self.page)
@@ -96,6 +167,20 @@ class SearchParams(Generic[Filter]):
         self.filter = None if self.filter == "" or self.filter is None else str(
             self.filter)
 
+    def _normalize_cursor(self):
+        self.cursor = None if self.cursor == "" or self.cursor is None else str(
+            self.cursor)
+
+    def _normalize_count_mode(self):
+        count_mode = None if self.count_mode is None else str(
+            self.count_mode).lower()
+        if count_mode == 'has_more':
+            count_mode = COUNT_NONE
+
+        self.count_mode = count_mode \
+            if count_mode in [COUNT_EXACT, COUNT_ESTIMATED, COUNT_NONE] \
+            else self._get_dataclass_field('count_mode').default
+
     def _convert_to_int(self, value: Any, default=0) -> int:
         try:
             return int(value)
@@ -110,18 +195,29 @@ class SearchParams(Generic[Filter]):
 @dataclass(slots=True, kw_only=True, frozen=True)
 class SearchResult(Generic[ET, Filter]):
     items: List[ET]
-    total: int
+    total: Optional[int]
     current_page: int
-    last_page: int = field(init=False)
+    last_page: Optional[int] = field(init=False)
     per_page: int
     sort: Optional[str] = None
     sort_dir: Optional[str] = None
     filter: Optional[Filter] = None
+    next_cursor: Optional[str] = None
+    count_mode: str = COUNT_EXACT
+    has_more: Optional[bool] = None
+    # an estimated total that stopped counting at a limit, so there are at
+    # least total items and the last page is unknown
+    total_capped: bool = False
 
     def __post_init__(self):
         object.__setattr__(self, 'last_page', self._calculate_last_page())
+        if self.has_more is None and self.last_page is not None:
+            object.__setattr__(
+                self, 'has_more', self.current_page < self.last_page)
 
     def _calculate_last_page(self):
+        if self.total is None or self.total_capped:
+            return None
         return math.ceil(self.total / self.per_page)
 
     def to_dict(self):
@@ -134,44 +230,273 @@ class SearchResult(Generic[ET, Filter]):
             'sort': self.sort,
             'sort_dir': self.sort_dir,
             'filter': self.filter,
+            'next_cursor': self.next_cursor,
+            'count_mode': self.count_mode,
+            'has_more': self.has_more,
+            'total_capped': self.total_capped,
         }
 
 
+CURSOR_START = '*'
+
+
+@dataclass(frozen=True, slots=True)
+class SearchCursor:
+    sort: Optional[str]
+    sort_dir: Optional[str]
+    key: Any
+    id: str
+
+    def encode(self) -> str:
+        key = {'datetime': self.key.isoformat()} \
+            if isinstance(self.key, datetime.datetime) else self.key
+        payload = json.dumps(
+            [self.sort, self.sort_dir, key, self.id], separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    @staticmethod
+    def decode(cursor: Optional[str]) -> Optional['SearchCursor']:
+        if cursor is None or cursor == CURSOR_START:
+            return None
+        try:
+            payload = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            sort, sort_dir, key, entity_id = json.loads(payload)
+            if isinstance(key, dict):
+                key = datetime.datetime.fromisoformat(key['datetime'])
+            return SearchCursor(sort, sort_dir, key, str(UniqueEntityId(entity_id)))
+        except (ValueError, TypeError, KeyError, InvalidUuidException):
+            return None
+
+    def matches(self, sort: Optional[str], sort_dir: Optional[str]) -> bool:
+        return self.sort == sort and self.sort_dir == sort_dir
+
+
 @dataclass(slots=True)
 class InMemoryRepository(RepositoryInterface[ET], ABC):
-    items: List[ET] = field(default_factory=lambda: [])
+    _entities: Dict[int, ET] = field(default_factory=dict, init=False)
+    _index: Dict[str, int] = field(default_factory=dict, init=False)
+    _next_slot: int = field(default=0, init=False)
+    _items_cache: Optional[List[ET]] = field(default=None, init=False)
+    # stands in for the outbox of the database repositories: the events of
+    # the entities written, in the order they were stored, until drained
+    events: List[DomainEvent] = field(default_factory=list, init=False)
+    _drained_events: int = field(default=0, init=False)
+
+    # a copy: the list kept in _items_cache backs the searches, and changing
+    # it in place would leave the indexes out of step with it
+    @property
+    def items(self) -> List[ET]:
+        return list(self._stored_items())
+
+    @items.setter
+    def items(self, entities: List[ET]) -> None:
+        self._reindex(entities)
 
     def insert(self, entity: ET) -> None:
-        self.items.append(entity)
-        
+        self._add(entity)
+        self._items_cache = None
+        self._store_events([entity])
+
     def bulk_insert(self, entities: List[ET]) -> None:
-        self.items = entities + self.items
+        self._reindex(entities + self._stored_items())
+        self._store_events(entities)
 
     def find_by_id(self, entity_id: str | UniqueEntityId) -> ET:
         id_str = str(entity_id)
         return self._get(id_str)
 
+    # the entities found, in the order of their first id; unknown ids are skipped
+    def find_by_ids(self, entity_ids: Iterable[str | UniqueEntityId]) -> List[ET]:
+        slots = dict.fromkeys(
+            slot for slot in map(self._index.get, map(str, entity_ids)) if slot is not None)
+        return [self._entities[slot] for slot in slots]
+
     def find_all(self) -> List[ET]:
         return self.items
 
     def update(self, entity: ET) -> None:
-        entity_found = self._get(entity.id)
-        index = self.items.index(entity_found)
-        self.items[index] = entity
+        slot = self._get_slot(entity.id)
+        self._entities[slot] = entity
+        self._items_cache = None
+        self._on_replaced(slot, entity)
+        self._store_events([entity])
 
     def delete(self, entity_id: str | UniqueEntityId) -> None:
-        id_str = str(entity_id)
-        entity_found = self._get(id_str)
-        self.items.remove(entity_found)
-
-    def _get(self, entity_id: str):
-        id_str = str(entity_id)
-        entity = next(filter(lambda x: x.id == id_str, self.items), None)
-        if not entity:
+        slot = self._get_slot(str(entity_id))
+        entity_found = self._entities.pop(slot)
+        del self._index[str(entity_id)]
+        self._items_cache = None
+        self._on_removed(slot, entity_found)
+
+    # the bulk operations check every id before changing anything, so a
+    # missing entity leaves the repository untouched
+    def bulk_update(self, entities: Iterable[ET]) -> None:
+        entities = list(entities)
+        slots = [self._get_slot(entity.id) for entity in entities]
+        for slot, entity in zip(slots, entities):
+            self._entities[slot] = entity
+            self._on_replaced(slot, entity)
+        self._items_cache = None
+        self._store_events(entities)
+
+    def bulk_upsert(self, entities: Iterable[ET]) -> None:
+        entities = list(entities)
+        for entity in entities:
+            slot = self._index.get(entity.id)
+            if slot is None:
+                self._add(entity)
+            else:
+                self._entities[slot] = entity
+                self._on_replaced(slot, entity)
+        self._items_cache = None
+        self._store_events(entities)
+
+    def bulk_delete(self, entity_ids: Iterable[str | UniqueEntityId]) -> None:
+        entity_ids = list(dict.fromkeys(str(entity_id) for entity_id in entity_ids))
+        slots = [self._get_slot(entity_id) for entity_id in entity_ids]
+        for slot, entity_id in zip(slots, entity_ids):
+            entity_found = self._entities.pop(slot)
+            del self._index[entity_id]
+            self._on_removed(slot, entity_found)
+        self._items_cache = None
+
+    # hands over the first count events stored, all by default, and forgets
+    # them, as the outbox relay deletes the rows it published, so the list
+    # does not grow forever
+    def drain_events(self, count: Optional[int] = None) -> List[DomainEvent]:
+        count = len(self.events) if count is None else count
+        events = self.events[:count]
+        del self.events[:count]
+        self._drained_events += len(events)
+        return events
+
+    # how many events were ever stored, drained or not
+    @property
+    def events_stored(self) -> int:
+        return self._drained_events + len(self.events)
+
+    # drops the events stored since events_stored was at position; the ones
+    # drained in between were already handed over
+    def discard_events(self, position: int) -> None:
+        del self.events[max(position - self._drained_events, 0):]
+
+    def _store_events(self, entities: Iterable[ET]) -> None:
+        for entity in entities:
+            self.events.extend(entity.pull_events())
+
+    def _stored_items(self) -> List[ET]:
+        if self._items_cache is None:
+            self._items_cache = list(self._entities.values())
+        return self._items_cache
+
+    def _get(self, entity_id: str) -> ET:
+        return self._entities[self._get_slot(entity_id)]
+
+    def _get_slot(self, entity_id: str) -> int:
+        slot = self._index.get(str(entity_id))
+        if slot is None:
             raise NotFoundException(f"Entity not found using ID '{entity_id}'")
-        return entity
+        return slot
+
+    def _add(self, entity: ET) -> None:
+        slot = self._next_slot
+        self._next_slot += 1
+        self._entities[slot] = entity
+        self._index.setdefault(entity.id, slot)
+        self._on_added(slot, entity)
+
+    def _reindex(self, entities: List[ET]) -> None:
+        self._entities = dict(enumerate(entities))
+        self._index = {}
+        for slot, entity in self._entities.items():
+            self._index.setdefault(entity.id, slot)
+        self._next_slot = len(self._entities)
+        self._items_cache = list(entities)
+        self._on_reindexed()
+
+    def _on_added(self, slot: int, entity: ET) -> None:
+        pass
+
+    def _on_replaced(self, slot: int, entity: ET) -> None:
+        pass
+
+    def _on_removed(self, slot: int, entity: ET) -> None:
+        pass
+
+    def _on_reindexed(self) -> None:
+        pass
+
+
+@dataclass(slots=True)
+class SortIndex:
+    entries: List[Tuple[Any, int]] = field(default_factory=list)
+    keys: Dict[int, Any] = field(default_factory=dict)
+
+    @staticmethod
+    def build(keys: Dict[int, Any]) -> 'SortIndex':
+        entries = sorted((key, slot) for slot, key in keys.items())
+        return SortIndex(entries, keys)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, slot: int, key: Any) -> None:
+        insort(self.entries, (key, slot))
+        self.keys[slot] = key
+
+    def remove(self, slot: int) -> None:
+        entry = (self.keys.pop(slot), slot)
+        del self.entries[bisect_left(self.entries, entry)]
+
+    def replace(self, slot: int, key: Any) -> None:
+        old_key = self.keys[slot]
+        if old_key is key or old_key == key:
+            return
+        self.remove(slot)
+        self.add(slot, key)
+
+    def slice_asc(self, start: int, stop: int) -> List[int]:
+        return [slot for _, slot in self.entries[start:stop]]
+
+    def iter_groups(self, from_key: Any = None, desc: bool = False, seek: bool = False) -> Iterator[Tuple[Any, List[int]]]:
+        entries = self.entries
+        get_key = itemgetter(0)
+        if desc:
+            position = bisect_right(entries, from_key, key=get_key) \
+                if seek else len(entries)
+            while position > 0:
+                key = entries[position - 1][0]
+                group_start = bisect_left(entries, key, key=get_key)
+                yield key, [slot for _, slot in entries[group_start:position]]
+                position = group_start
+        else:
+            position = bisect_left(entries, from_key, key=get_key) \
+                if seek else 0
+            while position < len(entries):
+                key = entries[position][0]
+                group_stop = bisect_right(entries, key, key=get_key)
+                yield key, [slot for _, slot in entries[position:group_stop]]
+                position = group_stop
+
+    # sorted(reverse=True) keeps ties in insertion order, so a descending page
+    # walks the ascending entries backwards one group of equal keys at a time
+    def slice_desc(self, start: int, stop: int) -> List[int]:
+        entries = self.entries
+        total = len(entries)
+        slots = []
+        position = start
+        while position < stop:
+            key = entries[total - 1 - position][0]
+            group_start = bisect_left(entries, key, key=itemgetter(0))
+            group_stop = bisect_right(entries, key, key=itemgetter(0))
+            offset = group_start + position - (total - group_stop)
+            count = min(group_stop - offset, stop - position)
+            slots.extend(slot for _, slot in entries[offset:offset + count])
+            position += count
+        return slots
 
 
+@dataclass(slots=True)
 class InMemorySearchableRepository(
     Generic[ET, Filter],
     InMemoryRepository[ET],
@@ -182,28 +507,50 @@ class InMemorySearchableRepository(
     ],
     ABC
 ):
+    _sort_indexes: Dict[str, SortIndex] = field(
+        default_factory=dict, init=False)
+
     def search(self, input_params: SearchParams[Filter]) -> SearchResult[ET, Filter]:
-        items_filtered = self._apply_filter(self.items, input_params.filter)
-        items_sorted = self._apply_sort(
-            items_filtered, input_params.sort, input_params.sort_dir)
-        items_paginated = self._apply_pagination(
-            items_sorted, input_params.page, input_params.per_page)
+        if input_params.cursor is not None:
+            return self._search_by_cursor(input_params)
+
+        if input_params.filter is None:
+            items_paginated = self._search_unfiltered(
+                input_params.sort, input_params.sort_dir,
+                input_params.page, input_params.per_page)
+            total = len(self._entities)
+        else:
+            items_filtered = self._apply_filter(
+                self._get_filter_candidates(input_params.filter), input_params.filter)
+            items_paginated = self._apply_top_k_pagination(
+                items_filtered, input_params.sort, input_params.sort_dir,
+                input_params.page, input_params.per_page)
+            total = len(items_filtered)
 
         return SearchResult(
             items=items_paginated,
-            total=len(items_filtered),
+            total=None if input_params.count_mode == COUNT_NONE else total,
             current_page=input_params.page,
             per_page=input_params.per_page,
             sort=input_params.sort,
             sort_dir=input_params.sort_dir,
             filter=input_params.filter,
+            count_mode=input_params.count_mode,
+            has_more=total > input_params.page * input_params.per_page,
         )
 
     @abstractmethod
     def _apply_filter(self, items: List[ET], filter_param: Filter | None) -> List[ET]:
         raise NotImplementedError()
 
+    def _get_filter_candidates(self, filter_param: Filter) -> List[ET]:  # pylint: disable=unused-argument
+        return self._stored_items()
+
+    def _resolve_sort(self, sort: str | None, sort_dir: str | None) -> Tuple[str | None, str | None]:
+        return sort, sort_dir
+
     def _apply_sort(self, items: List[ET], sort: str | None, sort_dir: str | None) -> List[ET]:
+        sort, sort_dir = self._resolve_sort(sort, sort_dir)
         if sort and sort in self.sortable_fields:
             is_reverse = sort_dir == 'desc'
             return sorted(items, key=lambda item: getattr(item, sort), reverse=is_reverse)
@@ -214,3 +561,137 @@ class InMemorySearchableRepository(
         start = (page - 1) * per_page
         limit = start + per_page
         return items[slice(start, limit)]
+
+    # heapq.nsmallest/nlargest are documented as equivalent to
+    # sorted(...)[:n], ties included, but only order the first n items
+    def _apply_top_k_pagination(
+            self, items: Iterable[ET], sort: str | None, sort_dir: str | None, page: int, per_page: int) -> List[ET]:
+        sort, sort_dir = self._resolve_sort(sort, sort_dir)
+        if not sort or sort not in self.sortable_fields:
+            return list(islice(items, (page - 1) * per_page, page * per_page))
+
+        select = heapq.nlargest if sort_dir == 'desc' else heapq.nsmallest
+        items_top = select(page * per_page, items, key=attrgetter(sort))
+        return items_top[(page - 1) * per_page:]
+
+    def _search_unfiltered(self, sort: str | None, sort_dir: str | None, page: int, per_page: int) -> List[ET]:
+        sort, sort_dir = self._resolve_sort(sort, sort_dir)
+        if not sort or sort not in self.sortable_fields:
+            return self._apply_pagination(self._stored_items(), page, per_page)
+
+        index = self._get_sort_index(sort)
+        start = (page - 1) * per_page
+        stop = min(start + per_page, len(index))
+        if sort_dir == 'desc':
+            slots = index.slice_desc(start, stop)
+        else:
+            slots = index.slice_asc(start, stop)
+        return [self._entities[slot] for slot in slots]
+
+    def _search_by_cursor(self, input_params: SearchParams[Filter]) -> SearchResult[ET, Filter]:
+        sort, sort_dir = self._resolve_sort(
+            input_params.sort, input_params.sort_dir)
+        if not sort or sort not in self.sortable_fields:
+            sort, sort_dir = None, None
+
+        cursor = SearchCursor.decode(input_params.cursor)
+        if cursor is not None and not cursor.matches(sort, sort_dir):
+            cursor = None
+
+        limit = input_params.per_page + 1
+        if input_params.filter is None and sort:
+            items = self._seek_sort_index(sort, sort_dir, cursor, limit)
+            total = len(self._entities)
+        else:
+            items_filtered = self._stored_items() if input_params.filter is None else self._apply_filter(
+                self._get_filter_candidates(input_params.filter), input_params.filter)
+            items = self._seek_items(
+                items_filtered, sort, sort_dir, cursor, limit)
+            total = len(items_filtered)
+
+        next_cursor = None
+        if len(items) == limit:
+            items = items[:-1]
+            last = items[-1]
+            next_cursor = SearchCursor(
+                sort, sort_dir, getattr(last, sort) if sort else None, last.id
+            ).encode()
+
+        return SearchResult(
+            items=items,
+            total=None if input_params.count_mode == COUNT_NONE else total,
+            current_page=input_params.page,
+            per_page=input_params.per_page,
+            sort=input_params.sort,
+            sort_dir=input_params.sort_dir,
+            filter=input_params.filter,
+            next_cursor=next_cursor,
+            count_mode=input_params.count_mode,
+            has_more=next_cursor is not None,
+        )
+
+    def _seek_items(
+            self, items: Iterable[ET], sort: str | None, sort_dir: str | None,
+            cursor: Optional[SearchCursor], limit: int) -> List[ET]:
+        def keyset(item: ET):
+            return getattr(item, sort) if sort else None, item.id
+
+        desc = sort_dir == 'desc'
+        if cursor is not None:
+            after = (cursor.key, cursor.id)
+            items = (
+                item for item in items
+                if (keyset(item) < after if desc else keyset(item) > after)
+            )
+        select = heapq.nlargest if desc else heapq.nsmallest
+        return select(limit, items, key=keyset)
+
+    def _seek_sort_index(self, sort: str, sort_dir: str | None, cursor: Optional[SearchCursor], limit: int) -> List[ET]:
+        desc = sort_dir == 'desc'
+        groups = self._get_sort_index(sort).iter_groups(
+            cursor.key if cursor else None, desc, seek=cursor is not None)
+        items = []
+        for key, slots in groups:
+            group = sorted(
+                (self._entities[slot] for slot in slots),
+                key=attrgetter('id'), reverse=desc)
+            if cursor is not None and key == cursor.key:
+                group = [
+                    item for item in group
+                    if (item.id < cursor.id if desc else item.id > cursor.id)
+                ]
+            items.extend(group[:limit - len(items)])
+            if len(items) == limit:
+                break
+        return items
+
+    def _get_sort_index(self, sort: str) -> SortIndex:
+        index = self._sort_indexes.get(sort)
+        if index is None:
+            index = SortIndex.build({
+                slot: getattr(entity, sort)
+                for slot, entity in self._entities.items()
+            })
+            self._sort_indexes[sort] = index
+        return index
+
+    def _on_added(self, slot: int, entity: ET) -> None:
+        self._update_sort_indexes(lambda sort, index: index.add(
+            slot, getattr(entity, sort)))
+
+    def _on_replaced(self, slot: int, entity: ET) -> None:
+        self._update_sort_indexes(lambda sort, index: index.replace(
+            slot, getattr(entity, sort)))
+
+    def _on_removed(self, slot: int, entity: ET) -> None:
+        self._update_sort_indexes(lambda sort, index: index.remove(slot))
+
+    def _on_reindexed(self) -> None:
+        self._sort_indexes.clear()
+
+    def _update_sort_indexes(self, apply: Callable[[str, SortIndex], None]) -> None:
+        for sort, index in list(self._sort_indexes.items()):
+            try:
+                apply(sort, index)
+            except TypeError:
+                del self._sort_indexes[sort]
@@ -1,9 +1,31 @@
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 import contextlib
-from dataclasses import dataclass
-from typing import Any, Dict, Generic, List, TypeVar
+from dataclasses import dataclass, field
+import datetime
+import re
+from types import MappingProxyType
+from typing import AbstractSet, Any, Callable, Dict, Generic, Iterable, List, Optional, Tuple, Type, TypeVar
 from rest_framework.serializers import Serializer
-from rest_framework.fields import CharField, BooleanField
+from rest_framework.fields import (
+    BooleanField,
+    CharField,
+    DateTimeField,
+    Field,
+    IntegerField,
+    ProhibitNullCharactersValidator,
+    SkipField,
+    empty
+)
+from rest_framework.exceptions import ValidationError as DRFValidationError
+from rest_framework.validators import ProhibitSurrogateCharactersValidator
+from rest_framework.utils import html
+from django.core.validators import (
+    MaxLengthValidator,
+    MaxValueValidator,
+    MinLengthValidator,
+    MinValueValidator
+)
 from django.conf import settings
 from core.__seedwork.domain.exceptions import ValidationException
 
@@ -62,9 +84,11 @@ class DRFValidator(ValidatorFieldsInterface[PropsValidated], ABC):
         serializer = data
         is_valid = serializer.is_valid()
         if not is_valid:
+            # the messages stay DRF ErrorDetails (str subclasses) so the API
+            # can answer them with their codes
             self.errors = {
-                field: [str(_error) for _error in _errors]
-                for field, _errors in serializer.errors.items()
+                field_name: list(_errors)
+                for field_name, _errors in serializer.errors.items()
             }
             return False
 
@@ -72,6 +96,200 @@ class DRFValidator(ValidatorFieldsInterface[PropsValidated], ABC):
         return True
 
 
+FastCheck = Callable[[Any], Any]
+
+NO_FAST_PATH = object()
+SURROGATES_REGEX = re.compile('[\ud800-\udfff]')
+CHAR_FIELD_VALIDATORS = (
+    ProhibitNullCharactersValidator,
+    ProhibitSurrogateCharactersValidator,
+    MaxLengthValidator,
+    MinLengthValidator
+)
+INTEGER_FIELD_VALIDATORS = (MaxValueValidator, MinValueValidator)
+
+
+def compile_fast_check(rule: Field) -> Optional[FastCheck]:
+    """
+    Returns a check that accepts the common valid inputs of a DRF field and
+    answers NO_FAST_PATH for anything else, which goes through
+    run_validation to keep the DRF messages.
+    """
+    if isinstance(rule, CharField):
+        if not all(isinstance(validator, CHAR_FIELD_VALIDATORS) for validator in rule.validators):
+            return None
+        max_length = rule.max_length
+        min_length = rule.min_length or 1
+        trim_whitespace = rule.trim_whitespace
+        allow_null = rule.allow_null
+
+        def check_char(value):
+            if type(value) is str:  # pylint: disable=unidiomatic-typecheck
+                if (
+                    min_length <= len(value)
+                    and (max_length is None or len(value) <= max_length)
+                    and not (trim_whitespace and (value[0].isspace() or value[-1].isspace()))
+                    and '\x00' not in value
+                    and (value.isascii() or SURROGATES_REGEX.search(value) is None)
+                ):
+                    return value
+            elif value is None and allow_null:
+                return None
+            return NO_FAST_PATH
+        return check_char
+
+    if isinstance(rule, IntegerField):
+        if not all(isinstance(validator, INTEGER_FIELD_VALIDATORS) for validator in rule.validators):
+            return None
+        min_value = rule.min_value
+        max_value = rule.max_value
+
+        def check_integer(value):
+            # pylint: disable=unidiomatic-typecheck
+            if type(value) is int \
+                    and (min_value is None or value >= min_value) \
+                    and (max_value is None or value <= max_value):
+                return value
+            return NO_FAST_PATH
+        return check_integer
+
+    if rule.validators:
+        return None
+
+    if isinstance(rule, BooleanField):
+        def check_boolean(value):
+            return value if value is True or value is False else NO_FAST_PATH
+        return check_boolean
+
+    if isinstance(rule, DateTimeField):
+        def check_datetime(value):
+            # pylint: disable=unidiomatic-typecheck
+            return rule.enforce_timezone(value) if type(value) is datetime.datetime else NO_FAST_PATH
+        return check_datetime
+
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledRules:
+    fields: Tuple[Tuple[str, Field, Optional[FastCheck]], ...]
+
+    # binds the serializer fields once so each validation only runs the
+    # field validators; serializers with cross-field hooks are not compiled
+    @staticmethod
+    def compile(rules: Type[Serializer]) -> Optional['CompiledRules']:
+        serializer = rules()
+        if type(serializer).validate is not Serializer.validate or serializer.validators:
+            return None
+
+        compiled_fields = []
+        for field_name, rule in serializer.fields.items():
+            if rule.read_only:
+                continue
+            if hasattr(serializer, f'validate_{field_name}') or len(rule.source_attrs) != 1:
+                return None
+            compiled_fields.append(
+                (rule.source_attrs[0], rule, compile_fast_check(rule)))
+        return CompiledRules(tuple(compiled_fields))
+
+    def run(self, data: Mapping, skip: AbstractSet[str] = frozenset()) -> Tuple[Optional[ErrorsFields], Dict[str, Any]]:
+        errors = {}
+        validated_data = {}
+        html_input = html.is_html_input(data)
+        for source, rule, fast_check in self.fields:
+            if rule.field_name in skip:
+                validated_data[source] = data[rule.field_name]
+                continue
+            if fast_check is None or html_input:
+                value = rule.get_value(data)
+            else:
+                value = data.get(rule.field_name, empty)
+            if fast_check is not None and value is not empty:
+                validated_value = fast_check(value)
+                if validated_value is not NO_FAST_PATH:
+                    validated_data[source] = validated_value
+                    continue
+            try:
+                validated_data[source] = rule.run_validation(value)
+            except DRFValidationError as exception:
+                errors[rule.field_name] = list(exception.detail)
+            except SkipField:
+                pass
+        return errors or None, validated_data
+
+
+_ISSUED = object()
+
+
+@dataclass(frozen=True, slots=True)
+class ValidatedProps:
+    """
+    Token a validator hands out for the props it accepted, so a layer that
+    already validated its input (e.g. the API) does not make the entity
+    validate it again. Validating with a token skips only the props it
+    covers that still hold the validated value; everything else goes
+    through the rules, so a token can save work but never let invalid
+    state in.
+    """
+    rules: Type[Serializer]
+    props: Mapping[str, Any]
+    issuer: object = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.issuer is not _ISSUED:
+            raise TypeError('ValidatedProps are only issued by validators')
+
+    def covered(self, rules: Type[Serializer], data: Mapping) -> AbstractSet[str]:
+        if self.rules is not rules:
+            return frozenset()
+        # same type as well, 1 == True must not count as a validated boolean
+        return frozenset(
+            name for name, value in self.props.items()
+            if name in data and type(data[name]) is type(value) and data[name] == value
+        )
+
+
+class CompiledDRFValidator(DRFValidator[PropsValidated], ABC):
+    rules: Type[Serializer]
+
+    def validate(self, data: Any, validated: Optional[ValidatedProps] = None) -> bool:
+        compiled_rules = self.get_compiled_rules()
+        data = data if data is not None else {}
+        if compiled_rules is None or not isinstance(data, Mapping):
+            return super().validate(self.rules(data=data))
+
+        skip = validated.covered(self.rules, data) if validated is not None else frozenset()
+        errors, validated_data = compiled_rules.run(data, skip)
+        if errors:
+            self.errors = errors
+            return False
+
+        self.validated_data = validated_data
+        return True
+
+    # the token for the data of the last successful validate()
+    def validated_props(self) -> ValidatedProps:
+        return ValidatedProps(self.rules, MappingProxyType(dict(self.validated_data)), _ISSUED)
+
+    def validate_many(self, data: Iterable[Any]) -> Dict[int, ErrorsFields]:
+        errors = {}
+        validated_data = []
+        for index, item in enumerate(data):
+            if self.validate(item):
+                validated_data.append(self.validated_data)
+            else:
+                errors[index] = self.errors
+        self.errors = errors or None
+        self.validated_data = validated_data
+        return errors
+
+    @classmethod
+    def get_compiled_rules(cls) -> Optional[CompiledRules]:
+        if '_compiled_rules' not in cls.__dict__:
+            cls._compiled_rules = CompiledRules.compile(cls.rules)
+        return cls._compiled_rules
+
+
 class StrictCharField(CharField):
     def to_internal_value(self, data):
         if not isinstance(data, str):
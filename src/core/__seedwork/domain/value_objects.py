@@ -1,7 +1,9 @@
 import uuid
 from abc import ABC
 import json
-from dataclasses import dataclass, field, fields
+import re
+from dataclasses import dataclass, fields
+from typing import Union
 from core.__seedwork.domain.exceptions import InvalidUuidException
 
 
@@ -14,20 +16,64 @@ class ValueObject(ABC):
             else json.dumps({field_name: getattr(self, field_name) for field_name in fields_name})
 
 
-@dataclass(frozen=True)
+CANONICAL_UUID_REGEX = re.compile(
+    '[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}')
+
+
+# slots are declared by hand: dataclass(slots=True) recreates the class and
+# breaks the frozen __setattr__ of subclasses of a slotted base
+@dataclass(frozen=True, init=False, repr=False)
 class UniqueEntityId(ValueObject):
-    id: str = field(default_factory=uuid.uuid4)
+    __slots__ = ('value', '_str_value')
+
+    # the 128-bit value is what identifies the id; the canonical string is
+    # rendered on first use and kept in _str_value
+    value: int
+
+    # pylint: disable=redefined-builtin
+    def __init__(self, id: Union[str, uuid.UUID, None] = None):
+        self.__validate(uuid.uuid4() if id is None else id)
 
-    def __post_init__(self):
-        id_value = str(self.id) if isinstance(self.id, uuid.UUID) else self.id
-        object.__setattr__(self, 'id', id_value)
-        self.__validate()
+    def __validate(self, id: Union[str, uuid.UUID]):
+        str_value = None
+        if isinstance(id, uuid.UUID):
+            value = id.int
+        elif isinstance(id, str) and CANONICAL_UUID_REGEX.fullmatch(id):
+            value = int(id.replace('-', ''), 16)
+            str_value = id
+        else:
+            try:
+                value = uuid.UUID(id).int
+            except (ValueError, TypeError, AttributeError) as ex:
+                raise InvalidUuidException() from ex
+        object.__setattr__(self, 'value', value)
+        object.__setattr__(self, '_str_value', str_value)
 
-    def __validate(self):
-        try:
-            uuid.UUID(self.id)
-        except ValueError as ex:
-            raise InvalidUuidException() from ex
+    @property
+    def id(self) -> str:
+        str_value = self._str_value
+        if str_value is None:
+            hex_value = f'{self.value:032x}'
+            str_value = f'{hex_value[:8]}-{hex_value[8:12]}-{hex_value[12:16]}-' \
+                f'{hex_value[16:20]}-{hex_value[20:]}'
+            object.__setattr__(self, '_str_value', str_value)
+        return str_value
+
+    # the inherited state only carries the dataclass fields, so a copy
+    # pulled from a cache would lack _str_value
+    def __getstate__(self):
+        return self.value
+
+    def __setstate__(self, state: int):
+        object.__setattr__(self, 'value', state)
+        object.__setattr__(self, '_str_value', None)
+
+    @property
+    def uuid(self) -> uuid.UUID:
+        return uuid.UUID(int=self.value)
 
     def __str__(self):
-        return f"{self.id}"
+        return self.id
+
+    def __repr__(self):
+        return f"UniqueEntityId(id='{self.id}')"
@@ -0,0 +1,105 @@
+import datetime
+from typing import Iterable, List, Type
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, models, transaction
+
+from core.__seedwork.application.events import EventMessage, EventPublisher
+from core.__seedwork.domain.entities import Entity
+from core.__seedwork.domain.events import DomainEvent
+
+
+class OutboxJSONEncoder(DjangoJSONEncoder):
+    # DjangoJSONEncoder cuts datetimes to milliseconds, the API keeps them whole
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+class OutboxModel(models.Model):
+    """
+    Events waiting to be published. A repository adds the events of the
+    entities it writes in the transaction of the write, so an event exists
+    if and only if its change was committed; OutboxRelay publishes and
+    deletes them, oldest first.
+    """
+
+    position = models.BigAutoField(primary_key=True)
+    event_id = models.UUIDField()
+    event_name = models.CharField(max_length=255)
+    aggregate_id = models.CharField(max_length=255)
+    occurred_on = models.DateTimeField()
+    payload = models.JSONField(encoder=OutboxJSONEncoder)
+
+    class Meta:
+        abstract = True
+
+    # takes the events the entities recorded, all of them in one INSERT
+    @classmethod
+    def store_events(cls, entities: Iterable[Entity]) -> int:
+        return cls.store([event for entity in entities for event in entity.pull_events()])
+
+    # for events no entity can carry, e.g. those of a delete
+    @classmethod
+    def store(cls, events: List[DomainEvent]) -> int:
+        if not events:
+            return 0
+        cls.objects.bulk_create([
+            cls(
+                event_id=event.event_id,
+                event_name=event.event_name,
+                aggregate_id=event.aggregate_id,
+                occurred_on=event.occurred_on,
+                payload=event.to_payload()
+            )
+            for event in events
+        ])
+        return len(events)
+
+    def to_message(self) -> EventMessage:
+        return EventMessage(
+            event_id=str(self.event_id),
+            event_name=self.event_name,
+            aggregate_id=self.aggregate_id,
+            occurred_on=self.occurred_on,
+            payload=self.payload
+        )
+
+
+class OutboxRelay:
+    """
+    Drains an outbox table into a publisher in batches of batch_size. Each
+    batch is read, published and deleted in one transaction, so delivery is
+    at least once: a crash after the publisher accepted a batch publishes it
+    again, and consumers dedupe by event_id. Where the database supports it
+    the rows are locked with SKIP LOCKED, so several relays can share a table.
+    """
+
+    def __init__(self, model: Type[OutboxModel], publisher: EventPublisher, batch_size: int = 500) -> None:
+        self.model = model
+        self.publisher = publisher
+        self.batch_size = batch_size
+
+    def relay_batch(self) -> int:
+        using = self.model.objects.db
+        with transaction.atomic(using=using):
+            query = self.model.objects.order_by('position')
+            if connections[using].features.has_select_for_update_skip_locked:
+                query = query.select_for_update(skip_locked=True)
+            rows: List[OutboxModel] = list(query[:self.batch_size])
+            if not rows:
+                return 0
+            self.publisher.publish([row.to_message() for row in rows])
+            self.model.objects.filter(position__in=[row.position for row in rows]).delete()
+        return len(rows)
+
+    # relays until the outbox is empty and returns how many events it sent
+    def drain(self) -> int:
+        relayed = 0
+        while True:
+            count = self.relay_batch()
+            relayed += count
+            if count < self.batch_size:
+                return relayed
@@ -0,0 +1,58 @@
+import csv
+import json
+from typing import Any, Dict, Iterable, Iterator, Sequence
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+# renderers for exports: render_stream() writes one item at a time so a
+# StreamingHttpResponse can send any number of rows in constant memory,
+# render() covers the regular DRF responses (errors) in the same format
+
+class StreamingRenderer(BaseRenderer):
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        items = data if isinstance(data, list) else [data]
+        fields = list(items[0].keys()) if items and isinstance(items[0], dict) else []
+        return b''.join(self.render_stream(items, fields))
+
+    def render_stream(self, items: Iterable[Dict[str, Any]], fields: Sequence[str]) -> Iterator[bytes]:
+        raise NotImplementedError()
+
+
+class NDJSONRenderer(StreamingRenderer):
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+
+    def render_stream(self, items: Iterable[Dict[str, Any]], fields: Sequence[str]) -> Iterator[bytes]:
+        encoder = JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+        for item in items:
+            yield (encoder.encode(item) + '\n').encode()
+
+
+class _Echo:
+    # pylint: disable=too-few-public-methods
+    def write(self, value: str) -> str:
+        return value
+
+
+class CSVRenderer(StreamingRenderer):
+    media_type = 'text/csv'
+    format = 'csv'
+
+    def render_stream(self, items: Iterable[Dict[str, Any]], fields: Sequence[str]) -> Iterator[bytes]:
+        writer = csv.writer(_Echo())
+        yield writer.writerow(fields).encode()
+        for item in items:
+            yield writer.writerow([self.to_cell(item.get(name)) for name in fields]).encode()
+
+    @staticmethod
+    def to_cell(value: Any) -> Any:
+        if value is None:
+            return ''
+        if isinstance(value, bool):
+            return 'true' if value else 'false'
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, cls=JSONEncoder)
+        return value
@@ -1,15 +1,176 @@
-from rest_framework import serializers
+from collections.abc import Mapping
+from dataclasses import dataclass
+import datetime
+import functools
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.fields import (
+    BooleanField,
+    CharField,
+    DateTimeField,
+    Field,
+    FloatField,
+    IntegerField,
+    UUIDField
+)
+from rest_framework.settings import api_settings
 
 from core.__seedwork.application.dto import PaginationOutput
 
+
+# DRF fields that represent values of these types as they are
+PASS_THROUGH_TYPES = {CharField: str, BooleanField: bool, IntegerField: int, FloatField: float}
+
+
+def pass_through_type(rule: Field) -> Optional[type]:
+    # pylint: disable=unidiomatic-typecheck
+    if type(rule) is UUIDField:
+        return str if rule.uuid_format == 'hex_verbose' else None
+    return PASS_THROUGH_TYPES.get(type(rule))
+
+
+def is_iso_datetime(rule: Field) -> bool:
+    # pylint: disable=unidiomatic-typecheck
+    output_format = getattr(rule, 'format', api_settings.DATETIME_FORMAT)
+    return type(rule) is DateTimeField and isinstance(output_format, str) \
+        and output_format.lower() == ISO_8601
+
+
+def represent_datetime(value: Any, field_timezone: Any, to_representation: Callable[[Any], Any]) -> Any:
+    """
+    The ISO 8601 output of DateTimeField.to_representation for aware
+    datetimes, with the timezone resolved by the caller instead of once per
+    value; anything else goes through the field.
+    """
+    # pylint: disable=unidiomatic-typecheck
+    if type(value) is datetime.datetime and value.tzinfo is not None and field_timezone is not None:
+        try:
+            value = value.astimezone(field_timezone).isoformat()
+        except OverflowError:
+            return to_representation(value)
+        return value[:-6] + 'Z' if value.endswith('+00:00') else value
+    return to_representation(value)
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledRepresentation:
+    represent: Callable[[Any, Any], Dict[str, Any]]
+    uses_timezone: bool
+
+    def __call__(self, instance: Any) -> Dict[str, Any]:
+        return self.represent(instance, self.current_timezone())
+
+    # the active timezone is looked up once for all the instances
+    def many(self, instances: Iterable[Any]) -> List[Dict[str, Any]]:
+        field_timezone = self.current_timezone()
+        represent = self.represent
+        return [represent(instance, field_timezone) for instance in instances]
+
+    # lazy version of many, for streamed responses
+    def each(self, instances: Iterable[Any]) -> Iterator[Dict[str, Any]]:
+        field_timezone = self.current_timezone()
+        represent = self.represent
+        for instance in instances:
+            yield represent(instance, field_timezone)
+
+    def current_timezone(self) -> Any:
+        return timezone.get_current_timezone() if self.uses_timezone and settings.USE_TZ else None
+
+
+@functools.cache
+def compile_representation(
+    serializer_class: Type[serializers.Serializer],
+    omit_none: Tuple[str, ...] = ()
+) -> CompiledRepresentation:
+    """
+    Builds a representation of objects (DTOs) equal to
+    serializer_class(instance).data that reads the attributes directly and
+    only calls the fields' to_representation for values that need it.
+    Fields named in omit_none are left out when they are None. Serializers
+    with nested, method or dotted-source fields are not compiled and go
+    through DRF.
+    """
+    serializer = serializer_class()
+    rules = [rule for rule in serializer.fields.values() if not rule.write_only]
+
+    def represent_with_serializer(instance, _field_timezone=None):
+        data = dict(serializer_class(instance=instance).data)
+        for field_name in omit_none:
+            if data.get(field_name) is None:
+                data.pop(field_name, None)
+        return data
+
+    if any(
+        len(rule.source_attrs) != 1 or isinstance(rule, (serializers.BaseSerializer, serializers.SerializerMethodField))
+        for rule in rules
+    ):
+        return CompiledRepresentation(represent_with_serializer, uses_timezone=False)
+
+    # mappings are read by key, which only the serializer does
+    lines = [
+        'def represent(instance, field_timezone):',
+        '    if isinstance(instance, Mapping):',
+        '        return represent_with_serializer(instance)',
+    ]
+    namespace = {
+        'Mapping': Mapping,
+        'represent_with_serializer': represent_with_serializer,
+        'represent_datetime': represent_datetime
+    }
+    items = []
+    uses_timezone = False
+    for index, rule in enumerate(rules):
+        lines.append(f'    value_{index} = instance.{rule.source_attrs[0]}')
+        namespace[f'convert_{index}'] = rule.to_representation
+        pass_through = pass_through_type(rule)
+        if is_iso_datetime(rule):
+            if hasattr(rule, 'timezone'):
+                namespace[f'timezone_{index}'] = rule.timezone
+            else:
+                namespace[f'timezone_{index}'] = None
+                lines.append(f'    timezone_{index} = field_timezone')
+                uses_timezone = True
+            value = (f'None if value_{index} is None '
+                     f'else represent_datetime(value_{index}, timezone_{index}, convert_{index})')
+        elif pass_through is None:
+            value = f'None if value_{index} is None else convert_{index}(value_{index})'
+        else:
+            namespace[f'type_{index}'] = pass_through
+            value = (f'value_{index} if value_{index}.__class__ is type_{index} or value_{index} is None '
+                     f'else convert_{index}(value_{index})')
+        items.append(f"'{rule.field_name}': {value}")
+    lines.append('    data = {' + ', '.join(items) + '}')
+    for index, rule in enumerate(rules):
+        if rule.field_name in omit_none:
+            lines.append(f"    if value_{index} is None: del data['{rule.field_name}']")
+    lines.append('    return data')
+    exec('\n'.join(lines), namespace)  # pylint: disable=exec-used
+    return CompiledRepresentation(namespace['represent'], uses_timezone)
+
+
 class UUIDSerializer(serializers.Serializer):
     id = serializers.UUIDField()
     
 class PaginationSerializer(serializers.Serializer):
-    total = serializers.IntegerField()
+    total = serializers.IntegerField(allow_null=True)
     current_page = serializers.IntegerField()
-    last_page = serializers.IntegerField()
+    last_page = serializers.IntegerField(allow_null=True)
     per_page = serializers.IntegerField()
+    next_cursor = serializers.CharField(required=False, allow_null=True)
+    has_more = serializers.BooleanField(required=False, allow_null=True)
+    count_mode = serializers.CharField(required=False, allow_null=True)
+    total_capped = serializers.BooleanField(required=False, allow_null=True)
+
+    optional_fields = ['next_cursor', 'has_more', 'count_mode', 'total_capped']
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        for field_name in self.optional_fields:
+            if data.get(field_name) is None:
+                data.pop(field_name, None)
+        return data
     
     
     
@@ -25,11 +186,14 @@ class CollectionSerializer(serializers.ListSerializer):
             raise TypeError('Instance must be a PaginationOutput')
         super().__init__(**kwargs)
     
+    # the items and the meta go through compiled representations, which
+    # answer the same data without walking the serializers for every item
     def to_representation(self, data):
-        data = super().to_representation(data)
+        represent_meta = compile_representation(
+            PaginationSerializer, tuple(PaginationSerializer.optional_fields))
         return {
-            'data': data,
-            'meta': PaginationSerializer(self.pagination).data
+            'data': compile_representation(type(self.child)).many(data),
+            'meta': represent_meta(self.pagination)
         }
     
     @property
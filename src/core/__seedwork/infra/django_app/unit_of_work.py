@@ -0,0 +1,24 @@
+from typing import Optional
+from django.db import transaction
+
+from core.__seedwork.application.unit_of_work import UnitOfWork
+
+
+class DjangoUnitOfWork(UnitOfWork):
+    """
+    Runs each unit in transaction.atomic(using), which becomes a savepoint
+    when the unit opens inside another atomic block.
+    """
+
+    def __init__(self, using: Optional[str] = None, flush_size: int = 1000) -> None:
+        super().__init__(flush_size)
+        self.using = using
+
+    def _begin(self) -> None:
+        atomic = transaction.atomic(using=self.using)
+        atomic.__enter__()  # pylint: disable=unnecessary-dunder-call
+        self._state.context = atomic
+
+    def _end(self, exc_type, exc_value, traceback) -> None:
+        atomic, self._state.context = self._state.context, None
+        atomic.__exit__(exc_type, exc_value, traceback)
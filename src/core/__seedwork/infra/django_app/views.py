@@ -0,0 +1,69 @@
+import asyncio
+from itertools import islice
+from typing import AsyncIterator, Iterable, Iterator, TypeVar
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpRequest
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """
+    APIView whose handlers are coroutines. Django serves it without a thread
+    per request under ASGI; DRF's checks (authentication, permissions,
+    throttling) may touch the database, so they still run through
+    sync_to_async.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        # mirrors APIView.dispatch
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(),
+                                  self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if asyncio.iscoroutine(response):
+                response = await response
+
+        except Exception as exc:  # pylint: disable=broad-except
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+
+T = TypeVar('T')
+
+
+def streaming_content(request: HttpRequest, content: Iterable[T], batch_size: int = 500) -> Iterable[T] | AsyncIterator[T]:
+    """
+    The content for a StreamingHttpResponse. Under ASGI Django consumes a
+    sync iterator with sync_to_async(list), holding all of it in memory, so
+    the iterator is then advanced batch_size items per thread hop instead.
+    """
+    if isinstance(getattr(request, '_request', request), ASGIRequest):
+        return aiter_batches(iter(content), batch_size)
+    return content
+
+
+async def aiter_batches(iterator: Iterator[T], batch_size: int) -> AsyncIterator[T]:
+    # thread sensitive, so a database cursor stays on the thread it was opened in
+    next_batch = sync_to_async(lambda: list(islice(iterator, batch_size)))
+    try:
+        while batch := await next_batch():
+            for item in batch:
+                yield item
+    finally:
+        if hasattr(iterator, 'close'):
+            await sync_to_async(iterator.close)()
@@ -20,6 +20,8 @@ class TestSearchInput(unittest.TestCase):
             'sort': Optional[str],
             'sort_dir': Optional[str],
             'filter': Optional[Filter],
+            'cursor': Optional[str],
+            'count_mode': Optional[str],
         })
 
 
@@ -28,10 +30,14 @@ class TestPaginationOutput(unittest.TestCase):
     def test_fields(self):
         self.assertEqual(PaginationOutput.__annotations__, {
             'items': List[Item],
-            'total': int,
+            'total': Optional[int],
             'current_page': int,
-            'last_page': int,
+            'last_page': Optional[int],
             'per_page': int,
+            'next_cursor': Optional[str],
+            'has_more': Optional[bool],
+            'count_mode': Optional[str],
+            'total_capped': Optional[bool],
         })
 
 
@@ -60,7 +66,8 @@ class TestPaginationOutputMapper(unittest.TestCase):
             per_page=1,
             sort='name',
             sort_dir='asc',
-            filter='filter fake'
+            filter='filter fake',
+            next_cursor='fake cursor'
         )
 
         output = PaginationOutputMapper\
@@ -72,4 +79,53 @@ class TestPaginationOutputMapper(unittest.TestCase):
             current_page=result.current_page,
             last_page=result.last_page,
             per_page=result.per_page,
+            next_cursor=result.next_cursor,
+        ))
+
+    def test_to_output_without_count(self):
+        result = SearchResult(
+            items=['fake'],
+            total=None,
+            current_page=1,
+            per_page=1,
+            count_mode='none',
+            has_more=True
+        )
+
+        output = PaginationOutputMapper\
+            .from_child(PaginationOutputChild)\
+            .to_output(result.items, result=result)
+        self.assertEqual(output, PaginationOutputChild(
+            items=result.items,
+            total=None,
+            current_page=1,
+            last_page=None,
+            per_page=1,
+            has_more=True,
+            count_mode='none',
+        ))
+
+    def test_to_output_with_a_capped_total(self):
+        result = SearchResult(
+            items=['fake'],
+            total=10,
+            current_page=1,
+            per_page=1,
+            count_mode='estimated',
+            has_more=True,
+            total_capped=True
+        )
+
+        output = PaginationOutputMapper\
+            .from_child(PaginationOutputChild)\
+            .to_output(result.items, result=result)
+        self.assertEqual(output, PaginationOutputChild(
+            items=result.items,
+            total=10,
+            current_page=1,
+            last_page=None,
+            per_page=1,
+            has_more=True,
+            count_mode='estimated',
+            total_capped=True,
         ))
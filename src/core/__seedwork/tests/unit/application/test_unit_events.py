@@ -0,0 +1,106 @@
+import datetime
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from dataclasses import dataclass
+
+from core.__seedwork.application.events import (
+    EventMessage,
+    EventPublisher,
+    FileEventPublisher,
+    InMemoryEventPublisher,
+    InMemoryEventRelay
+)
+from core.__seedwork.domain.events import DomainEvent
+from core.__seedwork.tests.unit.domain.test_unit_repositories import StubEntity, StubInMemoryRepository
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class StubEvent(DomainEvent):
+    name: str
+    price: float
+
+
+class TestEventMessageUnit(unittest.TestCase):
+    def test_from_event(self):
+        event = StubEvent(aggregate_id='aggregate', name='test', price=5.0)
+        message = EventMessage.from_event(event)
+        self.assertEqual(message, EventMessage(
+            event_id=event.event_id,
+            event_name='StubEvent',
+            aggregate_id='aggregate',
+            occurred_on=event.occurred_on,
+            payload={'name': 'test', 'price': 5.0}
+        ))
+
+    def test_to_dict(self):
+        occurred_on = datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc)
+        message = EventMessage('event', 'StubEvent', 'aggregate', occurred_on, {'name': 'test'})
+        self.assertEqual(message.to_dict(), {
+            'event_id': 'event',
+            'event_name': 'StubEvent',
+            'aggregate_id': 'aggregate',
+            'occurred_on': '2022-01-01T00:00:00+00:00',
+            'payload': {'name': 'test'}
+        })
+
+
+class TestEventPublisherUnit(unittest.TestCase):
+    def test_throw_error_when_not_implemented(self):
+        with self.assertRaises(TypeError) as assert_error:
+            EventPublisher()  # pylint: disable=abstract-class-instantiated
+        self.assertEqual(
+            assert_error.exception.args[0],
+            "Can't instantiate abstract class EventPublisher with abstract method publish")
+
+    def test_in_memory_publisher(self):
+        publisher = InMemoryEventPublisher()
+        messages = [
+            EventMessage.from_event(StubEvent(aggregate_id='aggregate', name=f'test {index}', price=5.0))
+            for index in range(3)
+        ]
+        publisher.publish(messages[:2])
+        publisher.publish(messages[2:])
+        self.assertEqual(publisher.messages, messages)
+
+    def test_in_memory_relay_drains_the_repositories(self):
+        repositories = [StubInMemoryRepository(), StubInMemoryRepository()]
+        events = []
+        for index, repository in enumerate(repositories * 2):
+            entity = StubEntity(name=f'test {index}', price=5.0)
+            event = StubEvent(aggregate_id=entity.id, name=entity.name, price=entity.price)
+            entity.record_event(event)
+            repository.insert(entity)
+            events.append(event)
+        publisher = InMemoryEventPublisher()
+        relay = InMemoryEventRelay(repositories, publisher)
+
+        with mock.patch.object(publisher, 'publish', side_effect=RuntimeError()):
+            with self.assertRaises(RuntimeError):
+                relay.drain()
+        self.assertEqual(len(repositories[0].events), 2)
+
+        self.assertEqual(relay.drain(), 4)
+        self.assertEqual(publisher.messages, [
+            EventMessage.from_event(event) for event in events[0::2] + events[1::2]])
+        self.assertTrue(all(not repository.events for repository in repositories))
+        self.assertEqual(relay.drain(), 0)
+
+    def test_file_publisher_appends_json_lines(self):
+        messages = [
+            EventMessage.from_event(StubEvent(aggregate_id='aggregate', name=f'café {index}', price=5.0))
+            for index in range(3)
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'events.ndjson')
+            publisher = FileEventPublisher(path)
+            publisher.publish(messages[:2])
+            publisher.publish(messages[2:])
+
+            with open(path, encoding='utf-8') as file:
+                lines = file.read().splitlines()
+        self.assertEqual([json.loads(line) for line in lines], [
+            json.loads(json.dumps(message.to_dict())) for message in messages])
+        self.assertIn('café 0', lines[0])
@@ -0,0 +1,200 @@
+import dataclasses
+import threading
+import unittest
+from unittest.mock import patch
+
+from core.__seedwork.application.unit_of_work import InMemoryUnitOfWork, UnitOfWork
+from core.__seedwork.domain.exceptions import NotFoundException
+from core.__seedwork.tests.unit.domain.test_unit_repositories import StubEntity, StubEvent, StubInMemoryRepository
+
+
+class TestUnitOfWorkUnit(unittest.TestCase):
+    def test_throw_error_when_not_implemented(self):
+        with self.assertRaises(TypeError) as assert_error:
+            UnitOfWork()  # pylint: disable=abstract-class-instantiated
+        self.assertEqual(
+            assert_error.exception.args[0],
+            "Can't instantiate abstract class UnitOfWork with abstract methods _begin, _end")
+
+
+class TestInMemoryUnitOfWorkUnit(unittest.TestCase):
+    unit_of_work: InMemoryUnitOfWork
+    repo: StubInMemoryRepository
+
+    def setUp(self):
+        self.unit_of_work = InMemoryUnitOfWork()
+        self.repo = StubInMemoryRepository()
+
+    def test_writes_go_to_the_repository_outside_a_unit(self):
+        entity = StubEntity(name='test', price=5)
+        self.unit_of_work.insert(self.repo, entity)
+        self.assertEqual(self.repo.items, [entity])
+
+        updated = dataclasses.replace(entity, price=10)
+        self.unit_of_work.update(self.repo, updated)
+        self.assertEqual(self.unit_of_work.find_by_id(self.repo, entity.id), updated)
+
+        self.unit_of_work.delete(self.repo, entity.id)
+        self.assertEqual(self.repo.items, [])
+        self.assertFalse(self.unit_of_work.active)
+
+    def test_defers_the_writes_until_the_unit_exits(self):
+        existing = StubEntity(name='existing', price=5)
+        removed = StubEntity(name='removed', price=5)
+        self.repo.bulk_insert([existing, removed])
+        created = StubEntity(name='created', price=5)
+        updated = dataclasses.replace(existing, price=10)
+
+        with patch.object(self.repo, 'bulk_insert', wraps=self.repo.bulk_insert) as spy_insert, \
+                patch.object(self.repo, 'bulk_update', wraps=self.repo.bulk_update) as spy_update, \
+                patch.object(self.repo, 'bulk_delete', wraps=self.repo.bulk_delete) as spy_delete:
+            with self.unit_of_work:
+                self.assertTrue(self.unit_of_work.active)
+                self.unit_of_work.insert(self.repo, created)
+                self.unit_of_work.update(self.repo, updated)
+                self.unit_of_work.delete(self.repo, removed.id)
+                self.assertEqual(self.repo.items, [existing, removed])
+
+            spy_insert.assert_called_once_with([created])
+            spy_update.assert_called_once_with([updated])
+            spy_delete.assert_called_once_with([removed.id])
+
+        self.assertFalse(self.unit_of_work.active)
+        self.assertCountEqual(self.repo.items, [created, updated])
+
+    def test_find_by_id_sees_the_pending_writes(self):
+        existing = StubEntity(name='existing', price=5)
+        self.repo.insert(existing)
+        created = StubEntity(name='created', price=5)
+
+        with self.unit_of_work:
+            self.unit_of_work.insert(self.repo, created)
+            self.assertIs(self.unit_of_work.find_by_id(self.repo, created.id), created)
+
+            updated = dataclasses.replace(created, price=10)
+            self.unit_of_work.update(self.repo, updated)
+            self.assertIs(self.unit_of_work.find_by_id(self.repo, created.id), updated)
+            self.assertEqual(self.unit_of_work.find_by_id(self.repo, existing.id), existing)
+
+            self.unit_of_work.delete(self.repo, existing.id)
+            with self.assertRaises(NotFoundException) as assert_error:
+                self.unit_of_work.find_by_id(self.repo, existing.id)
+            self.assertEqual(
+                assert_error.exception.args[0], f"Entity not found using ID '{existing.id}'")
+
+        self.assertEqual(self.repo.items, [updated])
+
+    def test_deleting_a_created_entity_never_writes_it(self):
+        created = StubEntity(name='created', price=5)
+        with patch.object(self.repo, 'bulk_delete') as spy_delete:
+            with self.unit_of_work:
+                self.unit_of_work.insert(self.repo, created)
+                self.unit_of_work.delete(self.repo, created.id)
+            spy_delete.assert_not_called()
+        self.assertEqual(self.repo.items, [])
+
+    def test_nested_units_join_the_outer_one(self):
+        created = StubEntity(name='created', price=5)
+        with self.unit_of_work:
+            with self.unit_of_work:
+                self.unit_of_work.insert(self.repo, created)
+            self.assertTrue(self.unit_of_work.active)
+            self.assertEqual(self.repo.items, [])
+        self.assertEqual(self.repo.items, [created])
+
+    def test_flushes_every_flush_size_writes(self):
+        self.unit_of_work = InMemoryUnitOfWork(flush_size=2)
+        entities = [StubEntity(name=f'entity {index}', price=5) for index in range(5)]
+        with patch.object(self.repo, 'bulk_insert', wraps=self.repo.bulk_insert) as spy_insert:
+            with self.unit_of_work:
+                for entity in entities:
+                    self.unit_of_work.insert(self.repo, entity)
+                self.assertEqual(len(self.repo.items), 4)
+            self.assertEqual(spy_insert.call_count, 3)
+        self.assertCountEqual(self.repo.items, entities)
+
+    def test_rolls_back_on_exception(self):
+        existing = StubEntity(name='existing', price=5)
+        existing.record_event(StubEvent(aggregate_id=existing.id))
+        self.repo.insert(existing)
+        events = list(self.repo.events)
+        self.unit_of_work = InMemoryUnitOfWork(flush_size=1)
+
+        with self.assertRaises(RuntimeError):
+            with self.unit_of_work:
+                created = StubEntity(name='created', price=5)
+                created.record_event(StubEvent(aggregate_id=created.id))
+                self.unit_of_work.insert(self.repo, created)
+                self.assertEqual(len(self.repo.events), 2)
+                self.unit_of_work.delete(self.repo, existing.id)
+                self.assertEqual(len(self.repo.items), 1)
+                self.assertNotEqual(self.repo.items, [existing])
+                raise RuntimeError()
+
+        self.assertFalse(self.unit_of_work.active)
+        self.assertEqual(self.repo.items, [existing])
+        self.assertEqual(self.repo.find_by_id(existing.id), existing)
+        self.assertEqual(self.repo.events, events)
+
+    def test_rolls_back_the_events_stored_after_a_drain(self):
+        existing = StubEntity(name='existing', price=5)
+        existing.record_event(StubEvent(aggregate_id=existing.id))
+        self.repo.insert(existing)
+
+        with self.assertRaises(RuntimeError):
+            with self.unit_of_work:
+                created = StubEntity(name='created', price=5)
+                created.record_event(StubEvent(aggregate_id=created.id))
+                self.unit_of_work.insert(self.repo, created)
+                self.unit_of_work.flush()
+                drained = self.repo.drain_events()
+                updated = self.unit_of_work.find_by_id(self.repo, created.id)
+                updated.record_event(StubEvent(aggregate_id=created.id))
+                self.unit_of_work.update(self.repo, updated)
+                self.unit_of_work.flush()
+                self.assertEqual(len(self.repo.events), 1)
+                raise RuntimeError()
+
+        self.assertEqual(len(drained), 2)
+        self.assertEqual(self.repo.events, [])
+        self.assertEqual(self.repo.items, [existing])
+
+    def test_rolls_back_changes_made_in_place_to_found_entities(self):
+        existing = StubEntity(name='existing', price=5)
+        self.repo.insert(existing)
+
+        with self.assertRaises(RuntimeError):
+            with self.unit_of_work:
+                found = self.unit_of_work.find_by_id(self.repo, existing.id)
+                self.assertIsNot(found, existing)
+                found._set('price', 10)  # pylint: disable=protected-access
+                self.unit_of_work.update(self.repo, found)
+                self.unit_of_work.flush()
+                self.assertEqual(self.repo.find_by_id(existing.id).price, 10)
+                raise RuntimeError()
+
+        self.assertIs(self.repo.find_by_id(existing.id), existing)
+        self.assertEqual(existing.price, 5)
+
+    def test_rolls_back_when_the_flush_fails(self):
+        existing = StubEntity(name='existing', price=5)
+        self.repo.insert(existing)
+
+        with self.assertRaises(NotFoundException):
+            with self.unit_of_work:
+                self.unit_of_work.delete(self.repo, existing.id)
+                self.unit_of_work.delete(self.repo, 'fake_id')
+
+        self.assertFalse(self.unit_of_work.active)
+        self.assertEqual(self.repo.items, [existing])
+
+    def test_units_are_per_thread(self):
+        created = StubEntity(name='created', price=5)
+        seen = []
+        with self.unit_of_work:
+            self.unit_of_work.insert(self.repo, created)
+            thread = threading.Thread(target=lambda: seen.append(self.unit_of_work.active))
+            thread.start()
+            thread.join()
+        self.assertEqual(seen, [False])
+        self.assertEqual(self.repo.items, [created])
@@ -1,7 +1,7 @@
 
 import unittest
 
-from core.__seedwork.application.use_cases import UseCase
+from core.__seedwork.application.use_cases import AsyncUseCase, UseCase
 
 
 class TestUseCaseUnit(unittest.TestCase):
@@ -10,3 +10,11 @@ class TestUseCaseUnit(unittest.TestCase):
             UseCase()
         self.assertEqual(
             assert_error.exception.args[0], "Can't instantiate abstract class UseCase with abstract method execute")
+
+
+class TestAsyncUseCaseUnit(unittest.TestCase):
+    def test_throw_error_when_not_implemented(self):
+        with self.assertRaises(TypeError) as assert_error:
+            AsyncUseCase()
+        self.assertEqual(
+            assert_error.exception.args[0], "Can't instantiate abstract class AsyncUseCase with abstract method execute")
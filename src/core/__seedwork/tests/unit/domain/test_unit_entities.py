@@ -1,8 +1,12 @@
 from abc import ABC
-from dataclasses import dataclass, is_dataclass
+from dataclasses import asdict, dataclass, field, is_dataclass
+import datetime
+from typing import List
 import unittest
+from unittest.mock import patch
 
 from core.__seedwork.domain.entities import Entity
+from core.__seedwork.domain.events import DomainEvent
 from core.__seedwork.domain.value_objects import UniqueEntityId
 
 
@@ -12,6 +16,23 @@ class StubEntity(Entity):
     prop2: str
 
 
+@dataclass(frozen=True)
+class StubValueObject:
+    value: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class StubNestedEntity(Entity):
+    created_at: datetime.datetime
+    tags: List[str] = field(default_factory=list)
+    value_object: StubValueObject = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class StubEvent(DomainEvent):
+    pass
+
+
 class TestUnitEntity(unittest.TestCase):
     def test_if_is_dataclass(self):
         self.assertTrue(is_dataclass(Entity))
@@ -43,3 +64,73 @@ class TestUnitEntity(unittest.TestCase):
         # pylint : disable=protected-access
         entity._set('prop1', 'new value')
         self.assertEqual(entity.prop1, 'new value')
+
+    def test_hydrate_method(self):
+        unique_entity_id = UniqueEntityId('adea742e-b317-44bd-8236-5c104cb0dce3')
+        entity = StubEntity.hydrate(
+            unique_entity_id=unique_entity_id, prop1='value 1', prop2='value 2')
+        self.assertEqual(entity, StubEntity(
+            unique_entity_id=unique_entity_id, prop1='value 1', prop2='value 2'))
+
+        entity = StubEntity.hydrate(prop1='value 1', prop2='value 2')
+        self.assertIsInstance(entity.unique_entity_id, UniqueEntityId)
+
+        with self.assertRaises(TypeError) as assert_error:
+            StubEntity.hydrate(prop1='value 1')
+        self.assertEqual(
+            assert_error.exception.args[0], "StubEntity.hydrate() missing argument: 'prop2'")
+
+    def test_hydrate_does_not_call_post_init(self):
+        with patch.object(StubEntity, '__post_init__', create=True) as mock_post_init:
+            StubEntity.hydrate(prop1='value 1', prop2='value 2')
+            mock_post_init.assert_not_called()
+
+    def test_to_dict_has_the_same_output_as_asdict(self):
+        entity = StubNestedEntity(
+            created_at=datetime.datetime.now(datetime.timezone.utc),
+            tags=['a', 'b'],
+            value_object=StubValueObject('value')
+        )
+        expected = asdict(entity)
+        expected.pop('unique_entity_id')
+        expected.pop('_events')
+        expected['id'] = entity.id
+
+        entity_dict = entity.to_dict()
+        self.assertEqual(list(entity_dict.items()), list(expected.items()))
+        self.assertEqual(entity_dict['value_object'], {'value': 'value'})
+        self.assertIsNot(entity_dict['tags'], entity.tags)
+
+    def test_to_dict_is_compiled_once_per_class(self):
+        StubEntity(prop1='value 1', prop2='value 2').to_dict()
+        StubNestedEntity(created_at=None).to_dict()
+        to_dict = StubEntity.__dict__['_to_dict']
+        StubEntity(prop1='value 3', prop2='value 4').to_dict()
+        self.assertIs(StubEntity.__dict__['_to_dict'], to_dict)
+        self.assertIsNot(StubNestedEntity.__dict__['_to_dict'], to_dict)
+
+    def test_from_dict_method(self):
+        entity = StubEntity(unique_entity_id=UniqueEntityId('adea742e-b317-44bd-8236-5c104cb0dce3'),
+                            prop1='value 1', prop2='value 2')
+        self.assertEqual(StubEntity.from_dict(entity.to_dict()), entity)
+
+        entity = StubEntity.from_dict({'prop1': 'value 1', 'prop2': 'value 2'})
+        self.assertIsInstance(entity.unique_entity_id, UniqueEntityId)
+        self.assertEqual(entity.prop1, 'value 1')
+
+    def test_record_and_pull_events(self):
+        entity = StubEntity(prop1='value 1', prop2='value 2')
+        self.assertEqual(entity.events, ())
+        self.assertEqual(entity.pull_events(), [])
+
+        events = [StubEvent(aggregate_id=entity.id), StubEvent(aggregate_id=entity.id)]
+        for event in events:
+            entity.record_event(event)
+        self.assertEqual(entity.events, tuple(events))
+        self.assertEqual(entity, StubEntity(
+            unique_entity_id=entity.unique_entity_id, prop1='value 1', prop2='value 2'))
+        self.assertNotIn('_events', entity.to_dict())
+
+        self.assertEqual(entity.pull_events(), events)
+        self.assertEqual(entity.events, ())
+        self.assertEqual(StubEntity.hydrate(prop1='value 1', prop2='value 2').events, ())
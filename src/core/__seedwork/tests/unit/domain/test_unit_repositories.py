@@ -1,7 +1,9 @@
 import unittest
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Optional, List
 from core.__seedwork.domain.entities import Entity
+from core.__seedwork.domain.events import DomainEvent
 from core.__seedwork.domain.exceptions import NotFoundException
 from core.__seedwork.domain.value_objects import UniqueEntityId
 from core.__seedwork.domain.repositories import (SearchableRepositoryInterface,
@@ -11,7 +13,10 @@ from core.__seedwork.domain.repositories import (SearchableRepositoryInterface,
                                             InMemoryRepository,
                                             RepositoryInterface,
                                             InMemorySearchableRepository,
-                                            ET)
+                                            SearchCursor,
+                                            CURSOR_START,
+                                            ET,
+                                            iter_batches)
 
 
 class TestRepositoryInterfaceUnit(unittest.TestCase):
@@ -19,7 +24,7 @@ class TestRepositoryInterfaceUnit(unittest.TestCase):
         with self.assertRaises(TypeError) as assert_error:
             RepositoryInterface()
         self.assertEqual(
-            assert_error.exception.args[0], "Can't instantiate abstract class RepositoryInterface with abstract methods delete, find_all, find_by_id, insert, update")
+            assert_error.exception.args[0], "Can't instantiate abstract class RepositoryInterface with abstract methods bulk_delete, bulk_insert, bulk_update, bulk_upsert, delete, find_all, find_by_id, find_by_ids, insert, update")
 
 
 @dataclass(slots=True, kw_only=True, frozen=True)
@@ -28,6 +33,11 @@ class StubEntity(Entity):
     price: float
 
 
+@dataclass(slots=True, kw_only=True, frozen=True)
+class StubEvent(DomainEvent):
+    pass
+
+
 class StubInMemoryRepository(InMemoryRepository[StubEntity]):
     pass
 
@@ -115,13 +125,169 @@ class TestInMemoryRepositoryUnit(unittest.TestCase):
         self.repo.delete(entity.id)
         self.assertTrue(entity not in self.repo.items)
 
+    def test_items_and_find_all_hand_out_copies(self):
+        entity = StubEntity(name="test", price=10.0)
+        self.repo.insert(entity)
+        other = StubEntity(name="other", price=5.0)
+
+        self.repo.items.append(other)
+        self.repo.find_all().append(other)
+
+        self.assertListEqual(self.repo.items, [entity])
+        self.assertListEqual(self.repo.find_all(), [entity])
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id(other.id)
+
+    def test_bulk_insert_keeps_order_and_index(self):
+        entity = StubEntity(name="test", price=10.0)
+        self.repo.insert(entity)
+        entities = [
+            StubEntity(name="a", price=1.0),
+            StubEntity(name="b", price=2.0),
+        ]
+        self.repo.bulk_insert(entities)
+
+        self.assertListEqual(self.repo.find_all(), [*entities, entity])
+        for item in [*entities, entity]:
+            self.assertEqual(self.repo.find_by_id(item.id), item)
+
+    def test_update_and_delete_keep_insertion_order(self):
+        entities = [
+            StubEntity(name="a", price=1.0),
+            StubEntity(name="b", price=2.0),
+            StubEntity(name="c", price=3.0),
+        ]
+        for entity in entities:
+            self.repo.insert(entity)
+
+        entity_updated = StubEntity(
+            unique_entity_id=entities[1].unique_entity_id, name='updated', price=29.9)
+        self.repo.update(entity_updated)
+        self.assertListEqual(
+            self.repo.find_all(), [entities[0], entity_updated, entities[2]])
+
+        self.repo.delete(entities[0].unique_entity_id)
+        self.assertListEqual(
+            self.repo.find_all(), [entity_updated, entities[2]])
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id(entities[0].id)
+
+    def test_bulk_update(self):
+        entities = [StubEntity(name=name, price=1.0) for name in 'abc']
+        self.repo.bulk_insert(entities)
+
+        entities_updated = [
+            StubEntity(unique_entity_id=entities[2].unique_entity_id, name='c updated', price=3.0),
+            StubEntity(unique_entity_id=entities[0].unique_entity_id, name='a updated', price=2.0),
+        ]
+        self.repo.bulk_update(iter(entities_updated))
+        self.assertListEqual(
+            self.repo.find_all(), [entities_updated[1], entities[1], entities_updated[0]])
+
+        with self.assertRaises(NotFoundException) as assert_error:
+            self.repo.bulk_update([
+                StubEntity(unique_entity_id=entities[1].unique_entity_id, name='b updated', price=2.0),
+                StubEntity(unique_entity_id=UniqueEntityId('af46842e-027d-4c91-b259-3a3642144ba4'),
+                           name='fake', price=1.0),
+            ])
+        self.assertEqual(assert_error.exception.args[0],
+                         "Entity not found using ID 'af46842e-027d-4c91-b259-3a3642144ba4'")
+        self.assertEqual(self.repo.find_by_id(entities[1].id), entities[1])
+
+    def test_bulk_upsert(self):
+        entity = StubEntity(name='a', price=1.0)
+        self.repo.insert(entity)
+
+        entity_updated = StubEntity(unique_entity_id=entity.unique_entity_id, name='a updated', price=1.0)
+        new_entity = StubEntity(name='b', price=2.0)
+        self.repo.bulk_upsert([new_entity, entity_updated])
+
+        self.assertListEqual(self.repo.find_all(), [entity_updated, new_entity])
+        self.assertEqual(self.repo.find_by_id(new_entity.id), new_entity)
+
+    def test_bulk_delete(self):
+        entities = [StubEntity(name=name, price=1.0) for name in 'abc']
+        self.repo.bulk_insert(entities)
+
+        with self.assertRaises(NotFoundException) as assert_error:
+            self.repo.bulk_delete([entities[0].id, 'fake id'])
+        self.assertEqual(assert_error.exception.args[0], "Entity not found using ID 'fake id'")
+        self.assertListEqual(self.repo.find_all(), entities)
+
+        self.repo.bulk_delete([entities[0].unique_entity_id, entities[2].id, entities[2].id])
+        self.assertListEqual(self.repo.find_all(), [entities[1]])
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id(entities[2].id)
+
+    def test_find_by_ids(self):
+        entities = [StubEntity(name=name, price=1.0) for name in 'abc']
+        self.repo.bulk_insert(entities)
+        self.assertListEqual(
+            self.repo.find_by_ids([entities[2].id, 'fake id', entities[0].unique_entity_id, entities[2].id]),
+            [entities[2], entities[0]]
+        )
+
+    def test_iter_batches(self):
+        self.assertListEqual(list(iter_batches(range(5), 2)), [[0, 1], [2, 3], [4]])
+        self.assertListEqual(list(iter_batches([], 2)), [])
+
+    def test_items_setter_rebuilds_index(self):
+        entities = [
+            StubEntity(name="a", price=1.0),
+            StubEntity(name="b", price=2.0),
+        ]
+        self.repo.items = entities
+        self.assertListEqual(self.repo.items, entities)
+        self.assertEqual(self.repo.find_by_id(entities[1].id), entities[1])
+
+        self.repo.items = []
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id(entities[1].id)
+
+    def test_writes_take_the_events_of_the_entities(self):
+        entities = [StubEntity(name=name, price=1.0) for name in 'abc']
+        events = [StubEvent(aggregate_id=entity.id) for entity in entities + entities]
+        for entity, event in zip(entities, events):
+            entity.record_event(event)
+        self.repo.insert(entities[0])
+        self.repo.bulk_insert(entities[1:])
+        self.assertListEqual(self.repo.events, events[:3])
+
+        for entity, event in zip(entities, events[3:]):
+            entity.record_event(event)
+        self.repo.update(entities[0])
+        self.repo.bulk_update([entities[1]])
+        self.repo.bulk_upsert([entities[2]])
+        self.assertListEqual(self.repo.events, events)
+        self.assertTrue(all(not entity.events for entity in entities))
+
+    def test_drain_events(self):
+        entities = [StubEntity(name=name, price=1.0) for name in 'abc']
+        events = [StubEvent(aggregate_id=entity.id) for entity in entities]
+        for entity, event in zip(entities, events):
+            entity.record_event(event)
+        self.repo.bulk_insert(entities)
+
+        self.assertListEqual(self.repo.drain_events(2), events[:2])
+        self.assertListEqual(self.repo.events, events[2:])
+        self.assertEqual(self.repo.events_stored, 3)
+        self.assertListEqual(self.repo.drain_events(), events[2:])
+        self.assertListEqual(self.repo.events, [])
+        self.assertEqual(self.repo.events_stored, 3)
+
+        entities[0].record_event(StubEvent(aggregate_id=entities[0].id))
+        self.repo.update(entities[0])
+        self.repo.discard_events(2)
+        self.assertListEqual(self.repo.events, [])
+        self.assertEqual(self.repo.events_stored, 3)
+
 
 class TestSearchableRepositoryInterfaceUnit(unittest.TestCase):
     def test_throw_error_when_methods_not_implemeneted(self):
         with self.assertRaises(TypeError) as assert_error:
             SearchableRepositoryInterface()
         self.assertEqual(
-            assert_error.exception.args[0], "Can't instantiate abstract class SearchableRepositoryInterface with abstract methods delete, find_all, find_by_id, insert, search, update")
+            assert_error.exception.args[0], "Can't instantiate abstract class SearchableRepositoryInterface with abstract methods bulk_delete, bulk_insert, bulk_update, bulk_upsert, delete, find_all, find_by_id, find_by_ids, insert, search, update")
 
     def test_if_sortable_field_is_empty(self):
         self.assertEqual(SearchableRepositoryInterface.sortable_fields, [])
@@ -135,7 +301,9 @@ class TestSearchParamsUnit(unittest.TestCase):
                              'per_page': Optional[int],
                              'sort': Optional[str],
                              'sort_dir': Optional[str],
-                             'filter': Optional[Filter]
+                             'filter': Optional[Filter],
+                             'cursor': Optional[str],
+                             'count_mode': Optional[str]
                          })
 
     def test_page_prop(self):
@@ -221,18 +389,81 @@ class TestSearchParamsUnit(unittest.TestCase):
             params = SearchParams(filter=i['filter'])
             self.assertEqual(params.filter, i['expected'])
 
+    def test_count_mode_prop(self):
+        params = SearchParams()
+        self.assertEqual(params.count_mode, 'exact')
+        arrange = [
+            {'count_mode': None, 'expected': 'exact'},
+            {'count_mode': "", 'expected': 'exact'},
+            {'count_mode': 'fake', 'expected': 'exact'},
+            {'count_mode': 'EXACT', 'expected': 'exact'},
+            {'count_mode': 'estimated', 'expected': 'estimated'},
+            {'count_mode': 'none', 'expected': 'none'},
+            {'count_mode': 'has_more', 'expected': 'none'},
+        ]
+
+        for i in arrange:
+            params = SearchParams(count_mode=i['count_mode'])
+            self.assertEqual(params.count_mode, i['expected'])
+
+    def test_cursor_prop(self):
+        params = SearchParams()
+        self.assertIsNone(params.cursor)
+        arrange = [
+            {'cursor': None, 'expected': None},
+            {'cursor': "", 'expected': None},
+            {'cursor': '*', 'expected': '*'},
+            {'cursor': 'abc', 'expected': 'abc'},
+        ]
+
+        for i in arrange:
+            params = SearchParams(cursor=i['cursor'])
+            self.assertEqual(params.cursor, i['expected'])
+
+
+class TestSearchCursorUnit(unittest.TestCase):
+    def test_encode_and_decode(self):
+        arrange = [
+            SearchCursor('name', 'asc', 'movie',
+                         'adea742e-b317-44bd-8236-5c104cb0dce3'),
+            SearchCursor('created_at', 'desc',
+                         datetime(2024, 1, 2, 3, 4, 5, 6, tzinfo=timezone.utc),
+                         'adea742e-b317-44bd-8236-5c104cb0dce3'),
+            SearchCursor(None, None, None,
+                         'adea742e-b317-44bd-8236-5c104cb0dce3'),
+        ]
+        for cursor in arrange:
+            self.assertEqual(SearchCursor.decode(cursor.encode()), cursor)
+
+    def test_decode_invalid_cursor(self):
+        arrange = [None, CURSOR_START, 'fake', '@@@', SearchCursor(
+            'name', 'asc', 'movie', 'fake id').encode()]
+        for cursor in arrange:
+            self.assertIsNone(SearchCursor.decode(cursor))
+
+    def test_matches(self):
+        cursor = SearchCursor('name', 'asc', 'movie',
+                              'adea742e-b317-44bd-8236-5c104cb0dce3')
+        self.assertTrue(cursor.matches('name', 'asc'))
+        self.assertFalse(cursor.matches('name', 'desc'))
+        self.assertFalse(cursor.matches('price', 'asc'))
+
 
 class TestSearchResultUnit(unittest.TestCase):
     def test_props_annotations(self):
         self.assertEqual(SearchResult.__annotations__, {
             'items': List[ET],
-            'total': int,
+            'total': Optional[int],
             'current_page': int,
             'per_page': int,
-            'last_page': int,
+            'last_page': Optional[int],
             'sort': Optional[str],
             'sort_dir': Optional[str],
-            'filter': Optional[Filter]
+            'filter': Optional[Filter],
+            'next_cursor': Optional[str],
+            'count_mode': str,
+            'has_more': Optional[bool],
+            'total_capped': bool
         })
 
     def test_constructor(self):
@@ -251,7 +482,11 @@ class TestSearchResultUnit(unittest.TestCase):
             'last_page': 2,
             'sort': None,
             'sort_dir': None,
-            'filter': None
+            'filter': None,
+            'next_cursor': None,
+            'count_mode': 'exact',
+            'has_more': True,
+            'total_capped': False
         })
 
     def test_when_per_page_is_greater_than_total(self):
@@ -268,6 +503,27 @@ class TestSearchResultUnit(unittest.TestCase):
                               current_page=1)
         self.assertEqual(result.last_page, 6)
 
+    def test_without_total(self):
+        result = SearchResult(items=[],
+                              total=None,
+                              per_page=20,
+                              current_page=1,
+                              count_mode='none',
+                              has_more=False)
+        self.assertIsNone(result.last_page)
+        self.assertFalse(result.has_more)
+
+    def test_with_a_capped_total(self):
+        result = SearchResult(items=[],
+                              total=100,
+                              per_page=20,
+                              current_page=1,
+                              count_mode='estimated',
+                              has_more=True,
+                              total_capped=True)
+        self.assertIsNone(result.last_page)
+        self.assertTrue(result.has_more)
+
 
 class StubInMemorySearchableRepository(InMemorySearchableRepository[StubEntity, str]):
     sortable_fields: List = ['name']
@@ -571,3 +827,117 @@ class TestInMemorySearchableRepositoryUnit(unittest.TestCase):
             sort_dir="asc",
             filter="TEST"
         ))
+
+    def test_search_unfiltered_uses_sort_index_with_same_order_as_sorted(self):
+        self.repo.sortable_fields = ['name', 'price']
+        self.repo.items = [
+            StubEntity(name=name, price=index % 3)
+            for index, name in enumerate('cabacbdaeb')
+        ]
+        self.repo.search(SearchParams(sort='name'))
+        self.repo.search(SearchParams(sort='price'))
+
+        self.repo.insert(StubEntity(name='b', price=1))
+        self.repo.update(StubEntity(
+            unique_entity_id=self.repo.items[0].unique_entity_id, name='a', price=2))
+        self.repo.delete(self.repo.items[3].id)
+
+        for sort in ['name', 'price']:
+            for sort_dir in ['asc', 'desc']:
+                expected = sorted(
+                    self.repo.items,
+                    key=lambda item, sort=sort: getattr(item, sort),
+                    reverse=sort_dir == 'desc'
+                )
+                for page in [1, 2, 3, 4]:
+                    result = self.repo.search(SearchParams(
+                        page=page, per_page=3, sort=sort, sort_dir=sort_dir))
+                    self.assertEqual(
+                        result.items,
+                        expected[(page - 1) * 3:page * 3],
+                        f"sort {sort} {sort_dir} on page {page} is different"
+                    )
+                    self.assertEqual(result.total, 10)
+
+    def test_sort_index_follows_entities_updated_in_place(self):
+        self.repo.items = [
+            StubEntity(name='a', price=1),
+            StubEntity(name='b', price=2),
+        ]
+        self.repo.search(SearchParams(sort='name'))
+
+        entity = self.repo.find_by_id(self.repo.items[0].id)
+        entity._set('name', 'c')  # pylint: disable=protected-access
+        self.repo.update(entity)
+
+        result = self.repo.search(SearchParams(sort='name'))
+        self.assertEqual(result.items, [self.repo.items[1], entity])
+
+    def test__apply_top_k_pagination_matches_sorted(self):
+        self.repo.sortable_fields = ['name', 'price']
+        items = [
+            StubEntity(name=name, price=index % 3)
+            for index, name in enumerate('cabacbdaeb')
+        ]
+        for sort in ['name', 'price']:
+            for sort_dir in ['asc', 'desc']:
+                expected = sorted(
+                    items,
+                    key=lambda item, sort=sort: getattr(item, sort),
+                    reverse=sort_dir == 'desc'
+                )
+                for page in [1, 2, 3, 4, 5]:
+                    # pylint: disable=protected-access
+                    result = self.repo._apply_top_k_pagination(
+                        iter(items), sort, sort_dir, page, 3)
+                    self.assertEqual(result, expected[(page - 1) * 3:page * 3])
+
+        # pylint: disable=protected-access
+        result = self.repo._apply_top_k_pagination(items, None, None, 2, 3)
+        self.assertEqual(result, items[3:6])
+
+    def test_search_by_cursor_walks_every_item_once(self):
+        self.repo.sortable_fields = ['name', 'price']
+        self.repo.items = [
+            StubEntity(name=name, price=index % 3)
+            for index, name in enumerate('cabacbdaebtest')
+        ]
+        arrange = [
+            {'sort': 'name', 'filter': None},
+            {'sort': 'price', 'filter': None},
+            {'sort': None, 'filter': None},
+            {'sort': 'name', 'filter': 'e'},
+            {'sort': None, 'filter': 't'},
+        ]
+        for i in arrange:
+            for sort_dir in ['asc', 'desc']:
+                # pylint: disable=protected-access
+                items = self.repo._apply_filter(self.repo.items, i['filter'])
+                expected = sorted(
+                    items,
+                    key=lambda item, sort=i['sort']: (
+                        getattr(item, sort) if sort else None, item.id),
+                    reverse=sort_dir == 'desc' and i['sort'] is not None
+                )
+                walked = []
+                cursor = CURSOR_START
+                while cursor:
+                    result = self.repo.search(SearchParams(
+                        per_page=3, sort=i['sort'], sort_dir=sort_dir,
+                        filter=i['filter'], cursor=cursor))
+                    self.assertEqual(result.total, len(expected))
+                    walked.extend(result.items)
+                    cursor = result.next_cursor
+                self.assertEqual(walked, expected, f"{i} {sort_dir}")
+
+    def test_search_without_count(self):
+        self.repo.items = [StubEntity(name='a', price=1)] * 5
+        result = self.repo.search(SearchParams(per_page=2, count_mode='none'))
+        self.assertIsNone(result.total)
+        self.assertIsNone(result.last_page)
+        self.assertTrue(result.has_more)
+
+        result = self.repo.search(SearchParams(
+            page=3, per_page=2, count_mode='none'))
+        self.assertEqual(len(result.items), 1)
+        self.assertFalse(result.has_more)
@@ -1,9 +1,20 @@
 from dataclasses import fields
+import datetime
 import unittest
 from unittest.mock import MagicMock, PropertyMock, patch
+from rest_framework import serializers
 from rest_framework.serializers import Serializer
 from core.__seedwork.domain.exceptions import ValidationException
-from core.__seedwork.domain.validators import DRFValidator, ValidatorFieldsInterface, ValidatorRules
+from core.__seedwork.domain.validators import (
+    CompiledDRFValidator,
+    CompiledRules,
+    DRFValidator,
+    StrictBooleanField,
+    StrictCharField,
+    ValidatedProps,
+    ValidatorFieldsInterface,
+    ValidatorRules
+)
 
 
 class TestValidatorRulesUnit(unittest.TestCase):
@@ -192,3 +203,163 @@ class TestDRFValidatorUnit(unittest.TestCase):
         self.assertFalse(is_valid)
         self.assertEqual(validator.errors, {'field': ['some error']})
         mock_is_valid.assert_called_once()
+
+
+# pylint: disable=abstract-method
+class StubRules(Serializer):
+    name = StrictCharField(max_length=10)
+    description = StrictCharField(
+        required=False, allow_null=True, allow_blank=True)
+    is_active = StrictBooleanField(required=False)
+    created_at = serializers.DateTimeField(required=False)
+    version = serializers.IntegerField(required=False, min_value=1)
+
+
+class StubCrossFieldRules(StubRules):
+    def validate(self, attrs):
+        if attrs.get('description') == attrs.get('name'):
+            raise serializers.ValidationError('name and description are equal')
+        return attrs
+
+
+class StubCompiledValidator(CompiledDRFValidator):
+    rules = StubRules
+
+
+class StubCrossFieldValidator(CompiledDRFValidator):
+    rules = StubCrossFieldRules
+
+
+class TestCompiledDRFValidatorUnit(unittest.TestCase):
+
+    def test_compile_rules(self):
+        compiled_rules = StubCompiledValidator.get_compiled_rules()
+        self.assertIsInstance(compiled_rules, CompiledRules)
+        self.assertEqual(
+            [source for source, _, _ in compiled_rules.fields],
+            ['name', 'description', 'is_active', 'created_at', 'version']
+        )
+        self.assertIs(StubCompiledValidator.get_compiled_rules(), compiled_rules)
+        self.assertIsNone(StubCrossFieldValidator.get_compiled_rules())
+
+    def test_same_result_as_serializer(self):
+        created_at = datetime.datetime(
+            2022, 1, 1, 10, 30, tzinfo=datetime.timezone.utc)
+        arrange = [
+            None,
+            {},
+            [],
+            'fake',
+            {'name': 'name'},
+            {'name': ' name '},
+            {'name': 'ação'},
+            {'name': 'a\x00'},
+            {'name': '\ud800'},
+            {'name': ''},
+            {'name': '   '},
+            {'name': None},
+            {'name': 5},
+            {'name': 'a' * 11},
+            {'name': 'name', 'description': None},
+            {'name': 'name', 'description': ''},
+            {'name': 'name', 'description': 5},
+            {'name': 'name', 'is_active': False},
+            {'name': 'name', 'is_active': 'True'},
+            {'name': 'name', 'is_active': None},
+            {'name': 'name', 'created_at': created_at},
+            {'name': 'name', 'created_at': created_at.replace(tzinfo=None)},
+            {'name': 'name', 'created_at': '2022-01-01T10:30:00Z'},
+            {'name': 'name', 'created_at': datetime.date(2022, 1, 1)},
+            {'name': 'name', 'created_at': 5},
+            {'name': 'name', 'version': 1},
+            {'name': 'name', 'version': 0},
+            {'name': 'name', 'version': '2'},
+            {'name': 'name', 'version': True},
+            {'name': 'name', 'version': 1.5},
+            {'name': 5, 'description': 5, 'is_active': 5, 'created_at': 5},
+        ]
+
+        for data in arrange:
+            with self.subTest(data=data):
+                expected = DRFValidator()
+                expected_is_valid = expected.validate(
+                    StubRules(data=data if data is not None else {}))
+                validator = StubCompiledValidator()
+                self.assertEqual(validator.validate(data), expected_is_valid)
+                self.assertEqual(validator.errors, expected.errors)
+                self.assertEqual(validator.validated_data, expected.validated_data)
+
+    def test_fallback_to_serializer_when_rules_are_not_compiled(self):
+        validator = StubCrossFieldValidator()
+        self.assertFalse(validator.validate(
+            {'name': 'name', 'description': 'name'}))
+        self.assertEqual(validator.errors, {
+            'non_field_errors': ['name and description are equal']})
+
+        self.assertTrue(validator.validate({'name': 'name'}))
+        self.assertEqual(validator.validated_data, {'name': 'name'})
+
+    def test_validate_many(self):
+        validator = StubCompiledValidator()
+        errors = validator.validate_many([
+            {'name': 'name 1'},
+            {'name': 5},
+            {'name': 'name 2', 'is_active': False},
+            {},
+        ])
+
+        self.assertEqual(errors, {
+            1: {'name': ['Not a valid string.']},
+            3: {'name': ['This field is required.']},
+        })
+        self.assertEqual(validator.errors, errors)
+        self.assertEqual(validator.validated_data, [
+            {'name': 'name 1'},
+            {'name': 'name 2', 'is_active': False},
+        ])
+
+        self.assertEqual(validator.validate_many([{'name': 'name'}]), {})
+        self.assertIsNone(validator.errors)
+
+    def test_validated_props(self):
+        validator = StubCompiledValidator()
+        self.assertTrue(validator.validate({'name': 'name', 'is_active': True, 'version': 1}))
+        validated = validator.validated_props()
+        self.assertIsInstance(validated, ValidatedProps)
+        self.assertIs(validated.rules, StubRules)
+        self.assertEqual(dict(validated.props), {'name': 'name', 'is_active': True, 'version': 1})
+        with self.assertRaises(TypeError):
+            validated.props['name'] = 'a' * 11  # pylint: disable=unsupported-assignment-operation
+
+        with self.assertRaises(TypeError) as assert_error:
+            ValidatedProps(StubRules, {'name': 'a' * 11})
+        self.assertEqual(str(assert_error.exception), 'ValidatedProps are only issued by validators')
+
+        self.assertEqual(
+            validated.covered(StubRules, {'name': 'name', 'is_active': 1, 'version': 2}),
+            {'name'}
+        )
+        self.assertEqual(validated.covered(StubCrossFieldRules, {'name': 'name'}), set())
+
+    def test_validate_skips_the_props_a_token_covers(self):
+        validator = StubCompiledValidator()
+        validator.validate({'name': 'name', 'description': 'description'})
+        validated = validator.validated_props()
+
+        with patch.object(CompiledRules, 'run', autospec=True, side_effect=CompiledRules.run) as spy_run:
+            self.assertTrue(validator.validate({'name': 'name', 'description': 'description'}, validated))
+        self.assertEqual(spy_run.call_args.args[2], {'name', 'description'})
+        # skipped props are taken as they are
+        self.assertEqual(
+            StubCompiledValidator.get_compiled_rules().run({'name': 5}, {'name'}),
+            (None, {'name': 5})
+        )
+
+        # props that changed, or that the token does not cover, are validated
+        self.assertFalse(validator.validate({'name': 'a' * 11, 'version': 0}, validated))
+        self.assertEqual(validator.errors, {
+            'name': ['Ensure this field has no more than 10 characters.'],
+            'version': ['Ensure this value is greater than or equal to 1.'],
+        })
+        self.assertTrue(validator.validate({'name': 'name', 'description': None}, validated))
+        self.assertEqual(validator.validated_data, {'name': 'name', 'description': None})
@@ -1,5 +1,6 @@
 from core.__seedwork.domain.exceptions import InvalidUuidException
 from abc import ABC
+import pickle
 import uuid
 import unittest
 from dataclasses import FrozenInstanceError, dataclass, is_dataclass
@@ -99,3 +100,36 @@ class TestUniqueIdentityIdUnit(unittest.TestCase):
     def test_convert_to_str(self):
         value_object = UniqueEntityId()
         self.assertEqual(value_object.id, str(value_object))
+
+    def test_compare_and_hash_by_value(self):
+        uuid_value = uuid.uuid4()
+        value_object = UniqueEntityId(uuid_value)
+        self.assertEqual(value_object.value, uuid_value.int)
+        self.assertEqual(value_object.uuid, uuid_value)
+
+        same_ids = [
+            UniqueEntityId(str(uuid_value)),
+            UniqueEntityId(str(uuid_value).upper()),
+            UniqueEntityId(uuid_value.hex),
+        ]
+        for same_id in same_ids:
+            self.assertEqual(same_id, value_object)
+            self.assertEqual(hash(same_id), hash(value_object))
+            self.assertEqual(same_id.id, str(uuid_value))
+        self.assertNotEqual(UniqueEntityId(), value_object)
+
+    def test_throw_exception_if_id_is_not_a_string_or_uuid(self):
+        with self.assertRaises(InvalidUuidException):
+            UniqueEntityId(5)
+
+    def test_render_string_once(self):
+        value_object = UniqueEntityId(uuid.uuid4())
+        self.assertIs(value_object.id, value_object.id)
+        self.assertFalse(hasattr(value_object, '__dict__'))
+
+    def test_pickle(self):
+        for value_object in (UniqueEntityId(uuid.uuid4()), UniqueEntityId(str(uuid.uuid4()))):
+            with self.subTest(value_object=value_object):
+                copy = pickle.loads(pickle.dumps(value_object))
+                self.assertEqual(copy, value_object)
+                self.assertEqual(copy.id, value_object.id)
@@ -1,8 +1,15 @@
-from typing import OrderedDict
+from dataclasses import dataclass, replace
+import datetime
+from typing import Optional, OrderedDict
 import unittest
 
 from core.__seedwork.application.dto import PaginationOutput
-from core.__seedwork.infra.django_app.serializers import CollectionSerializer, PaginationSerializer
+from core.__seedwork.infra.django_app.serializers import (
+    CollectionSerializer,
+    PaginationSerializer,
+    compile_representation
+)
+from django.utils import timezone
 from rest_framework import serializers
 
 class TestPaginationSerializer(unittest.TestCase):
@@ -23,6 +30,40 @@ class TestPaginationSerializer(unittest.TestCase):
             'total': 4
         })
 
+    def test_serialize_next_cursor(self):
+        pagination = {
+            'current_page': 1,
+            'per_page': 2,
+            'last_page': 3,
+            'total': 4,
+            'next_cursor': 'fake cursor'
+        }
+        data = PaginationSerializer(instance=pagination).data
+        self.assertEqual(data['next_cursor'], 'fake cursor')
+
+        data = PaginationSerializer(
+            instance={**pagination, 'next_cursor': None}).data
+        self.assertNotIn('next_cursor', data)
+
+    def test_serialize_without_count(self):
+        pagination = {
+            'current_page': 1,
+            'per_page': 2,
+            'last_page': None,
+            'total': None,
+            'has_more': True,
+            'count_mode': 'none'
+        }
+        data = PaginationSerializer(instance=pagination).data
+        self.assertEqual(data, {
+            'current_page': 1,
+            'per_page': 2,
+            'last_page': None,
+            'total': None,
+            'has_more': True,
+            'count_mode': 'none'
+        })
+
 
 class StubSerializer(serializers.Serializer):
     name = serializers.CharField()
@@ -81,3 +122,98 @@ class TestCollectionSerializer(unittest.TestCase):
                 'total': 4
             }
         })
+
+
+@dataclass
+class StubOutput:
+    id: str
+    name: Optional[str]
+    count: object
+    is_active: object
+    created_at: Optional[datetime.datetime]
+
+
+class StubOutputSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+    name = serializers.CharField()
+    count = serializers.IntegerField()
+    is_active = serializers.BooleanField()
+    created_at = serializers.DateTimeField()
+    password = serializers.CharField(write_only=True)
+
+
+class StubNestedSerializer(serializers.Serializer):
+    name = serializers.CharField()
+    child = StubSerializer()
+
+
+class TestCompileRepresentation(unittest.TestCase):
+
+    def test_represents_like_the_serializer(self):
+        represent = compile_representation(StubOutputSerializer)
+        outputs = [
+            StubOutput(
+                id='af46842e-027d-4c91-b259-3a3642144ba4',
+                name='Movie',
+                count=1,
+                is_active=False,
+                created_at=datetime.datetime(2022, 1, 1, 10, 30, tzinfo=datetime.timezone.utc)
+            ),
+            StubOutput(id=None, name=None, count='2', is_active='true', created_at=None),
+            StubOutput(id='Af46842e027d4c91b2593a3642144ba4', name=1, count=True, is_active=1,
+                       created_at=datetime.datetime(2022, 1, 1, 10, 30)),
+        ]
+        for output in outputs:
+            with self.subTest(output=output):
+                self.assertEqual(represent(output), StubOutputSerializer(instance=output).data)
+
+        self.assertEqual(represent(outputs[0]), {
+            'id': 'af46842e-027d-4c91-b259-3a3642144ba4',
+            'name': 'Movie',
+            'count': 1,
+            'is_active': False,
+            'created_at': '2022-01-01T10:30:00Z'
+        })
+        self.assertIs(compile_representation(StubOutputSerializer), represent)
+
+    def test_many_and_each_use_the_active_timezone(self):
+        represent = compile_representation(StubOutputSerializer)
+        outputs = [
+            StubOutput(id=None, name=f'Movie {index}', count=index, is_active=True,
+                       created_at=datetime.datetime(2022, 1, 1, index, tzinfo=datetime.timezone.utc))
+            for index in range(3)
+        ]
+        with timezone.override('America/Sao_Paulo'):
+            expected = [StubOutputSerializer(instance=output).data for output in outputs]
+            self.assertEqual(represent.many(outputs), expected)
+            self.assertEqual(list(represent.each(iter(outputs))), expected)
+            self.assertEqual(represent(outputs[0]), expected[0])
+        self.assertEqual(expected[0]['created_at'], '2021-12-31T21:00:00-03:00')
+
+    def test_omit_none(self):
+        represent = compile_representation(PaginationSerializer, ('next_cursor',))
+        pagination = PaginationOutput(items=[], total=None, current_page=1, per_page=2, last_page=None)
+        self.assertEqual(represent(pagination), {
+            'total': None, 'current_page': 1, 'last_page': None, 'per_page': 2,
+            'has_more': None, 'count_mode': None, 'total_capped': None
+        })
+        self.assertEqual(
+            represent(replace(pagination, next_cursor='cursor'))['next_cursor'],
+            'cursor'
+        )
+        # mappings go through the serializer
+        self.assertEqual(represent({'current_page': '1', 'per_page': 2}), {
+            'total': None, 'current_page': 1, 'last_page': None, 'per_page': 2
+        })
+
+    def test_falls_back_to_the_serializer(self):
+        represent = compile_representation(StubNestedSerializer)
+        self.assertEqual(represent(StubNested('parent', StubNested('child', None))), {
+            'name': 'parent', 'child': {'name': 'child'}
+        })
+
+
+@dataclass
+class StubNested:
+    name: str
+    child: Optional['StubNested']
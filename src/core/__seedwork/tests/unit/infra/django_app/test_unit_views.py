@@ -0,0 +1,32 @@
+import unittest
+
+from asgiref.sync import async_to_sync
+from django.test import RequestFactory
+from core.__seedwork.infra.django_app.views import aiter_batches, streaming_content
+
+
+class TestStreamingContent(unittest.TestCase):
+
+    def test_keeps_the_iterator_under_wsgi(self):
+        content = iter([b'a', b'b'])
+        self.assertIs(streaming_content(RequestFactory().get('/'), content), content)
+
+    def test_iterates_in_batches_and_closes_the_iterator(self):
+        pulled = []
+
+        def generate():
+            try:
+                for index in range(5):
+                    pulled.append(index)
+                    yield index
+            finally:
+                pulled.append('closed')
+
+        async def consume():
+            seen = []
+            async for item in aiter_batches(generate(), 2):
+                seen.append((item, len(pulled)))
+            return seen
+
+        self.assertEqual(async_to_sync(consume)(), [(0, 2), (1, 2), (2, 4), (3, 4), (4, 6)])
+        self.assertEqual(pulled[-1], 'closed')
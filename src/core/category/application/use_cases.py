@@ -1,22 +1,39 @@
-from dataclasses import dataclass, asdict
-from typing import Optional
-from core.__seedwork.application.dto import PaginationOutput, PaginationOutputMapper, SearchInput
-from core.__seedwork.application.use_cases import UseCase
+from dataclasses import dataclass, asdict, field
+import datetime
+from typing import Dict, Iterable, Iterator, List, Optional
+from core.__seedwork.application.dto import (
+    BatchItemOutput,
+    BatchOutput,
+    PaginationOutput,
+    PaginationOutputMapper,
+    SearchInput,
+    VersionOutput
+)
+from core.__seedwork.application.unit_of_work import UnitOfWork
+from core.__seedwork.application.use_cases import AsyncUseCase, UseCase
+from core.__seedwork.domain.validators import ValidatedProps
 from core.category.application.dto import CategoryOutput, CategoryOutputMapper
 from core.category.domain.entities import Category
-from core.category.domain.repositories import CategoryRepository
+from core.category.domain.events import CategoryCreated
+from core.category.domain.repositories import AsyncCategoryRepository, CategoryRepository
+from core.category.domain.validators import CategoryValidatorFactory
 
 
 @dataclass(slots=True, frozen=True)
 class CreateCategoryUseCase(UseCase):
 
     category_repo: CategoryRepository
+    unit_of_work: Optional[UnitOfWork] = None
 
     def execute(self, input_param: 'Input') -> 'Output':
         category = Category(name=input_param.name,
                             description=input_param.description,
-                            is_active=input_param.is_active)
-        self.category_repo.insert(category)
+                            is_active=input_param.is_active,
+                            validated=input_param.validated)
+        if self.unit_of_work:
+            self.unit_of_work.insert(self.category_repo, category)
+        else:
+            self.category_repo.insert(category)
         return self.__to_output(category)
 
     def __to_output(self, category: Category):
@@ -29,6 +46,7 @@ class CreateCategoryUseCase(UseCase):
         name: str
         description: Optional[str] = Category.get_field('description').default
         is_active: Optional[bool] = Category.get_field('is_active').default
+        validated: Optional[ValidatedProps] = field(default=None, compare=False, repr=False)
 
     @dataclass(slots=True, frozen=True)
     class Output(CategoryOutput):
@@ -47,6 +65,11 @@ class GetCategoryUseCase(UseCase):
     def __to_output(self, category: Category):
         return CategoryOutputMapper.from_child(GetCategoryUseCase.Output).to_output(category)
 
+    # answers whether a client copy is still current without loading the entity
+    def get_version(self, input_param: 'Input') -> VersionOutput:
+        version = self.category_repo.find_version(input_param.id)
+        return VersionOutput.from_parts(version.updated_at, version.version)
+
     @dataclass(slots=True, frozen=True)
     class Input:
         id: str
@@ -90,18 +113,18 @@ class ListCategoriesUseCase(UseCase):
 class UpdateCategoryUseCase(UseCase):
 
     category_repo: CategoryRepository
+    unit_of_work: Optional[UnitOfWork] = None
 
     def execute(self, input_param: 'Input') -> 'Output':  # Arquitetura Hexagonal
-        entity = self.category_repo.find_by_id(input_param.id)
-        entity.update(input_param.name, input_param.description)
-
-        if input_param.is_active is True:
-            entity.activate()
-
-        if input_param.is_active is False:
-            entity.deactivate()
-
-        self.category_repo.update(entity)
+        entity = self.unit_of_work.find_by_id(self.category_repo, input_param.id) \
+            if self.unit_of_work else self.category_repo.find_by_id(input_param.id)
+        entity.change(
+            input_param.name, input_param.description, input_param.is_active, validated=input_param.validated)
+
+        if self.unit_of_work:
+            self.unit_of_work.update(self.category_repo, entity)
+        else:
+            self.category_repo.update(entity)
         return self.__to_output(entity)
 
     def __to_output(self, category: Category) -> 'Output':  # pylint: disable=no-self-use
@@ -116,6 +139,7 @@ class UpdateCategoryUseCase(UseCase):
         description: Optional[str] = Category.get_field(
             'description').default
         is_active: Optional[bool] = Category.get_field('is_active').default
+        validated: Optional[ValidatedProps] = field(default=None, compare=False, repr=False)
 
     @dataclass(slots=True, frozen=True)
     class Output(CategoryOutput):
@@ -126,10 +150,246 @@ class UpdateCategoryUseCase(UseCase):
 class DeleteCategoryUseCase(UseCase):
 
     category_repo: CategoryRepository
+    unit_of_work: Optional[UnitOfWork] = None
 
+    # inside a unit of work a missing id only fails when the unit flushes
     def execute(self, input_param: 'Input') -> None:
-        self.category_repo.delete(input_param.id)
+        if self.unit_of_work:
+            self.unit_of_work.delete(self.category_repo, input_param.id)
+        else:
+            self.category_repo.delete(input_param.id)
 
     @dataclass(slots=True, frozen=True)
     class Input:
         id: str  # pylint: disable=invalid-name
+
+
+@dataclass(slots=True, frozen=True)
+class ExportCategoriesUseCase(UseCase):
+
+    category_repo: CategoryRepository
+
+    # the categories are read while the output is consumed, one at a time
+    def execute(self, input_param: 'Input') -> Iterator[CategoryOutput]:
+        search_params = self.category_repo.SearchParams(**asdict(input_param))
+        return map(
+            CategoryOutputMapper.without_child().to_output,
+            self.category_repo.stream(search_params)
+        )
+
+    @dataclass(slots=True, frozen=True)
+    class Input:
+        sort: Optional[str] = None
+        sort_dir: Optional[str] = None
+        filter: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class CreateCategoriesUseCase(UseCase):
+
+    category_repo: CategoryRepository
+
+    def execute(self, input_param: 'Input') -> 'Output':
+        props = [
+            {'name': item.name, 'description': item.description, 'is_active': item.is_active}
+            for item in input_param.items
+        ]
+        errors = _validate_items(props, input_param.items)
+        # every item was validated just above, so build the entities
+        # without running the validator a second time
+        created_at = datetime.datetime.now(datetime.timezone.utc)
+        categories: Dict[int, Category] = {
+            index: Category.hydrate(**item_props, created_at=created_at, updated_at=created_at)
+            for index, item_props in enumerate(props) if index not in errors
+        }
+        # hydrate() skips __post_init__, where a new category records it
+        for category in categories.values():
+            category.record_event(CategoryCreated.of(category))
+        self.category_repo.bulk_insert(list(categories.values()))
+
+        output_mapper = CategoryOutputMapper.without_child()
+        return CreateCategoriesUseCase.Output(items=[
+            BatchItemOutput(index, data=output_mapper.to_output(categories[index]))
+            if index in categories else BatchItemOutput(index, errors=errors[index])
+            for index in range(len(props))
+        ])
+
+    @dataclass(slots=True, frozen=True)
+    class Input:
+        items: List[CreateCategoryUseCase.Input]
+
+    @dataclass(slots=True, frozen=True)
+    class Output(BatchOutput[CategoryOutput]):
+        pass
+
+
+@dataclass(slots=True, frozen=True)
+class UpdateCategoriesUseCase(UseCase):
+
+    category_repo: CategoryRepository
+
+    def execute(self, input_param: 'Input') -> 'Output':
+        categories = {
+            category.id: category for category in
+            self.category_repo.find_by_ids([item.id for item in input_param.items])
+        }
+        # checking the props an update changes up front keeps invalid items
+        # from touching the entities
+        errors = _validate_items(
+            (
+                {'name': item.name, 'description': item.description}
+                | ({} if item.is_active is None else {'is_active': item.is_active})
+                for item in input_param.items
+            ),
+            input_param.items
+        )
+
+        output_mapper = CategoryOutputMapper.without_child()
+        updated: Dict[str, Category] = {}
+        items = []
+        for index, item in enumerate(input_param.items):
+            category = categories.get(str(item.id))
+            if category is None:
+                items.append(_not_found_item(index, item.id))
+                continue
+            if index in errors:
+                items.append(BatchItemOutput(index, errors=errors[index]))
+                continue
+            category.change(item.name, item.description, item.is_active, validated=item.validated)
+            updated[category.id] = category
+            items.append(BatchItemOutput(index, data=output_mapper.to_output(category)))
+
+        self.category_repo.bulk_update(list(updated.values()))
+        return UpdateCategoriesUseCase.Output(items=items)
+
+    @dataclass(slots=True, frozen=True)
+    class Input:
+        items: List[UpdateCategoryUseCase.Input]
+
+    @dataclass(slots=True, frozen=True)
+    class Output(BatchOutput[CategoryOutput]):
+        pass
+
+
+@dataclass(slots=True, frozen=True)
+class DeleteCategoriesUseCase(UseCase):
+
+    category_repo: CategoryRepository
+
+    def execute(self, input_param: 'Input') -> 'Output':
+        ids = [str(entity_id) for entity_id in input_param.ids]
+        found_ids = {category.id for category in self.category_repo.find_by_ids(ids)}
+        self.category_repo.bulk_delete(
+            list(dict.fromkeys(entity_id for entity_id in ids if entity_id in found_ids)))
+        return DeleteCategoriesUseCase.Output(items=[
+            BatchItemOutput(index) if entity_id in found_ids else _not_found_item(index, entity_id)
+            for index, entity_id in enumerate(ids)
+        ])
+
+    @dataclass(slots=True, frozen=True)
+    class Input:
+        ids: List[str]
+
+    @dataclass(slots=True, frozen=True)
+    class Output(BatchOutput[CategoryOutput]):
+        pass
+
+
+# items the API already validated carry their token, so only the props it
+# does not cover go through the rules again
+def _validate_items(props: Iterable[Dict], items: List) -> Dict[int, Dict[str, List[str]]]:
+    validator = CategoryValidatorFactory.create()
+    return {
+        index: validator.errors
+        for index, (item_props, item) in enumerate(zip(props, items))
+        if not validator.validate(item_props, item.validated)
+    }
+
+
+def _not_found_item(index: int, entity_id: str) -> BatchItemOutput:
+    return BatchItemOutput(
+        index, errors={'id': [f"Entity not found using ID '{entity_id}'"]}, not_found=True)
+
+
+# coroutine versions of the single category use cases for the ASGI views;
+# they take the same Input and give the same Output as their sync twins
+
+@dataclass(slots=True, frozen=True)
+class AsyncCreateCategoryUseCase(AsyncUseCase):
+
+    category_repo: AsyncCategoryRepository
+
+    Input = CreateCategoryUseCase.Input
+    Output = CreateCategoryUseCase.Output
+
+    async def execute(self, input_param: 'Input') -> 'Output':
+        category = Category(name=input_param.name,
+                            description=input_param.description,
+                            is_active=input_param.is_active,
+                            validated=input_param.validated)
+        await self.category_repo.insert(category)
+        return CategoryOutputMapper.from_child(CreateCategoryUseCase.Output).to_output(category)
+
+
+@dataclass(slots=True, frozen=True)
+class AsyncGetCategoryUseCase(AsyncUseCase):
+
+    category_repo: AsyncCategoryRepository
+
+    Input = GetCategoryUseCase.Input
+    Output = GetCategoryUseCase.Output
+
+    async def execute(self, input_param: 'Input') -> 'Output':
+        category = await self.category_repo.find_by_id(input_param.id)
+        return CategoryOutputMapper.from_child(GetCategoryUseCase.Output).to_output(category)
+
+    async def get_version(self, input_param: 'Input') -> VersionOutput:
+        version = await self.category_repo.find_version(input_param.id)
+        return VersionOutput.from_parts(version.updated_at, version.version)
+
+
+@dataclass(slots=True, frozen=True)
+class AsyncListCategoriesUseCase(AsyncUseCase):
+
+    category_repo: AsyncCategoryRepository
+
+    Input = ListCategoriesUseCase.Input
+    Output = ListCategoriesUseCase.Output
+
+    async def execute(self, input_param: 'Input') -> 'Output':
+        search_params = self.category_repo.SearchParams(**asdict(input_param))
+        result = await self.category_repo.search(search_params)
+        items = list(
+            map(CategoryOutputMapper.without_child().to_output, result.items)
+        )
+        return PaginationOutputMapper.\
+            from_child(ListCategoriesUseCase.Output).\
+            to_output(items, result)
+
+
+@dataclass(slots=True, frozen=True)
+class AsyncUpdateCategoryUseCase(AsyncUseCase):
+
+    category_repo: AsyncCategoryRepository
+
+    Input = UpdateCategoryUseCase.Input
+    Output = UpdateCategoryUseCase.Output
+
+    async def execute(self, input_param: 'Input') -> 'Output':
+        entity = await self.category_repo.find_by_id(input_param.id)
+        entity.change(
+            input_param.name, input_param.description, input_param.is_active, validated=input_param.validated)
+
+        await self.category_repo.update(entity)
+        return CategoryOutputMapper.from_child(UpdateCategoryUseCase.Output).to_output(entity)
+
+
+@dataclass(slots=True, frozen=True)
+class AsyncDeleteCategoryUseCase(AsyncUseCase):
+
+    category_repo: AsyncCategoryRepository
+
+    Input = DeleteCategoryUseCase.Input
+
+    async def execute(self, input_param: 'Input') -> None:
+        await self.category_repo.delete(input_param.id)
@@ -1,8 +1,10 @@
 import datetime
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
 from typing import Optional
 from core.__seedwork.domain.entities import Entity
 from core.__seedwork.domain.exceptions import EntityValidationException
+from core.__seedwork.domain.validators import ValidatedProps
+from core.category.domain.events import CategoryCreated, CategoryUpdated
 from core.category.domain.validators import CategoryValidatorFactory
 
 
@@ -13,28 +15,63 @@ class Category(Entity):
     is_active: Optional[bool] = True
     created_at: Optional[datetime.datetime] = field(
         default_factory=lambda: datetime.datetime.now(datetime.timezone.utc))
+    updated_at: Optional[datetime.datetime] = None
+    version: Optional[int] = 1
+    # props the caller already ran through CategoryValidator, see ValidatedProps
+    validated: InitVar[Optional[ValidatedProps]] = None
 
-    def __post_init__(self):
+    def __post_init__(self, validated: Optional[ValidatedProps] = None):
         if not self.created_at:
             self._set('created_at', datetime.datetime.now(
                 datetime.timezone.utc))
-        self.validate()
+        if not self.updated_at:
+            self._set('updated_at', self.created_at)
+        self.validate(validated)
+        self.record_event(CategoryCreated.of(self))
 
-    def update(self, name: str, description: str = None):
+    def update(self, name: str, description: str = None, validated: Optional[ValidatedProps] = None):
+        self.change(name, description, validated=validated)
+
+    # applies a whole change set, so the version moves and CategoryUpdated
+    # is recorded once however many props it changes; is_active None keeps
+    # the current value
+    def change(
+        self,
+        name: str,
+        description: str = None,
+        is_active: Optional[bool] = None,
+        validated: Optional[ValidatedProps] = None
+    ):
+        changed = name != self.name or description != self.description \
+            or (is_active is not None and is_active != self.is_active)
         self._set('name', name)
         self._set('description', description)
-        self.validate()
+        if is_active is not None:
+            self._set('is_active', is_active)
+        self.validate(validated)
+        if changed:
+            self._touch()
 
     def activate(self):
-        self._set('is_active', True)
+        if not self.is_active:
+            self._set('is_active', True)
+            self._touch()
 
     def deactivate(self):
-        self._set('is_active', False)
+        if self.is_active:
+            self._set('is_active', False)
+            self._touch()
+
+    # every change moves updated_at and the version, which back the
+    # ETag/Last-Modified headers of the API, and is published as an event
+    def _touch(self):
+        self._set('updated_at', datetime.datetime.now(datetime.timezone.utc))
+        self._set('version', self.version + 1)
+        self.record_event(CategoryUpdated.of(self))
 
-    def validate(self):
+    def validate(self, validated: Optional[ValidatedProps] = None):
         validator = CategoryValidatorFactory.create()
-        is_valid = validator.validate(self.to_dict()
-                                      )
+        is_valid = validator.validate(self.to_dict(), validated)
         if not is_valid:
             raise EntityValidationException(validator.errors)
         
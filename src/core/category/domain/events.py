@@ -0,0 +1,50 @@
+import datetime
+from dataclasses import dataclass
+from typing import Optional, TYPE_CHECKING
+from core.__seedwork.domain.events import DomainEvent
+from core.__seedwork.domain.value_objects import UniqueEntityId
+
+if TYPE_CHECKING:
+    from core.category.domain.entities import Category
+
+
+# both events carry the whole category at the version they describe, so a
+# consumer can apply them without reading the category back
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CategoryEvent(DomainEvent):
+    name: str
+    description: Optional[str]
+    is_active: bool
+    created_at: datetime.datetime
+    version: int
+
+    @classmethod
+    def of(cls, category: 'Category') -> 'CategoryEvent':
+        return cls(
+            aggregate_id=category.id,
+            occurred_on=category.updated_at,
+            name=category.name,
+            description=category.description,
+            is_active=category.is_active,
+            created_at=category.created_at,
+            version=category.version
+        )
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CategoryCreated(CategoryEvent):
+    pass
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CategoryUpdated(CategoryEvent):
+    pass
+
+
+# the category is gone once it is deleted, so the event only names it
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CategoryDeleted(DomainEvent):
+
+    @classmethod
+    def of(cls, entity_id: 'str | UniqueEntityId') -> 'CategoryDeleted':
+        return cls(aggregate_id=UniqueEntityId(str(entity_id)).id)
@@ -1,9 +1,14 @@
-from abc import ABC
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+import datetime
+from typing import Iterator
 from core.__seedwork.domain.repositories import (
+    AsyncSearchableRepositoryInterface,
     SearchableRepositoryInterface,
     SearchParams as DefaultSearchParams,
     SearchResult as DefaultSearchResult
 )
+from core.__seedwork.domain.value_objects import UniqueEntityId
 from core.category.domain.entities import Category
 
 
@@ -15,6 +20,34 @@ class _SearchResult(DefaultSearchResult):  # pylint: disable=too-few-public-meth
     pass
 
 
+@dataclass(frozen=True, slots=True)
+class CategoryVersion:
+    version: int
+    updated_at: datetime.datetime
+
+
 class CategoryRepository(SearchableRepositoryInterface[Category, _SearchParams, _SearchResult], ABC):
     SearchParams = _SearchParams
     SearchResult = _SearchResult
+
+    @abstractmethod
+    def find_version(self, entity_id: str | UniqueEntityId) -> CategoryVersion:
+        raise NotImplementedError()
+
+    # every category the search matches, in its order and without paging,
+    # read lazily so the caller can stream any number of them
+    @abstractmethod
+    def stream(self, input_params: _SearchParams) -> Iterator[Category]:
+        raise NotImplementedError()
+
+
+class AsyncCategoryRepository(
+    AsyncSearchableRepositoryInterface[Category, _SearchParams, _SearchResult],
+    ABC
+):
+    SearchParams = _SearchParams
+    SearchResult = _SearchResult
+
+    @abstractmethod
+    async def find_version(self, entity_id: str | UniqueEntityId) -> CategoryVersion:
+        raise NotImplementedError()
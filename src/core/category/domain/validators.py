@@ -1,6 +1,5 @@
-from typing import Dict
 from rest_framework import serializers
-from core.__seedwork.domain.validators import DRFValidator, StrictBooleanField, StrictCharField
+from core.__seedwork.domain.validators import CompiledDRFValidator, StrictBooleanField, StrictCharField
 
 # pylint: disable=abstract-method
 
@@ -11,12 +10,12 @@ class CategoryRules(serializers.Serializer):
         required=False, allow_null=True, allow_blank=True)
     is_active = StrictBooleanField(required=False)
     created_at = serializers.DateTimeField(required=False)
+    updated_at = serializers.DateTimeField(required=False)
+    version = serializers.IntegerField(required=False, min_value=1)
 
 
-class CategoryValidator(DRFValidator):
-    def validate(self, data: Dict) -> bool:
-        rules = CategoryRules(data=data if data is not None else {})
-        return super().validate(rules)
+class CategoryValidator(CompiledDRFValidator):
+    rules = CategoryRules
 
 
 class CategoryValidatorFactory:
@@ -1,22 +1,46 @@
-from typing import Callable
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import uuid
+from django.http import HttpResponseBase, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
 from rest_framework.response import Response
 from rest_framework.request import Request
+from core.__seedwork.application.dto import BatchOutput, VersionOutput
+from core.__seedwork.domain.validators import CompiledDRFValidator, ValidatedProps
 from core.category.application.dto import CategoryOutput
+from core.category.domain.validators import CategoryValidatorFactory
 from core.category.application.use_cases import (
+    AsyncCreateCategoryUseCase,
+    AsyncDeleteCategoryUseCase,
+    AsyncGetCategoryUseCase,
+    AsyncListCategoriesUseCase,
+    AsyncUpdateCategoryUseCase,
+    CreateCategoriesUseCase,
     CreateCategoryUseCase,
+    DeleteCategoriesUseCase,
     DeleteCategoryUseCase,
+    ExportCategoriesUseCase,
     GetCategoryUseCase,
     ListCategoriesUseCase,
+    UpdateCategoriesUseCase,
     UpdateCategoryUseCase
 )
 from dataclasses import dataclass
+from rest_framework.exceptions import ValidationError
 from rest_framework.views import APIView
-from rest_framework import status
+from rest_framework import serializers, status
 
-from core.__seedwork.infra.django_app.serializers import UUIDSerializer
+from core.__seedwork.infra.django_app.renderers import CSVRenderer, NDJSONRenderer
+from core.__seedwork.infra.django_app.serializers import UUIDSerializer, compile_representation
+from core.__seedwork.infra.django_app.views import AsyncAPIView, streaming_content
 from core.category.infra.django_app.serializers import CategoryCollectionSerializer, CategorySerializer
 
 
+class CategoryBodyValidator(CompiledDRFValidator):
+    rules = CategorySerializer
+
+
 @dataclass(slots=True)
 class CategoryResource(APIView):
     create_use_case: Callable[[], CreateCategoryUseCase]
@@ -26,11 +50,8 @@ class CategoryResource(APIView):
     delete_use_case: Callable[[], DeleteCategoryUseCase]
 
     def post(self, request: Request):
-
-        serializer = CategorySerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-
-        input_param = CreateCategoryUseCase.Input(**serializer.validated_data)
+        validated = CategoryResource.validate_body(request.data)
+        input_param = CreateCategoryUseCase.Input(**validated.props, validated=validated)
         output = self.create_use_case().execute(input_param)
         body = CategoryResource.category_to_response(output)
         return Response(body, status=status.HTTP_201_CREATED)
@@ -43,22 +64,25 @@ class CategoryResource(APIView):
         output_param = self.list_use_case().execute(input_param)
         data = CategoryCollectionSerializer(
             instance=output_param).data
-        return Response(data)
+        return CategoryResource.list_response(request, data)
 
     def get_object(self, id: str):
         CategoryResource.validate_id(id)
         input_param = GetCategoryUseCase.Input(id)
-        output_param = self.get_use_case().execute(input_param)
+        get_use_case = self.get_use_case()
+        version = get_use_case.get_version(input_param)
+        not_modified = CategoryResource.not_modified(getattr(self, 'request', None), version)
+        if not_modified is not None:
+            return not_modified
+        output_param = get_use_case.execute(input_param)
         body = CategoryResource.category_to_response(output_param)
-        return Response(body)
+        return CategoryResource.with_version(Response(body), version)
 
     def put(self, request: Request, id: str):
         CategoryResource.validate_id(id)
-        serializer = CategorySerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-
+        validated = CategoryResource.validate_body(request.data)
         input_param = UpdateCategoryUseCase.Input(
-            **{'id': id,  **serializer.validated_data})
+            **{'id': id, **validated.props}, validated=validated)
         output_param = self.update_use_case().execute(input_param)
         body = CategoryResource.category_to_response(output_param)
         return Response(body)
@@ -71,10 +95,228 @@ class CategoryResource(APIView):
 
     @staticmethod
     def category_to_response(output: CategoryOutput):
-        serializer = CategorySerializer(instance=output)
-        return serializer.data
+        return compile_representation(CategorySerializer)(output)
+
+    # a list has no single updated_at to check before loading it, so its
+    # version is taken from the page served, with no query of its own, and
+    # it only answers 304 through If-None-Match
+    @staticmethod
+    def list_response(request: Request, data: Dict) -> HttpResponseBase:
+        version = VersionOutput.from_content(json.dumps(data, default=str).encode())
+        not_modified = CategoryResource.not_modified(request, version, use_last_modified=False)
+        if not_modified is not None:
+            return not_modified
+        return CategoryResource.with_version(Response(data), version)
+
+    @staticmethod
+    def not_modified(
+        request: Optional[Request],
+        version: VersionOutput,
+        use_last_modified: bool = True
+    ) -> Optional[HttpResponseBase]:
+        if request is None:
+            return None
+        last_modified = int(version.updated_at.timestamp()) \
+            if use_last_modified and version.updated_at else None
+        response = get_conditional_response(
+            request, etag=quote_etag(version.tag), last_modified=last_modified)
+        return None if response is None else CategoryResource.with_version(response, version)
+
+    @staticmethod
+    def with_version(response: HttpResponseBase, version: VersionOutput) -> HttpResponseBase:
+        response['ETag'] = quote_etag(version.tag)
+        if version.updated_at:
+            response['Last-Modified'] = http_date(version.updated_at.timestamp())
+        return response
 
+    # the body is checked with the API serializer, which converts what
+    # clients send ("true", form booleans...), then its validated data with
+    # the domain rules; the token lets the entity skip them for the props it
+    # receives unchanged
     @staticmethod
-    def validate_id(id: str):
+    def validate_body(data: Any) -> ValidatedProps:
+        body_validator = CategoryBodyValidator()
+        if not body_validator.validate(data):
+            raise ValidationError(body_validator.errors)
+        validator = CategoryValidatorFactory.create()
+        if not validator.validate(body_validator.validated_data):
+            raise ValidationError(validator.errors)
+        return validator.validated_props()
+
+    @staticmethod
+    def validate_id(id: str | uuid.UUID):
+        # ids from the <uuid:id> route were already parsed by its converter
+        if isinstance(id, uuid.UUID):
+            return
         serializer = UUIDSerializer(data={'id': id})
         serializer.is_valid(raise_exception=True)
+
+
+@dataclass(slots=True)
+class AsyncCategoryResource(AsyncAPIView):
+    create_use_case: Callable[[], AsyncCreateCategoryUseCase]
+    list_use_case: Callable[[], AsyncListCategoriesUseCase]
+    get_use_case: Callable[[], AsyncGetCategoryUseCase]
+    update_use_case: Callable[[], AsyncUpdateCategoryUseCase]
+    delete_use_case: Callable[[], AsyncDeleteCategoryUseCase]
+
+    async def post(self, request: Request):
+        validated = CategoryResource.validate_body(request.data)
+        input_param = AsyncCreateCategoryUseCase.Input(**validated.props, validated=validated)
+        output = await self.create_use_case().execute(input_param)
+        body = CategoryResource.category_to_response(output)
+        return Response(body, status=status.HTTP_201_CREATED)
+
+    async def get(self, request: Request, id: str = None):
+        if id:
+            return await self.get_object(id)
+        input_param = AsyncListCategoriesUseCase.Input(
+            **request.query_params.dict())
+        output_param = await self.list_use_case().execute(input_param)
+        data = CategoryCollectionSerializer(
+            instance=output_param).data
+        return CategoryResource.list_response(request, data)
+
+    async def get_object(self, id: str):
+        CategoryResource.validate_id(id)
+        input_param = AsyncGetCategoryUseCase.Input(id)
+        get_use_case = self.get_use_case()
+        version = await get_use_case.get_version(input_param)
+        not_modified = CategoryResource.not_modified(getattr(self, 'request', None), version)
+        if not_modified is not None:
+            return not_modified
+        output_param = await get_use_case.execute(input_param)
+        body = CategoryResource.category_to_response(output_param)
+        return CategoryResource.with_version(Response(body), version)
+
+    async def put(self, request: Request, id: str):
+        CategoryResource.validate_id(id)
+        validated = CategoryResource.validate_body(request.data)
+        input_param = AsyncUpdateCategoryUseCase.Input(
+            **{'id': id, **validated.props}, validated=validated)
+        output_param = await self.update_use_case().execute(input_param)
+        body = CategoryResource.category_to_response(output_param)
+        return Response(body)
+
+    async def delete(self, _request: Request, id: str):
+        CategoryResource.validate_id(id)
+        input_param = AsyncDeleteCategoryUseCase.Input(id=id)
+        await self.delete_use_case().execute(input_param)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+@dataclass(slots=True)
+class CategoryBatchResource(APIView):
+    create_use_case: Callable[[], CreateCategoriesUseCase]
+    update_use_case: Callable[[], UpdateCategoriesUseCase]
+    delete_use_case: Callable[[], DeleteCategoriesUseCase]
+    max_items: int = 1000
+
+    def post(self, request: Request):
+        items, errors = self.validate_items(request.data, CategoryResource.validate_body)
+        input_param = CreateCategoriesUseCase.Input(items=[
+            CreateCategoryUseCase.Input(**validated.props, validated=validated)
+            for validated in items.values()
+        ])
+        output = self.create_use_case().execute(input_param)
+        return self.batch_to_response(items, errors, output, status.HTTP_201_CREATED)
+
+    def put(self, request: Request):
+        items, errors = self.validate_items(request.data, CategoryBatchResource.validate_update_item)
+        input_param = UpdateCategoriesUseCase.Input(items=[
+            UpdateCategoryUseCase.Input(**{'id': entity_id, **validated.props}, validated=validated)
+            for entity_id, validated in items.values()
+        ])
+        output = self.update_use_case().execute(input_param)
+        return self.batch_to_response(items, errors, output, status.HTTP_200_OK)
+
+    def delete(self, request: Request):
+        items, errors = self.validate_items(request.data, serializers.UUIDField().run_validation)
+        input_param = DeleteCategoriesUseCase.Input(
+            ids=[str(entity_id) for entity_id in items.values()])
+        output = self.delete_use_case().execute(input_param)
+        return self.batch_to_response(items, errors, output, status.HTTP_200_OK)
+
+    # items that fail are answered with their errors and never reach the use
+    # case; category props go through the same domain rules as single writes
+    def validate_items(
+        self, data: Any, validate_item: Callable[[Any], Any]
+    ) -> Tuple[Dict[int, Any], Dict[int, Any]]:
+        data = serializers.ListField(
+            allow_empty=False, max_length=self.max_items).run_validation(data)
+        items = {}
+        errors = {}
+        for index, item in enumerate(data):
+            try:
+                items[index] = validate_item(item)
+            except ValidationError as exception:
+                errors[index] = exception.detail \
+                    if isinstance(exception.detail, dict) else {'id': exception.detail}
+        return items, errors
+
+    @staticmethod
+    def validate_update_item(data: Any) -> Tuple[str, ValidatedProps]:
+        id_serializer = UUIDSerializer(data=data)
+        id_is_valid = id_serializer.is_valid()
+        try:
+            validated = CategoryResource.validate_body(data)
+        except ValidationError as exception:
+            raise ValidationError({**id_serializer.errors, **exception.detail}) from exception
+        if not id_is_valid:
+            raise ValidationError(id_serializer.errors)
+        return str(id_serializer.validated_data['id']), validated
+
+    @staticmethod
+    def batch_to_response(
+        items: Dict[int, Any],
+        errors: Dict[int, Any],
+        output: BatchOutput[CategoryOutput],
+        success_status: int
+    ) -> Response:
+        results: List[Dict[str, Any]] = [None] * (len(items) + len(errors))
+        for index, item_errors in errors.items():
+            results[index] = {'index': index, 'status': status.HTTP_400_BAD_REQUEST, 'errors': item_errors}
+
+        indexes = list(items.keys())
+        for item in output.items:
+            index = indexes[item.index]
+            if item.succeeded:
+                results[index] = {'index': index, 'status': success_status}
+                if item.data is not None:
+                    results[index]['data'] = CategoryResource.category_to_response(item.data)
+            else:
+                results[index] = {
+                    'index': index,
+                    'status': status.HTTP_404_NOT_FOUND if item.not_found else status.HTTP_400_BAD_REQUEST,
+                    'errors': item.errors
+                }
+
+        all_succeeded = all(result['status'] == success_status for result in results)
+        return Response(
+            {'data': results},
+            status=success_status if all_succeeded else status.HTTP_207_MULTI_STATUS
+        )
+
+
+@dataclass(slots=True)
+class CategoryExportResource(APIView):
+    export_use_case: Callable[[], ExportCategoriesUseCase]
+    renderer_classes = [NDJSONRenderer, CSVRenderer]
+
+    # the rows are serialized while the response is sent, so the whole
+    # catalog is never held in memory, under WSGI or ASGI
+    def get(self, request: Request):
+        input_param = ExportCategoriesUseCase.Input(**{
+            name: request.query_params.get(name)
+            for name in ('sort', 'sort_dir', 'filter')
+        })
+        output = self.export_use_case().execute(input_param)
+        renderer = request.accepted_renderer
+        content = renderer.render_stream(
+            compile_representation(CategorySerializer).each(output), list(CategorySerializer().fields))
+        response = StreamingHttpResponse(
+            streaming_content(request, content),
+            content_type=f'{renderer.media_type}; charset={renderer.charset}'
+        )
+        response['Content-Disposition'] = f'attachment; filename="categories.{renderer.format}"'
+        return response
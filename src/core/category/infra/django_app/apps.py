@@ -1,7 +1,11 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class CategoryConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "core.category.infra.django_app"
-    
+
+    def ready(self):
+        from core.category.infra.django_app.name_search import repair_name_search_after_migrate
+        post_migrate.connect(repair_name_search_after_migrate, sender=self)
@@ -0,0 +1,234 @@
+import contextlib
+import copy
+import datetime
+import json
+import math
+import os
+import random
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from django.db import DEFAULT_DB_ALIAS, connections, reset_queries
+
+from core.__seedwork.domain.repositories import iter_batches
+from core.category.application.use_cases import (
+    CreateCategoryUseCase,
+    DeleteCategoryUseCase,
+    GetCategoryUseCase,
+    ListCategoriesUseCase,
+    UpdateCategoryUseCase
+)
+from core.category.domain.entities import Category
+from core.category.domain.repositories import CategoryRepository
+from core.category.infra.django_app.repositories import CategoryDjangoRepository
+from core.category.infra.in_memory.repositories import CategoryInMemoryRepository
+
+# the use cases run against each repository, in this order; the writes come
+# last so the reads see exactly the seeded rows
+SCENARIOS = ('get', 'list_filtered', 'list_sorted', 'list_deep_page', 'update', 'create', 'delete')
+
+REPOSITORIES: Dict[str, Callable[[], CategoryRepository]] = {
+    'in_memory': CategoryInMemoryRepository,
+    'django': CategoryDjangoRepository,
+}
+# the repositories that write to the database, and get a throwaway one
+DATABASE_REPOSITORIES = ('django',)
+
+BASELINES = os.path.join(os.path.dirname(__file__), 'baselines.json')
+
+SEED_BATCH_SIZE = 10000
+PER_PAGE = 15
+
+
+@dataclass(slots=True, frozen=True)
+class BenchmarkResult:
+    repository: str
+    rows: int
+    scenario: str
+    operations: int
+    ops_per_sec: float
+    p50_us: float
+    p99_us: float
+
+    @property
+    def key(self) -> str:
+        return f'{self.repository}/{self.rows}/{self.scenario}'
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            'operations': self.operations,
+            'ops_per_sec': round(self.ops_per_sec, 1),
+            'p50_us': round(self.p50_us, 1),
+            'p99_us': round(self.p99_us, 1),
+        }
+
+
+# nearest-rank percentile of samples sorted in ascending order
+def percentile(samples: List[float], fraction: float) -> float:
+    return samples[max(0, min(len(samples) - 1, math.ceil(fraction * len(samples)) - 1))]
+
+
+# runs warmup + iterations operations, each with its own index, but stops
+# early once the timed ones took time_limit seconds (the warmup a fifth of
+# that), so the slow scenarios of the large tables still finish
+def measure(
+    operation: Callable[[int], None], iterations: int, warmup: int, time_limit: float
+) -> Tuple[int, float, float, float]:
+    started = time.perf_counter()
+    index = 0
+    while index < warmup and time.perf_counter() - started < time_limit / 5:
+        operation(index)
+        index += 1
+    samples = []
+    elapsed = 0.0
+    for index in range(warmup, warmup + iterations):
+        operation_started = time.perf_counter()
+        operation(index)
+        samples.append(time.perf_counter() - operation_started)
+        elapsed += samples[-1]
+        if elapsed >= time_limit:
+            break
+    samples.sort()
+    return (
+        len(samples),
+        len(samples) / elapsed,
+        percentile(samples, 0.5) * 1e6,
+        percentile(samples, 0.99) * 1e6
+    )
+
+
+# rows named 'Category 0000042' with distinct created_at values, so name
+# filters hit a predictable share of them and every sort is stable
+def seed_categories(rows: int) -> Iterator[Category]:
+    created_at = datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc)
+    for index in range(rows):
+        row_created_at = created_at + datetime.timedelta(seconds=index)
+        yield Category.hydrate(
+            name=f'Category {index:07d}',
+            created_at=row_created_at,
+            updated_at=row_created_at
+        )
+
+
+@contextlib.contextmanager
+def throwaway_database(alias: str = DEFAULT_DB_ALIAS) -> Iterator[None]:
+    """
+    Points alias, in this thread, at a new database built from the
+    migrations (a temporary file for SQLite, the test database of the
+    others) and drops it on the way out. The configured database, and any
+    transaction open on it, is never touched.
+    """
+    original = connections[alias]
+    settings_dict = copy.deepcopy(original.settings_dict)
+    with tempfile.TemporaryDirectory() as directory:
+        if original.vendor == 'sqlite':
+            settings_dict['TEST'] = {**settings_dict['TEST'], 'NAME': os.path.join(directory, 'benchmark.sqlite3')}
+        connection = type(original)(settings_dict, alias)
+        connections[alias] = connection
+        # create_test_db() renames the alias in the settings as well, which
+        # the configured connection shares
+        name = settings_dict['NAME']
+        try:
+            connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+            try:
+                yield
+            finally:
+                connection.creation.destroy_test_db(name, verbosity=0)
+        finally:
+            connections[alias] = original
+
+
+def seed(repository: CategoryRepository, rows: int) -> List[str]:
+    ids = []
+    for batch in iter_batches(seed_categories(rows), SEED_BATCH_SIZE):
+        repository.bulk_insert(batch)
+        ids.extend(category.id for category in batch)
+    return ids
+
+
+def scenarios(
+    repository: CategoryRepository, ids: List[str], deleted_ids: List[str], rng: random.Random
+) -> Dict[str, Callable[[int], None]]:
+    create = CreateCategoryUseCase(repository)
+    get = GetCategoryUseCase(repository)
+    list_categories = ListCategoriesUseCase(repository)
+    update = UpdateCategoryUseCase(repository)
+    delete = DeleteCategoryUseCase(repository)
+    last_page = max(1, len(ids) // PER_PAGE)
+
+    return {
+        'get': lambda index: get.execute(GetCategoryUseCase.Input(id=rng.choice(ids))),
+        'list_filtered': lambda index: list_categories.execute(ListCategoriesUseCase.Input(
+            filter=f'{rng.randrange(1000):03d}', per_page=PER_PAGE)),
+        'list_sorted': lambda index: list_categories.execute(ListCategoriesUseCase.Input(
+            sort='name', sort_dir='asc', page=rng.randint(1, min(10, last_page)), per_page=PER_PAGE)),
+        'list_deep_page': lambda index: list_categories.execute(ListCategoriesUseCase.Input(
+            page=last_page - rng.randrange(min(10, last_page)), per_page=PER_PAGE)),
+        'update': lambda index: update.execute(UpdateCategoryUseCase.Input(
+            id=rng.choice(ids), name=f'Updated {index:07d}')),
+        'create': lambda index: create.execute(CreateCategoryUseCase.Input(name=f'Created {index:07d}')),
+        'delete': lambda index: delete.execute(DeleteCategoryUseCase.Input(id=deleted_ids[index])),
+    }
+
+
+def run_benchmarks(
+    repository_name: str,
+    rows: int,
+    iterations: int,
+    warmup: int,
+    time_limit: float,
+    selected: Tuple[str, ...] = SCENARIOS,
+    seed_value: int = 0
+) -> Iterator[BenchmarkResult]:
+    """
+    Seeds a fresh repository with rows categories, plus the ones the delete
+    scenario removes, and times each selected scenario. The Django
+    repository gets a throwaway database, so every write commits as it
+    would in production and the configured database is left alone.
+    """
+    database = throwaway_database() if repository_name in DATABASE_REPOSITORIES else contextlib.nullcontext()
+    with database:
+        repository = REPOSITORIES[repository_name]()
+        deletions = (warmup + iterations) if 'delete' in selected else 0
+        all_ids = seed(repository, rows + deletions)
+        ids, deleted_ids = all_ids[:rows], all_ids[rows:]
+        operations = scenarios(repository, ids, deleted_ids, random.Random(seed_value))
+        for name in SCENARIOS:
+            if name not in selected:
+                continue
+            # with DEBUG on, the logged queries would be timed as well
+            reset_queries()
+            yield BenchmarkResult(
+                repository_name, rows, name, *measure(operations[name], iterations, warmup, time_limit))
+        reset_queries()
+
+
+def load_baselines(path: str) -> Dict[str, Dict[str, float]]:
+    try:
+        with open(path, encoding='utf-8') as file:
+            return json.load(file)['results']
+    except FileNotFoundError:
+        return {}
+
+
+def save_baselines(path: str, results: List[BenchmarkResult]) -> None:
+    baselines = load_baselines(path)
+    baselines.update({result.key: result.to_dict() for result in results})
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump({'results': dict(sorted(baselines.items()))}, file, indent=2)
+        file.write('\n')
+
+
+# a result regresses when its throughput falls more than threshold (a
+# fraction) below the baseline; p50/p99 are reported but too noisy at small
+# iteration counts to fail a run on their own
+def regressions(
+    results: List[BenchmarkResult], baselines: Dict[str, Dict[str, float]], threshold: float
+) -> List[Tuple[BenchmarkResult, Dict[str, float]]]:
+    return [
+        (result, baselines[result.key]) for result in results
+        if result.key in baselines
+        and result.ops_per_sec < baselines[result.key]['ops_per_sec'] * (1 - threshold)
+    ]
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from core.category.infra.django_app.name_search import (
+    NAME_SEARCH_TABLE,
+    create_name_search,
+    rebuild_name_search
+)
+
+
+class Command(BaseCommand):
+    help = (
+        f"Creates the {NAME_SEARCH_TABLE} full-text index if it is missing and "
+        "rebuilds it from the categories table. Run it after restoring a "
+        "database or after VACUUM, which may renumber the categories rowids."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **options):
+        connection = connections[options['database']]
+        if not create_name_search(connection):
+            raise CommandError(
+                f"The '{connection.vendor}' database does not support the FTS5 "
+                "trigram tokenizer; category name search keeps using LIKE.")
+
+        rebuild_name_search(connection)
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT COUNT(*) FROM categories')
+            total = cursor.fetchone()[0]
+        self.stdout.write(self.style.SUCCESS(
+            f"Indexed {total} category names in {NAME_SEARCH_TABLE}."))
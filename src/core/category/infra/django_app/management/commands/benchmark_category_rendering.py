@@ -0,0 +1,68 @@
+import datetime
+import time
+from typing import Any, Callable, Dict
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+
+from core.__seedwork.application.dto import PaginationOutput
+from core.__seedwork.infra.django_app.serializers import PaginationSerializer
+from core.category.application.dto import CategoryOutputMapper
+from core.category.domain.entities import Category
+from core.category.infra.django_app.api import CategoryResource
+from core.category.infra.django_app.serializers import CategoryCollectionSerializer, CategorySerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures the CPU time to turn category outputs into JSON bytes, "
+        "walking the DRF serializers field by field against the compiled "
+        "representations the category views use. No database is involved."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--per-page', type=int, default=15)
+        parser.add_argument('--iterations', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        per_page, iterations = options['per_page'], options['iterations']
+        if per_page < 1 or iterations < 1:
+            raise CommandError('--per-page and --iterations must be positive.')
+
+        created_at = datetime.datetime.now(datetime.timezone.utc)
+        mapper = CategoryOutputMapper.without_child()
+        items = [
+            mapper.to_output(Category(name=f'Movie {index}', description='description', created_at=created_at))
+            for index in range(per_page)
+        ]
+        page = PaginationOutput(items=items, total=per_page * 10, current_page=1, per_page=per_page, last_page=10)
+        renderer = JSONRenderer()
+
+        def serializer_page():
+            return {
+                'data': serializers.ListSerializer(child=CategorySerializer(), instance=items).data,
+                'meta': PaginationSerializer(page).data
+            }
+
+        scenarios = [
+            ('object', lambda: CategorySerializer(instance=items[0]).data,
+             lambda: CategoryResource.category_to_response(items[0])),
+            (f'page of {per_page}', serializer_page,
+             lambda: CategoryCollectionSerializer(instance=page).data),
+        ]
+        for name, serializer, compiled in scenarios:
+            if renderer.render(serializer()) != renderer.render(compiled()):
+                raise CommandError(f'The compiled {name} does not match the serializer.')
+            before = self.measure(serializer, renderer, iterations)
+            after = self.measure(compiled, renderer, iterations)
+            self.stdout.write(
+                f'{name}: serializers {before:.1f} µs, compiled {after:.1f} µs '
+                f'per response ({before / after:.1f}x)')
+
+    @staticmethod
+    def measure(represent: Callable[[], Dict[str, Any]], renderer: JSONRenderer, iterations: int) -> float:
+        started = time.process_time()
+        for _ in range(iterations):
+            renderer.render(represent())
+        return (time.process_time() - started) / iterations * 1e6
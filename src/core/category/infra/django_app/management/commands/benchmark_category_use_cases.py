@@ -0,0 +1,81 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.category.infra.django_app.benchmarks.use_cases import (
+    BASELINES,
+    REPOSITORIES,
+    SCENARIOS,
+    load_baselines,
+    regressions,
+    run_benchmarks,
+    save_baselines
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Times the category use cases (get, filtered, sorted and deep page "
+        "lists, update, create, delete) against the in-memory and the Django "
+        "repositories seeded with each --rows count, and reports ops/s, p50 "
+        "and p99. Results are compared with the JSON baselines; the command "
+        "fails when the throughput of any of them drops by more than "
+        "--threshold. --save-baseline records the results instead."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, nargs='+', default=[1000, 100000, 1000000])
+        parser.add_argument('--repository', choices=sorted(REPOSITORIES), nargs='+',
+                            default=list(REPOSITORIES))
+        parser.add_argument('--scenario', choices=SCENARIOS, nargs='+', default=list(SCENARIOS))
+        parser.add_argument('--iterations', type=int, default=200)
+        parser.add_argument('--warmup', type=int, default=20)
+        parser.add_argument('--time-limit', type=float, default=10.0,
+                            help='Seconds after which a scenario stops before --iterations.')
+        parser.add_argument('--baseline', default=BASELINES)
+        parser.add_argument('--threshold', type=float, default=0.25,
+                            help='Allowed drop in ops/s, as a fraction of the baseline.')
+        parser.add_argument('--save-baseline', action='store_true')
+
+    def handle(self, *args, **options):
+        if min(options['rows']) < 1 or options['iterations'] < 1 or options['warmup'] < 0:
+            raise CommandError('--rows and --iterations must be positive, --warmup not negative.')
+        if options['time_limit'] <= 0:
+            raise CommandError('--time-limit must be positive.')
+        if not 0 <= options['threshold'] < 1:
+            raise CommandError('--threshold must be a fraction between 0 and 1.')
+
+        baselines = load_baselines(options['baseline'])
+        results = []
+        for repository in options['repository']:
+            for rows in options['rows']:
+                for result in run_benchmarks(
+                    repository, rows, options['iterations'], options['warmup'], options['time_limit'],
+                    tuple(options['scenario'])
+                ):
+                    results.append(result)
+                    self.stdout.write(self.describe(result, baselines.get(result.key)))
+
+        if options['save_baseline']:
+            save_baselines(options['baseline'], results)
+            self.stdout.write(self.style.SUCCESS(
+                f"Saved {len(results)} baselines to {options['baseline']}."))
+            return
+
+        regressed = regressions(results, baselines, options['threshold'])
+        if regressed:
+            raise CommandError('Throughput regressed by more than {:.0%}: {}'.format(
+                options['threshold'],
+                ', '.join(
+                    f"{result.key} {result.ops_per_sec:.1f} ops/s (baseline {baseline['ops_per_sec']:.1f})"
+                    for result, baseline in regressed)))
+        compared = sum(result.key in baselines for result in results)
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(results)} benchmarks, {compared} compared with a baseline, no regression.'))
+
+    @staticmethod
+    def describe(result, baseline) -> str:
+        line = (
+            f'{result.key}: {result.operations} ops, {result.ops_per_sec:.1f} ops/s, '
+            f'p50 {result.p50_us:.1f} µs, p99 {result.p99_us:.1f} µs')
+        if baseline:
+            line += f" ({result.ops_per_sec / baseline['ops_per_sec'] - 1:+.0%} vs baseline)"
+        return line
@@ -0,0 +1,118 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+from asgiref.sync import async_to_sync
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import AsyncRequestFactory, RequestFactory
+
+from core.category.application.use_cases import (
+    AsyncCreateCategoryUseCase,
+    AsyncDeleteCategoryUseCase,
+    AsyncGetCategoryUseCase,
+    AsyncListCategoriesUseCase,
+    AsyncUpdateCategoryUseCase,
+    CreateCategoryUseCase,
+    DeleteCategoryUseCase,
+    GetCategoryUseCase,
+    ListCategoriesUseCase,
+    UpdateCategoryUseCase
+)
+from core.category.infra.django_app.api import AsyncCategoryResource, CategoryResource
+from core.category.infra.django_app.repositories import (
+    CategoryDjangoAsyncRepository,
+    CategoryDjangoRepository
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Sends the same GET to the sync and to the async category views with "
+        "the given concurrency and reports the throughput of each. Sync "
+        "requests run on a thread pool, async ones on a single event loop."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', default='/categories?per_page=15')
+        parser.add_argument('--requests', type=int, default=500)
+        parser.add_argument('--concurrency', type=int, default=16)
+
+    def handle(self, *args, **options):
+        path, total, concurrency = options['path'], options['requests'], options['concurrency']
+        if total < 1 or concurrency < 1:
+            raise CommandError('--requests and --concurrency must be positive.')
+
+        # both stacks read straight from the database, the sync one without
+        # the caching repository the container gives it
+        repository = CategoryDjangoRepository()
+        async_repository = CategoryDjangoAsyncRepository()
+        sync_view = CategoryResource.as_view(
+            create_use_case=lambda: CreateCategoryUseCase(repository),
+            list_use_case=lambda: ListCategoriesUseCase(repository),
+            get_use_case=lambda: GetCategoryUseCase(repository),
+            update_use_case=lambda: UpdateCategoryUseCase(repository),
+            delete_use_case=lambda: DeleteCategoryUseCase(repository)
+        )
+        async_view = AsyncCategoryResource.as_view(
+            create_use_case=lambda: AsyncCreateCategoryUseCase(async_repository),
+            list_use_case=lambda: AsyncListCategoriesUseCase(async_repository),
+            get_use_case=lambda: AsyncGetCategoryUseCase(async_repository),
+            update_use_case=lambda: AsyncUpdateCategoryUseCase(async_repository),
+            delete_use_case=lambda: AsyncDeleteCategoryUseCase(async_repository)
+        )
+
+        for name, run in (('sync', self.run_sync), ('async', self.run_async)):
+            started = time.perf_counter()
+            run(sync_view if name == 'sync' else async_view, path, total, concurrency)
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f"{name:>5}: {total} requests, concurrency {concurrency}, "
+                f"{elapsed:.3f}s, {total / elapsed:.1f} req/s")
+
+    @staticmethod
+    def run_sync(view, path: str, total: int, concurrency: int) -> None:
+        factory = RequestFactory()
+
+        def worker(requests: int) -> None:
+            try:
+                for _ in range(requests):
+                    Command.check_response(view(factory.get(path)).render())
+            finally:
+                connections.close_all()
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for future in [
+                executor.submit(worker, requests)
+                for requests in Command.split(total, concurrency)
+            ]:
+                future.result()
+
+    @staticmethod
+    def run_async(view, path: str, total: int, concurrency: int) -> None:
+        factory = AsyncRequestFactory()
+
+        async def worker(requests: int) -> None:
+            for _ in range(requests):
+                response = await view(factory.get(path))
+                Command.check_response(response.render())
+
+        async def run() -> None:
+            await asyncio.gather(*[
+                worker(requests) for requests in Command.split(total, concurrency)
+            ])
+
+        async_to_sync(run)()
+
+    @staticmethod
+    def split(total: int, parts: int):
+        return [
+            total // parts + (1 if index < total % parts else 0)
+            for index in range(min(parts, total))
+        ]
+
+    @staticmethod
+    def check_response(response) -> None:
+        if response.status_code >= 400:
+            raise CommandError(
+                f"The view answered {response.status_code}: {response.content[:200]!r}")
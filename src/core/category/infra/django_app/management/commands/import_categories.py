@@ -0,0 +1,213 @@
+import csv
+import datetime
+from itertools import dropwhile
+import json
+import os
+import time
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import reset_queries, transaction
+
+from core.__seedwork.domain.exceptions import InvalidUuidException
+from core.__seedwork.domain.repositories import iter_batches
+from core.__seedwork.domain.value_objects import UniqueEntityId
+from core.category.domain.entities import Category
+from core.category.domain.events import CategoryCreated
+from core.category.domain.validators import CategoryValidatorFactory
+from core.category.infra.django_app.repositories import CategoryDjangoRepository
+
+# (line, props, error) for every record of the file; the line number is what
+# the checkpoint stores, so it has to grow with each record
+Record = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+PROPS = ('name', 'description', 'is_active', 'created_at')
+
+
+def read_ndjson(file: TextIO) -> Iterator[Record]:
+    for line, text in enumerate(file, start=1):
+        if not text.strip():
+            continue
+        try:
+            value = json.loads(text)
+        except ValueError as exception:
+            yield line, None, f'Invalid JSON: {exception}'
+            continue
+        if isinstance(value, dict):
+            yield line, value, None
+        else:
+            yield line, None, 'Expected a JSON object.'
+
+
+def read_csv(file: TextIO) -> Iterator[Record]:
+    reader = csv.DictReader(file)
+    for row in reader:
+        yield reader.line_num, {
+            name: from_cell(name, value) for name, value in row.items()
+            if name is not None and value is not None and (value != '' or name == 'description')
+        }, None
+
+
+# reverses CSVRenderer.to_cell for the columns an export writes
+def from_cell(name: str, value: str) -> Any:
+    if name == 'description' and value == '':
+        return None
+    if name == 'is_active':
+        return {'true': True, 'false': False}.get(value.lower(), value)
+    return value
+
+
+READERS = {'ndjson': read_ndjson, 'csv': read_csv}
+
+
+class Command(BaseCommand):
+    help = (
+        "Streams categories from an NDJSON or CSV file (the formats of "
+        "/categories/export) into the database. Records are validated and "
+        "inserted in batches, each one in its own transaction; the last "
+        "committed line is kept in a checkpoint file, so running the command "
+        "again after a failure resumes from there. Invalid records are "
+        "reported and skipped, as are records whose id already exists."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('file')
+        parser.add_argument('--format', choices=sorted(READERS),
+                            help='Defaults to the file extension.')
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--checkpoint',
+                            help='Defaults to <file>.checkpoint.')
+
+    def handle(self, *args, **options):
+        path, batch_size = options['file'], options['batch_size']
+        file_format = options['format'] or os.path.splitext(path)[1].lstrip('.').lower()
+        if file_format not in READERS:
+            raise CommandError(
+                f"Cannot tell the format of '{path}', pass --format ndjson or --format csv.")
+        if batch_size < 1:
+            raise CommandError('--batch-size must be positive.')
+        checkpoint = options['checkpoint'] or f'{path}.checkpoint'
+
+        last_line = self.read_checkpoint(checkpoint)
+        if last_line:
+            self.stdout.write(f'Resuming after line {last_line}.')
+
+        repository = CategoryDjangoRepository()
+        validator = CategoryValidatorFactory.create()
+        imported = skipped = 0
+        started = reported = time.perf_counter()
+        try:
+            with open(path, newline='', encoding='utf-8') as file:
+                records = dropwhile(lambda record: record[0] <= last_line, READERS[file_format](file))
+                for batch in iter_batches(records, batch_size):
+                    categories, errors = self.to_categories(batch, validator)
+                    categories, errors = self.skip_existing(repository, categories, errors)
+                    with transaction.atomic():
+                        repository.bulk_insert([category for _, category in categories])
+                    self.write_checkpoint(checkpoint, batch[-1][0])
+                    # with DEBUG on, the logged INSERTs would grow with the file
+                    reset_queries()
+
+                    imported += len(categories)
+                    skipped += len(errors)
+                    for line, line_errors in sorted(errors.items()):
+                        self.stderr.write(f'Line {line}: {json.dumps(line_errors)}')
+                    if time.perf_counter() - reported >= 1:
+                        reported = time.perf_counter()
+                        self.stdout.write(self.progress(imported, skipped, reported - started))
+        except FileNotFoundError as exception:
+            raise CommandError(f"File '{path}' does not exist.") from exception
+
+        if os.path.exists(checkpoint):
+            os.remove(checkpoint)
+        self.stdout.write(self.style.SUCCESS(
+            self.progress(imported, skipped, time.perf_counter() - started)))
+
+    # validates the whole batch with one validator call, like the batch
+    # endpoint does, and builds the entities from the validated data
+    @staticmethod
+    def to_categories(batch: List[Record], validator) -> Tuple[List[Tuple[int, Category]], Dict[int, Any]]:
+        errors = {}
+        ids = {}
+        props = {}
+        for line, record, error in batch:
+            if error is not None:
+                errors[line] = {'non_field_errors': [error]}
+                continue
+            if record.get('id') is not None:
+                try:
+                    ids[line] = UniqueEntityId(str(record['id']))
+                except InvalidUuidException:
+                    errors[line] = {'id': ['Must be a valid UUID.']}
+                    continue
+            props[line] = {name: record[name] for name in PROPS if name in record}
+
+        lines = list(props)
+        validation_errors = validator.validate_many(props.values())
+        for index, index_errors in validation_errors.items():
+            errors[lines[index]] = index_errors
+
+        now = datetime.datetime.now(datetime.timezone.utc)
+        categories = []
+        valid_lines = (line for index, line in enumerate(lines) if index not in validation_errors)
+        for line, validated_data in zip(valid_lines, validator.validated_data):
+            created_at = validated_data.get('created_at') or now
+            if line in ids:
+                validated_data['unique_entity_id'] = ids[line]
+            category = Category.hydrate(
+                **{**validated_data, 'created_at': created_at, 'updated_at': created_at})
+            # hydrate() skips __post_init__, where a new category records it
+            category.record_event(CategoryCreated.of(category))
+            categories.append((line, category))
+        return categories, errors
+
+    # makes a re-run idempotent for records that carry their id, including
+    # the batch committed right before a crash that the checkpoint missed;
+    # an id repeated within the batch keeps its first line, since inserting
+    # both would fail the batch on every run
+    @staticmethod
+    def skip_existing(
+        repository: CategoryDjangoRepository,
+        categories: List[Tuple[int, Category]],
+        errors: Dict[int, Any]
+    ) -> Tuple[List[Tuple[int, Category]], Dict[int, Any]]:
+        first_lines = {}
+        for line, category in categories:
+            first_line = first_lines.setdefault(category.id, line)
+            if first_line != line:
+                errors[line] = {'id': [f"ID '{category.id}' is repeated from line {first_line}."]}
+        if len(first_lines) < len(categories):
+            categories = [item for item in categories if item[0] not in errors]
+
+        existing = set(map(str, repository.model.objects.filter(
+            pk__in=[category.id for _, category in categories]).values_list('pk', flat=True)))
+        if not existing:
+            return categories, errors
+        for line, category in categories:
+            if category.id in existing:
+                errors[line] = {'id': [f"Entity already exists using ID '{category.id}'"]}
+        return [item for item in categories if item[1].id not in existing], errors
+
+    @staticmethod
+    def read_checkpoint(checkpoint: str) -> int:
+        try:
+            with open(checkpoint, encoding='utf-8') as file:
+                return int(file.read().strip() or 0)
+        except FileNotFoundError:
+            return 0
+        except ValueError as exception:
+            raise CommandError(f"The checkpoint '{checkpoint}' is corrupted.") from exception
+
+    @staticmethod
+    def write_checkpoint(checkpoint: str, line: int) -> None:
+        # written next to the real file and renamed, so a crash never leaves
+        # half a number behind
+        temporary = f'{checkpoint}.tmp'
+        with open(temporary, 'w', encoding='utf-8') as file:
+            file.write(str(line))
+        os.replace(temporary, checkpoint)
+
+    @staticmethod
+    def progress(imported: int, skipped: int, elapsed: float) -> str:
+        rate = imported / elapsed if elapsed > 0 else 0
+        return f'Imported {imported} categories, skipped {skipped} ({rate:.0f} rows/s).'
@@ -0,0 +1,46 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import reset_queries
+
+from core.__seedwork.infra.django_app.outbox import OutboxRelay
+from django_app import container  # pylint: disable=E0611
+from core.category.infra.django_app.models import CategoryOutboxModel
+
+
+class Command(BaseCommand):
+    help = (
+        "Publishes the category events of the outbox through the container's "
+        "event_publisher, oldest first, and deletes them once published. Runs "
+        "until interrupted, polling the outbox every --interval seconds while "
+        "it is empty; --once stops when it is drained."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--interval', type=float, default=1.0)
+        parser.add_argument('--once', action='store_true')
+
+    def handle(self, *args, **options):
+        batch_size, interval = options['batch_size'], options['interval']
+        if batch_size < 1:
+            raise CommandError('--batch-size must be positive.')
+        if interval <= 0:
+            raise CommandError('--interval must be positive.')
+
+        relay = OutboxRelay(CategoryOutboxModel, container.event_publisher(), batch_size)
+        relayed = 0
+        try:
+            while True:
+                count = relay.drain()
+                # with DEBUG on, the logged queries would grow with every poll
+                reset_queries()
+                if count:
+                    relayed += count
+                    self.stdout.write(f'Published {count} category events.')
+                if options['once']:
+                    break
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(self.style.SUCCESS(f'Published {relayed} category events in total.'))
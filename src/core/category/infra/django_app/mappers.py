@@ -1,27 +1,47 @@
 from core.__seedwork.domain.exceptions import EntityValidationException, LoadEntityException
 from core.__seedwork.domain.value_objects import UniqueEntityId
 from core.category.domain.entities import Category
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Tuple
 
 if TYPE_CHECKING:
     from core.category.infra.django_app.models import CategoryModel
 
 
 class CategoryModelMapper:
-    
-    
+
+    ROW_FIELDS: Tuple[str, ...] = (
+        'id', 'name', 'description', 'is_active', 'created_at', 'updated_at', 'version')
+
     @staticmethod
     def to_entity(model: 'CategoryModel') -> Category:
         try:
-            return Category(
-            unique_entity_id=UniqueEntityId(str(model.id)),
+            category = Category(
+            unique_entity_id=UniqueEntityId(model.id),
             name=model.name,
             description=model.description,
             is_active=model.is_active,
-            created_at=model.created_at
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+            version=model.version
         )
         except EntityValidationException as exception:
             raise LoadEntityException(exception.error) from exception
+        # loading a stored row is not a creation
+        category.pull_events()
+        return category
+
+    @staticmethod
+    def row_to_entity(row: Tuple) -> Category:
+        entity_id, name, description, is_active, created_at, updated_at, version = row
+        return Category.hydrate(
+            unique_entity_id=UniqueEntityId(entity_id),
+            name=name,
+            description=description,
+            is_active=is_active,
+            created_at=created_at,
+            updated_at=updated_at,
+            version=version
+        )
     
     
     @staticmethod
@@ -0,0 +1,27 @@
+from django.db import migrations
+
+from core.category.infra.django_app.name_search import (
+    create_name_search,
+    drop_name_search,
+    rebuild_name_search
+)
+
+
+def forwards(apps, schema_editor):
+    if create_name_search(schema_editor.connection):
+        rebuild_name_search(schema_editor.connection)
+
+
+def backwards(apps, schema_editor):
+    drop_name_search(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_app", "0003_alter_categorymodel_created_at"),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
@@ -0,0 +1,49 @@
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import F
+
+from core.category.infra.django_app.name_search import (
+    create_name_search,
+    drop_name_search,
+    rebuild_name_search
+)
+
+
+# SQLite rebuilds the categories table to add the columns, which drops the
+# name search triggers and renumbers the rowids the index points at
+def drop_search(apps, schema_editor):
+    drop_name_search(schema_editor.connection)
+
+
+def create_search(apps, schema_editor):
+    if create_name_search(schema_editor.connection):
+        rebuild_name_search(schema_editor.connection)
+
+
+def fill_updated_at(apps, schema_editor):
+    CategoryModel = apps.get_model("django_app", "CategoryModel")
+    CategoryModel.objects.using(schema_editor.connection.alias).update(
+        updated_at=F("created_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_app", "0004_categories_name_search"),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_search, create_search),
+        migrations.AddField(
+            model_name="categorymodel",
+            name="updated_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name="categorymodel",
+            name="version",
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.RunPython(fill_updated_at, migrations.RunPython.noop),
+        migrations.RunPython(create_search, drop_search),
+    ]
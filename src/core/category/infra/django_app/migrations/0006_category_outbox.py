@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+from core.__seedwork.infra.django_app.outbox import OutboxJSONEncoder
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_app", "0005_categorymodel_updated_at_version"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CategoryOutboxModel",
+            fields=[
+                ("position", models.BigAutoField(primary_key=True, serialize=False)),
+                ("event_id", models.UUIDField()),
+                ("event_name", models.CharField(max_length=255)),
+                ("aggregate_id", models.CharField(max_length=255)),
+                ("occurred_on", models.DateTimeField()),
+                ("payload", models.JSONField(encoder=OutboxJSONEncoder)),
+            ],
+            options={
+                "db_table": "category_outbox",
+            },
+        ),
+    ]
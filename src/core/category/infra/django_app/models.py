@@ -1,5 +1,6 @@
 from django.db import models
 from django.utils import timezone
+from core.__seedwork.infra.django_app.outbox import OutboxModel
 
 
 # Create your models here.
@@ -9,6 +10,13 @@ class CategoryModel(models.Model):
     description = models.TextField(null=True)
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(default=timezone.now)
+    version = models.PositiveIntegerField(default=1)
     
     class Meta:
-        db_table = 'categories'
\ No newline at end of file
+        db_table = 'categories'
+
+class CategoryOutboxModel(OutboxModel):
+
+    class Meta:
+        db_table = 'category_outbox'
@@ -0,0 +1,99 @@
+from typing import Set
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections
+
+# SQLite FTS5 index over categories.name using the trigram tokenizer, so
+# substring filters (name__icontains) can be answered without a full scan.
+# It is an external content table keyed by the categories rowid and kept in
+# sync by triggers; other database engines keep using LIKE. A migration that
+# rebuilds the categories table drops the triggers and renumbers the rowids,
+# so the index is only used while all its triggers exist, and they are
+# recreated, with the index rebuilt, after every migrate.
+
+NAME_SEARCH_TABLE = 'categories_name_fts'
+NAME_SEARCH_MIN_LENGTH = 3
+NAME_SEARCH_TRIGGERS = tuple(f'{NAME_SEARCH_TABLE}_{suffix}' for suffix in ('ai', 'ad', 'au'))
+
+CREATE_SQL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {NAME_SEARCH_TABLE} USING fts5("
+    "name, content='categories', content_rowid='rowid', tokenize='trigram')",
+    f"CREATE TRIGGER IF NOT EXISTS {NAME_SEARCH_TABLE}_ai AFTER INSERT ON categories BEGIN "
+    f"INSERT INTO {NAME_SEARCH_TABLE}(rowid, name) VALUES (new.rowid, new.name); END",
+    f"CREATE TRIGGER IF NOT EXISTS {NAME_SEARCH_TABLE}_ad AFTER DELETE ON categories BEGIN "
+    f"INSERT INTO {NAME_SEARCH_TABLE}({NAME_SEARCH_TABLE}, rowid, name) "
+    "VALUES ('delete', old.rowid, old.name); END",
+    f"CREATE TRIGGER IF NOT EXISTS {NAME_SEARCH_TABLE}_au AFTER UPDATE OF name ON categories BEGIN "
+    f"INSERT INTO {NAME_SEARCH_TABLE}({NAME_SEARCH_TABLE}, rowid, name) "
+    "VALUES ('delete', old.rowid, old.name); "
+    f"INSERT INTO {NAME_SEARCH_TABLE}(rowid, name) VALUES (new.rowid, new.name); END",
+)
+
+DROP_SQL = (
+    f"DROP TRIGGER IF EXISTS {NAME_SEARCH_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {NAME_SEARCH_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {NAME_SEARCH_TABLE}_au",
+    f"DROP TABLE IF EXISTS {NAME_SEARCH_TABLE}",
+)
+
+REBUILD_SQL = f"INSERT INTO {NAME_SEARCH_TABLE}({NAME_SEARCH_TABLE}) VALUES ('rebuild')"
+
+
+def create_name_search(connection) -> bool:
+    if connection.vendor != 'sqlite':
+        return False
+    try:
+        with connection.cursor() as cursor:
+            for sql in CREATE_SQL:
+                cursor.execute(sql)
+    except OperationalError:
+        # SQLite built without FTS5 or older than 3.34 (no trigram tokenizer)
+        return False
+    return True
+
+
+def drop_name_search(connection) -> None:
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        for sql in DROP_SQL:
+            cursor.execute(sql)
+
+
+def rebuild_name_search(connection) -> None:
+    with connection.cursor() as cursor:
+        cursor.execute(REBUILD_SQL)
+
+
+def missing_name_search(connection) -> Set[str]:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE name IN (%s)" % ', '.join(['%s'] * 4),
+            [NAME_SEARCH_TABLE, *NAME_SEARCH_TRIGGERS])
+        found = {row[0] for row in cursor.fetchall()}
+    return {NAME_SEARCH_TABLE, *NAME_SEARCH_TRIGGERS} - found
+
+
+def has_name_search(using: str = DEFAULT_DB_ALIAS) -> bool:
+    connection = connections[using]
+    return connection.vendor == 'sqlite' and not missing_name_search(connection)
+
+
+# creates whatever part of the index is missing and rebuilds it, since the
+# rows written while a trigger was gone are not in it
+def repair_name_search(connection) -> bool:
+    if connection.vendor != 'sqlite':
+        return False
+    if not missing_name_search(connection):
+        return True
+    if not create_name_search(connection):
+        return False
+    rebuild_name_search(connection)
+    return True
+
+
+def repair_name_search_after_migrate(using: str = DEFAULT_DB_ALIAS, **kwargs) -> None:
+    # pylint: disable=unused-argument
+    repair_name_search(connections[using])
+
+
+def to_match_phrase(value: str) -> str:
+    return '"' + value.replace('"', '""') + '"'
@@ -1,87 +1,811 @@
 # pylint: disable=no-member
 
-from typing import List, Type, TYPE_CHECKING
+import contextlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type, TYPE_CHECKING
+from asgiref.sync import sync_to_async
 from django.core import exceptions as django_exceptions
+from django.core.cache import caches
 from django.core.paginator import Paginator
-from core.__seedwork.domain.exceptions import NotFoundException
+from django.db import transaction
+from django.db.models import BooleanField, Q, QuerySet
+from django.db.models.expressions import RawSQL
+from core.__seedwork.domain.exceptions import InvalidUuidException, NotFoundException
+from core.__seedwork.domain.repositories import (
+    COUNT_ESTIMATED,
+    COUNT_EXACT,
+    COUNT_NONE,
+    SearchCursor,
+    iter_batches
+)
 from core.__seedwork.domain.value_objects import UniqueEntityId
 from core.category.domain.entities import Category
+from core.category.domain.events import CategoryDeleted
 from core.category.domain.repositories import (
-    CategoryRepository
+    AsyncCategoryRepository,
+    CategoryRepository,
+    CategoryVersion
 )
 from core.category.infra.django_app.mappers import CategoryModelMapper
+from core.category.infra.django_app.name_search import (
+    NAME_SEARCH_MIN_LENGTH,
+    NAME_SEARCH_TABLE,
+    has_name_search,
+    to_match_phrase
+)
 
 if TYPE_CHECKING:
-    from core.category.infra.django_app.models import CategoryModel
+    from core.category.infra.django_app.models import CategoryModel, CategoryOutboxModel
+
 
+class BulkMissingEntities(Exception):
+    def __init__(self, entity_ids: List[str]) -> None:
+        super().__init__()
+        self.entity_ids = entity_ids
 
-class CategoryDjangoRepository(CategoryRepository):
+
+# query building shared by the sync and the async repositories, which only
+# differ in how they run the queries
+class CategoryDjangoQueries:
 
     sortable_fields: List[str] = ['name', 'created_at']
+    count_estimate_limit: int = 10000
+    name_search_enabled: bool = True
     model: Type['CategoryModel']
-    
+    outbox_model: Type['CategoryOutboxModel']
+
     def __init__(self) -> None:
-        from core.category.infra.django_app.models import CategoryModel
+        from core.category.infra.django_app.models import CategoryModel, CategoryOutboxModel
         self.model = CategoryModel
-    
+        self.outbox_model = CategoryOutboxModel
+        self._name_search_available = None
+
+    def _search_query(self, input_params: CategoryRepository.SearchParams) -> QuerySet:
+        query = self.model.objects.all()
+        if input_params.filter:
+            query = self._filter_by_name(query, input_params.filter)
+        return query
+
+    def _order_query(self, query: QuerySet, input_params: CategoryRepository.SearchParams) -> QuerySet:
+        if input_params.sort and input_params.sort in self.sortable_fields:
+            return query.order_by(
+                input_params.sort if input_params.sort_dir == 'asc' else f"-{input_params.sort}")
+        return query.order_by('-created_at')
+
+    def _cursor_query(
+        self,
+        query: QuerySet,
+        input_params: CategoryRepository.SearchParams
+    ) -> Tuple[QuerySet, str, str]:
+        if input_params.sort and input_params.sort in self.sortable_fields:
+            sort, sort_dir = input_params.sort, input_params.sort_dir
+        else:
+            sort, sort_dir = 'created_at', 'desc'
+        prefix = '-' if sort_dir == 'desc' else ''
+        lookup = 'lt' if sort_dir == 'desc' else 'gt'
+
+        query = query.order_by(f"{prefix}{sort}", f"{prefix}id")
+
+        cursor = SearchCursor.decode(input_params.cursor)
+        if cursor is not None and cursor.matches(sort, sort_dir):
+            query = query.filter(
+                Q(**{f"{sort}__{lookup}": cursor.key}) |
+                Q(**{sort: cursor.key, f"id__{lookup}": cursor.id})
+            )
+        return query[:input_params.per_page + 1], sort, sort_dir
+
+    def _page_query(self, query: QuerySet, input_params: CategoryRepository.SearchParams) -> QuerySet:
+        start = (input_params.page - 1) * input_params.per_page
+        return query[start:start + input_params.per_page + 1]
+
+    def _page_result(
+        self,
+        rows: List[Tuple],
+        total: Optional[int],
+        input_params: CategoryRepository.SearchParams
+    ) -> CategoryRepository.SearchResult:
+        return CategoryRepository.SearchResult(
+            items=[CategoryModelMapper.row_to_entity(row)
+                   for row in rows[:input_params.per_page]],
+            **self._total_props(total, input_params),
+            current_page=input_params.page,
+            per_page=input_params.per_page,
+            sort=input_params.sort,
+            sort_dir=input_params.sort_dir,
+            filter=input_params.filter,
+            count_mode=input_params.count_mode,
+            has_more=len(rows) > input_params.per_page
+        )
+
+    def _cursor_result(
+        self,
+        rows: List[Tuple],
+        total: Optional[int],
+        input_params: CategoryRepository.SearchParams,
+        sort: str,
+        sort_dir: str
+    ) -> CategoryRepository.SearchResult:
+        items = [CategoryModelMapper.row_to_entity(row) for row in rows]
+        next_cursor = None
+        if len(items) > input_params.per_page:
+            items = items[:input_params.per_page]
+            last = items[-1]
+            next_cursor = SearchCursor(
+                sort, sort_dir, getattr(last, sort), last.id).encode()
+
+        return CategoryRepository.SearchResult(
+            items=items,
+            **self._total_props(total, input_params),
+            current_page=input_params.page,
+            per_page=input_params.per_page,
+            sort=input_params.sort,
+            sort_dir=input_params.sort_dir,
+            filter=input_params.filter,
+            next_cursor=next_cursor,
+            count_mode=input_params.count_mode,
+            has_more=next_cursor is not None
+        )
+
+    # an estimated count reads at most count_estimate_limit + 1 matching
+    # rows, unordered, instead of counting them all; past the limit the
+    # total is reported as the limit and flagged as capped
+    def _estimate_query(self, query: QuerySet) -> QuerySet:
+        return query.order_by()[:self.count_estimate_limit + 1]
+
+    def _total_props(self, total: Optional[int], input_params: CategoryRepository.SearchParams) -> Dict:
+        if input_params.count_mode == COUNT_ESTIMATED and total is not None \
+                and total > self.count_estimate_limit:
+            return {'total': self.count_estimate_limit, 'total_capped': True}
+        return {'total': total}
+
+    # the icontains lookup keeps the LIKE semantics; on SQLite the FTS5
+    # trigram index narrows the rows it has to look at first
+    def _filter_by_name(self, query: QuerySet, name: str) -> QuerySet:
+        query = query.filter(name__icontains=name)
+        if len(name) < NAME_SEARCH_MIN_LENGTH or not self._has_name_search(query.db):
+            return query
+        # a boolean expression keeps the rowid lookup, which pk__in would
+        # turn into a second pass through the id index
+        return query.filter(RawSQL(
+            f'"{self.model._meta.db_table}".rowid IN '
+            f'(SELECT rowid FROM {NAME_SEARCH_TABLE} WHERE {NAME_SEARCH_TABLE} MATCH %s)',
+            (to_match_phrase(name),),
+            output_field=BooleanField()
+        ))
+
+    def _has_name_search(self, using: str) -> bool:
+        if self._name_search_available is None:
+            self._name_search_available = self.name_search_enabled and has_name_search(using)
+        return self._name_search_available
+
+    def _rows(self, query: QuerySet) -> QuerySet:
+        return query.values_list(*CategoryModelMapper.ROW_FIELDS)
+
+
+class CategoryDjangoRepository(CategoryDjangoQueries, CategoryRepository):
+
+    batch_size: int = 1000
+
+    # the events of the written entities go to the outbox in the transaction
+    # of the write; a write without events stays a single statement.
+    # force_insert skips the UPDATE save() tries first when the pk is set,
+    # which pays for the outbox INSERT
     def insert(self, entity: Category) -> None:
         model = CategoryModelMapper.to_model(entity)
-        model.save()
-        
+        if not entity.events:
+            model.save(force_insert=True)
+            return
+        with transaction.atomic():
+            model.save(force_insert=True)
+            self.outbox_model.store_events([entity])
+
     def bulk_insert(self, entities: List[Category]) -> None:
-        self.model.objects.bulk_create(
-            list(map(
-                CategoryModelMapper.to_model, entities
-            ))
-        )
+        with transaction.atomic():
+            self.model.objects.bulk_create(
+                list(map(
+                    CategoryModelMapper.to_model, entities
+                ))
+            )
+            self.outbox_model.store_events(entities)
 
     def find_by_id(self, entity_id: str | UniqueEntityId) -> Category:
-        id_str = str(entity_id)
-        model = self._get(id_str)
-        return CategoryModelMapper.to_entity(model)
+        return CategoryModelMapper.row_to_entity(
+            self._find_row(entity_id, CategoryModelMapper.ROW_FIELDS))
+
+    def find_version(self, entity_id: str | UniqueEntityId) -> CategoryVersion:
+        return CategoryVersion(*self._find_row(entity_id, ('version', 'updated_at')))
+
+    def find_by_ids(self, entity_ids: Iterable[str | UniqueEntityId]) -> List[Category]:
+        ids = []
+        for entity_id in entity_ids:
+            with contextlib.suppress(InvalidUuidException):
+                ids.append(UniqueEntityId(str(entity_id)).id)
+        ids = list(dict.fromkeys(ids))
+
+        found = {}
+        for batch in iter_batches(ids, self.batch_size):
+            for row in self._rows(self.model.objects.filter(pk__in=batch)):
+                entity = CategoryModelMapper.row_to_entity(row)
+                found[entity.id] = entity
+        return [found[entity_id] for entity_id in ids if entity_id in found]
 
     def find_all(self) -> List[Category]:
-        return [CategoryModelMapper.to_entity(model) for model in self.model.objects.all()]
+        return [CategoryModelMapper.row_to_entity(row) for row in self._rows(self.model.objects.all())]
 
+    # writes are a single UPDATE/DELETE, plus the outbox INSERT of their
+    # events; a missing row shows up as zero affected rows instead of
+    # needing a SELECT first
     def update(self, entity: Category) -> None:
-        self._get(entity.id)
-        model = CategoryModelMapper.to_model(entity)
-        model.save()
+        entity_dict = entity.to_dict()
+        entity_id = entity_dict.pop('id')
+        with transaction.atomic() if entity.events else contextlib.nullcontext():
+            if not self.model.objects.filter(pk=entity_id).update(**entity_dict):
+                raise NotFoundException(f"Entity not found using ID '{entity_id}'")
+            self.outbox_model.store_events([entity])
 
     def delete(self, entity_id: str | UniqueEntityId) -> None:
-        model = self._get(str(entity_id))
-        model.delete()
-
-    def _get(self, entity_id: str) -> 'CategoryModel':
+        id_str = str(entity_id)
         try:
-            return self.model.objects.get(pk=entity_id)
-        except (self.model.DoesNotExist, django_exceptions.ValidationError) as exception:
+            with transaction.atomic():
+                deleted, _ = self.model.objects.filter(pk=id_str).delete()
+                if deleted:
+                    self.outbox_model.store([CategoryDeleted.of(id_str)])
+        except django_exceptions.ValidationError as exception:
             raise NotFoundException(
-                f"Entity not found using ID '{entity_id}'") from exception
+                f"Entity not found using ID '{id_str}'") from exception
+        if not deleted:
+            raise NotFoundException(f"Entity not found using ID '{id_str}'")
+
+    # each bulk operation runs in one transaction and holds at most
+    # batch_size models in memory; a missing entity rolls everything back
+    def bulk_update(self, entities: Iterable[Category]) -> None:
+        try:
+            with transaction.atomic():
+                for batch in iter_batches(entities, self.batch_size):
+                    models = self._to_models(batch)
+                    # bulk_update() builds one CASE WHEN per field and row,
+                    # which is far slower than an upsert of rows known to
+                    # exist; the rows are locked until the upsert so one
+                    # deleted in between is not inserted again (SQLite has
+                    # no row locks, its write lock serializes the two)
+                    found = self.model.objects.select_for_update().filter(
+                        pk__in=[model.id for model in models]).values_list('pk', flat=True)
+                    if len(found) != len(models):
+                        raise BulkMissingEntities([model.id for model in models])
+                    self._upsert(models)
+                    self.outbox_model.store_events(batch)
+        except BulkMissingEntities as exception:
+            self._raise_not_found(exception.entity_ids)
+
+    def bulk_upsert(self, entities: Iterable[Category]) -> None:
+        with transaction.atomic():
+            for batch in iter_batches(entities, self.batch_size):
+                self._upsert(self._to_models(batch))
+                self.outbox_model.store_events(batch)
+
+    # ids are only deduplicated within a batch, so memory does not grow with
+    # the input; an id repeated in a later batch is gone by then and is
+    # reported as not found
+    def bulk_delete(self, entity_ids: Iterable[str | UniqueEntityId]) -> None:
+        try:
+            with transaction.atomic():
+                for batch in iter_batches(entity_ids, self.batch_size):
+                    ids = list(dict.fromkeys(map(str, batch)))
+                    try:
+                        deleted, _ = self.model.objects.filter(pk__in=ids).delete()
+                    except django_exceptions.ValidationError:
+                        deleted = None
+                    if deleted != len(ids):
+                        raise BulkMissingEntities(ids)
+                    self.outbox_model.store(list(map(CategoryDeleted.of, ids)))
+        except BulkMissingEntities as exception:
+            self._raise_not_found(exception.entity_ids)
+
+    def _to_models(self, entities: List[Category]) -> List['CategoryModel']:
+        # the last version of an entity repeated in the batch wins
+        return list({
+            entity.id: CategoryModelMapper.to_model(entity) for entity in entities
+        }.values())
+
+    def _upsert(self, models: List['CategoryModel']) -> None:
+        self.model.objects.bulk_create(
+            models,
+            update_conflicts=True,
+            unique_fields=['id'],
+            update_fields=[
+                name for name in CategoryModelMapper.ROW_FIELDS if name != 'id']
+        )
+
+    def _raise_not_found(self, entity_ids: List[str]) -> None:
+        canonical_ids = {}
+        for entity_id in entity_ids:
+            with contextlib.suppress(InvalidUuidException):
+                canonical_ids[entity_id] = UniqueEntityId(entity_id).id
+        existing_ids = set(map(str, self.model.objects.filter(
+            pk__in=canonical_ids.values()).values_list('pk', flat=True)))
+        missing_id = next(
+            (entity_id for entity_id in entity_ids
+             if canonical_ids.get(entity_id) not in existing_ids),
+            entity_ids[0]
+        )
+        raise NotFoundException(f"Entity not found using ID '{missing_id}'")
 
     def search(self, input_params: CategoryRepository.SearchParams) -> CategoryRepository.SearchResult:
-        query = self.model.objects.all()
+        query = self._search_query(input_params)
 
-        if input_params.filter:
-            query = query.filter(name__icontains=input_params.filter)
+        if input_params.cursor is not None:
+            total = self._count(query, input_params)
+            query, sort, sort_dir = self._cursor_query(query, input_params)
+            return self._cursor_result(list(self._rows(query)), total, input_params, sort, sort_dir)
 
-        if input_params.sort and input_params.sort in self.sortable_fields:
-            query = query.order_by(
-                input_params.sort if input_params.sort_dir == 'asc' else f"-{input_params.sort}")
-            
+        query = self._order_query(query, input_params)
+
+        if input_params.count_mode != COUNT_EXACT:
+            rows = list(self._rows(self._page_query(query, input_params)))
+            return self._page_result(rows, self._count(query, input_params), input_params)
+
+        paginator = Paginator(self._rows(query), input_params.per_page)
+        page_obj = paginator.page(input_params.page)
+
+        return CategoryRepository.SearchResult(
+            items=[CategoryModelMapper.row_to_entity(row) for row in page_obj.object_list],
+            total=paginator.count,
+            current_page=input_params.page,
+            per_page=input_params.per_page,
+            sort=input_params.sort,
+            sort_dir=input_params.sort_dir,
+            filter=input_params.filter
+        )
+
+    def stream(self, input_params: CategoryRepository.SearchParams) -> Iterator[Category]:
+        query = self._order_query(self._search_query(input_params), input_params)
+        for row in self._rows(query).iterator(chunk_size=self.batch_size):
+            yield CategoryModelMapper.row_to_entity(row)
+
+    def _find_row(self, entity_id: str | UniqueEntityId, fields: Iterable[str]) -> tuple:
+        id_str = str(entity_id)
+        try:
+            row = self.model.objects.filter(pk=id_str).values_list(*fields).first()
+        except django_exceptions.ValidationError as exception:
+            raise NotFoundException(
+                f"Entity not found using ID '{id_str}'") from exception
+        if row is None:
+            raise NotFoundException(f"Entity not found using ID '{id_str}'")
+        return row
+
+    def _count(self, query: QuerySet, input_params: CategoryRepository.SearchParams) -> Optional[int]:
+        if input_params.count_mode == COUNT_NONE:
+            return None
+        if input_params.count_mode == COUNT_ESTIMATED:
+            return self._estimate_query(query).count()
+        return query.count()
+
+
+class CategoryDjangoAsyncRepository(CategoryDjangoQueries, AsyncCategoryRepository):
+    """
+    CategoryDjangoRepository on top of the async ORM (asave, aupdate,
+    acount, async iteration...), for the ASGI views.
+    """
+
+    async def insert(self, entity: Category) -> None:
+        model = CategoryModelMapper.to_model(entity)
+        if not entity.events:
+            await model.asave(force_insert=True)
+            return
+        await sync_to_async(self._insert_with_events)(model, entity)
+
+    async def find_by_id(self, entity_id: str | UniqueEntityId) -> Category:
+        return CategoryModelMapper.row_to_entity(
+            await self._find_row(entity_id, CategoryModelMapper.ROW_FIELDS))
+
+    async def find_version(self, entity_id: str | UniqueEntityId) -> CategoryVersion:
+        return CategoryVersion(*await self._find_row(entity_id, ('version', 'updated_at')))
+
+    async def find_all(self) -> List[Category]:
+        return [
+            CategoryModelMapper.row_to_entity(row)
+            for row in await self._fetch(self.model.objects.all())
+        ]
+
+    async def update(self, entity: Category) -> None:
+        entity_dict = entity.to_dict()
+        entity_id = entity_dict.pop('id')
+        if not entity.events:
+            updated = await self.model.objects.filter(pk=entity_id).aupdate(**entity_dict)
         else:
-            query = query.order_by('-created_at')
+            updated = await sync_to_async(self._update_with_events)(entity_id, entity_dict, entity)
+        if not updated:
+            raise NotFoundException(f"Entity not found using ID '{entity_id}'")
+
+    async def delete(self, entity_id: str | UniqueEntityId) -> None:
+        id_str = str(entity_id)
+        try:
+            deleted = await sync_to_async(self._delete_with_events)(id_str)
+        except django_exceptions.ValidationError as exception:
+            raise NotFoundException(
+                f"Entity not found using ID '{id_str}'") from exception
+        if not deleted:
+            raise NotFoundException(f"Entity not found using ID '{id_str}'")
 
-        
+    async def search(self, input_params: CategoryRepository.SearchParams) -> CategoryRepository.SearchResult:
+        await self._load_name_search(input_params)
+        query = self._search_query(input_params)
+
+        if input_params.cursor is not None:
+            total = await self._count(query, input_params)
+            query, sort, sort_dir = self._cursor_query(query, input_params)
+            return self._cursor_result(await self._fetch(query), total, input_params, sort, sort_dir)
+
+        query = self._order_query(query, input_params)
+
+        if input_params.count_mode != COUNT_EXACT:
+            rows = await self._fetch(self._page_query(query, input_params))
+            return self._page_result(rows, await self._count(query, input_params), input_params)
+
+        # the paginator only checks the page against the count here, so out
+        # of range pages fail the same way as in the sync search
         paginator = Paginator(query, input_params.per_page)
-        page_obj = paginator.page(input_params.page)
-        
+        paginator.count = await query.acount()
+        start = (paginator.validate_number(input_params.page) - 1) * input_params.per_page
+        rows = await self._fetch(query[start:start + input_params.per_page])
+
         return CategoryRepository.SearchResult(
-            items=[CategoryModelMapper.to_entity(model) for model in page_obj.object_list],
+            items=[CategoryModelMapper.row_to_entity(row) for row in rows],
             total=paginator.count,
             current_page=input_params.page,
             per_page=input_params.per_page,
             sort=input_params.sort,
             sort_dir=input_params.sort_dir,
             filter=input_params.filter
-        )
\ No newline at end of file
+        )
+
+    async def _find_row(self, entity_id: str | UniqueEntityId, fields: Iterable[str]) -> tuple:
+        id_str = str(entity_id)
+        try:
+            row = await self.model.objects.filter(pk=id_str).values_list(*fields).afirst()
+        except django_exceptions.ValidationError as exception:
+            raise NotFoundException(
+                f"Entity not found using ID '{id_str}'") from exception
+        if row is None:
+            raise NotFoundException(f"Entity not found using ID '{id_str}'")
+        return row
+
+    # a transaction cannot span awaits, so a write and its events run in
+    # one sync_to_async call, the same single thread hop as asave()/aupdate()
+    @transaction.atomic
+    def _insert_with_events(self, model: 'CategoryModel', entity: Category) -> None:
+        model.save(force_insert=True)
+        self.outbox_model.store_events([entity])
+
+    @transaction.atomic
+    def _update_with_events(self, entity_id: str, entity_dict: Dict, entity: Category) -> int:
+        updated = self.model.objects.filter(pk=entity_id).update(**entity_dict)
+        if updated:
+            self.outbox_model.store_events([entity])
+        return updated
+
+    @transaction.atomic
+    def _delete_with_events(self, entity_id: str) -> int:
+        deleted, _ = self.model.objects.filter(pk=entity_id).delete()
+        if deleted:
+            self.outbox_model.store([CategoryDeleted.of(entity_id)])
+        return deleted
+
+    async def _fetch(self, query: QuerySet) -> List[Tuple]:
+        return [row async for row in self._rows(query)]
+
+    async def _count(self, query: QuerySet, input_params: CategoryRepository.SearchParams) -> Optional[int]:
+        if input_params.count_mode == COUNT_NONE:
+            return None
+        if input_params.count_mode == COUNT_ESTIMATED:
+            return await self._estimate_query(query).acount()
+        return await query.acount()
+
+    # the name search check reads the schema, which has no async API
+    async def _load_name_search(self, input_params: CategoryRepository.SearchParams) -> None:
+        if input_params.filter and self._name_search_available is None:
+            await sync_to_async(self._has_name_search)(self.model.objects.db)
+
+
+class CachingCategoryRepository(CategoryRepository):
+    """
+    Read-through cache in front of another CategoryRepository, backed by the
+    Django cache framework. Lookups by id are cached for ttl seconds and
+    misses for negative_ttl seconds; writes made through this repository
+    drop the entries they touch. Writes that bypass it are only picked up
+    when the entries expire.
+
+    Search results are kept in a per-process LRU of search_cache_size
+    entries keyed by the normalized SearchParams and the repository
+    generation. The generation lives in the shared cache and every write
+    bumps it atomically with cache.incr, so a write made in any process
+    invalidates the searches cached by all of them in O(1).
+    Cached results are shared and must not be mutated.
+
+    A write made inside a transaction is invalidated right away and again
+    once it commits, since other processes may cache the old rows until
+    then. Until the transaction ends, the thread that wrote reads the keys
+    it touched, and every search, straight from the repository, so a
+    rollback never leaves uncommitted state in the cache.
+
+    With cache_reads off every read goes straight to the repository and
+    writes still invalidate, which is what code that loads entities in
+    order to change them should use.
+    """
+
+    NOT_FOUND = '__not_found__'
+
+    def __init__(
+        self,
+        repository: CategoryRepository,
+        cache_alias: str = 'default',
+        ttl: int = 300,
+        negative_ttl: int = 30,
+        key_prefix: str = 'category',
+        search_ttl: int = 30,
+        search_cache_size: int = 256,
+        cache_reads: bool = True
+    ) -> None:
+        self.repository = repository
+        self.sortable_fields = repository.sortable_fields
+        self.cache_alias = cache_alias
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.key_prefix = key_prefix
+        self.search_ttl = search_ttl
+        self.search_cache_size = search_cache_size
+        self.cache_reads = cache_reads
+        self.hits = 0
+        self.misses = 0
+        self.search_hits = 0
+        self.search_misses = 0
+        self._search_cache = OrderedDict()
+        self._search_lock = threading.Lock()
+        self._transaction = threading.local()
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    @property
+    def generation(self) -> int:
+        return self.cache.get(self._generation_key(), 0)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'search_hits': self.search_hits,
+            'search_misses': self.search_misses,
+            'search_size': len(self._search_cache),
+            'generation': self.generation
+        }
+
+    def insert(self, entity: Category) -> None:
+        self.repository.insert(entity)
+        self.invalidate([entity.id])
+
+    def bulk_insert(self, entities: List[Category]) -> None:
+        self.repository.bulk_insert(entities)
+        self.invalidate(entity.id for entity in entities)
+
+    def find_by_id(self, entity_id: str | UniqueEntityId) -> Category:
+        key = self._key(entity_id)
+        if key is None or not self.cache_reads or key in self._dirty_keys():
+            return self.repository.find_by_id(entity_id)
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            if cached == self.NOT_FOUND:
+                raise NotFoundException(f"Entity not found using ID '{entity_id}'")
+            return cached
+
+        self.misses += 1
+        try:
+            entity = self.repository.find_by_id(entity_id)
+        except NotFoundException:
+            self.cache.set(key, self.NOT_FOUND, self.negative_ttl)
+            raise
+        self.cache.set(key, entity, self.ttl)
+        return entity
+
+    def find_version(self, entity_id: str | UniqueEntityId) -> CategoryVersion:
+        if not self.cache_reads:
+            return self.repository.find_version(entity_id)
+
+        key = self._key(entity_id)
+        cached = self.cache.get(key) if key is not None and key not in self._dirty_keys() else None
+        if cached is None:
+            self.misses += 1
+            return self.repository.find_version(entity_id)
+
+        self.hits += 1
+        if cached == self.NOT_FOUND:
+            raise NotFoundException(f"Entity not found using ID '{entity_id}'")
+        return CategoryVersion(cached.version, cached.updated_at)
+
+    def find_by_ids(self, entity_ids: Iterable[str | UniqueEntityId]) -> List[Category]:
+        if not self.cache_reads:
+            return self.repository.find_by_ids(entity_ids)
+
+        keys = {}
+        for entity_id in entity_ids:
+            key = self._key(entity_id)
+            if key is not None:
+                keys.setdefault(key, str(entity_id))
+
+        dirty = self._dirty_keys()
+        cached = self.cache.get_many([key for key in keys if key not in dirty])
+        self.hits += len(cached)
+        missing = [entity_id for key, entity_id in keys.items() if key not in cached]
+        self.misses += len(missing)
+        if missing:
+            found = {entity.id: entity for entity in self.repository.find_by_ids(missing)}
+            fetched = {
+                self._key(entity_id): found.get(UniqueEntityId(entity_id).id, self.NOT_FOUND)
+                for entity_id in missing
+            }
+            cached.update(fetched)
+            fetched = {key: value for key, value in fetched.items() if key not in dirty}
+            self.cache.set_many(
+                {key: value for key, value in fetched.items() if value != self.NOT_FOUND}, self.ttl)
+            self.cache.set_many(
+                {key: value for key, value in fetched.items() if value == self.NOT_FOUND}, self.negative_ttl)
+
+        return [cached[key] for key in keys if cached[key] != self.NOT_FOUND]
+
+    def find_all(self) -> List[Category]:
+        return self.repository.find_all()
+
+    def update(self, entity: Category) -> None:
+        try:
+            self.repository.update(entity)
+        finally:
+            self.invalidate([entity.id])
+
+    def delete(self, entity_id: str | UniqueEntityId) -> None:
+        try:
+            self.repository.delete(entity_id)
+        finally:
+            self.invalidate([entity_id])
+
+    def bulk_update(self, entities: Iterable[Category]) -> None:
+        entities = list(entities)
+        try:
+            self.repository.bulk_update(entities)
+        finally:
+            self.invalidate(entity.id for entity in entities)
+
+    def bulk_upsert(self, entities: Iterable[Category]) -> None:
+        entities = list(entities)
+        try:
+            self.repository.bulk_upsert(entities)
+        finally:
+            self.invalidate(entity.id for entity in entities)
+
+    def bulk_delete(self, entity_ids: Iterable[str | UniqueEntityId]) -> None:
+        entity_ids = list(entity_ids)
+        try:
+            self.repository.bulk_delete(entity_ids)
+        finally:
+            self.invalidate(entity_ids)
+
+    def search(self, input_params: CategoryRepository.SearchParams) -> CategoryRepository.SearchResult:
+        return self._cached_search(
+            ('search', *self._search_key(input_params)), self.repository.search, input_params)
+
+    def stream(self, input_params: CategoryRepository.SearchParams) -> Iterator[Category]:
+        return self.repository.stream(input_params)
+
+    def _cached_search(self, key: tuple, search: Callable, input_params: CategoryRepository.SearchParams):
+        if not self.cache_reads or self.search_cache_size <= 0 or self._dirty_keys():
+            return search(input_params)
+
+        key = (self.generation, *key)
+        now = time.monotonic()
+        with self._search_lock:
+            cached = self._search_cache.get(key)
+            if cached is not None and cached[0] > now:
+                self._search_cache.move_to_end(key)
+                self.search_hits += 1
+                return cached[1]
+            self.search_misses += 1
+
+        result = search(input_params)
+        with self._search_lock:
+            self._search_cache[key] = (now + self.search_ttl, result)
+            self._search_cache.move_to_end(key)
+            while len(self._search_cache) > self.search_cache_size:
+                self._search_cache.popitem(last=False)
+        return result
+
+    def _search_key(self, input_params: CategoryRepository.SearchParams) -> tuple:
+        return (
+            input_params.page,
+            input_params.per_page,
+            input_params.sort,
+            input_params.sort_dir,
+            input_params.filter,
+            input_params.cursor,
+            input_params.count_mode
+        )
+
+    def _key(self, entity_id: str | UniqueEntityId) -> Optional[str]:
+        try:
+            return f'{self.key_prefix}:{UniqueEntityId(str(entity_id)).id}'
+        except InvalidUuidException:
+            return None
+
+    def _generation_key(self) -> str:
+        return f'{self.key_prefix}:generation'
+
+    def invalidate(self, entity_ids: Iterable[str | UniqueEntityId]) -> None:
+        keys = [key for key in map(self._key, entity_ids) if key is not None]
+        self._drop(keys)
+        if transaction.get_connection().in_atomic_block:
+            # the generation key stands in when no id was valid, so the
+            # searches still bypass the cache
+            self._dirty_keys().update(keys or [self._generation_key()])
+            transaction.on_commit(lambda: self._drop(keys))
+
+    def _drop(self, keys: List[str]) -> None:
+        # add is a no-op when the counter exists, then incr bumps it atomically
+        self.cache.add(self._generation_key(), 0, None)
+        self.cache.incr(self._generation_key())
+        if keys:
+            self.cache.delete_many(keys)
+
+    # the keys this thread wrote in the transaction it has open, forgotten
+    # once it commits or rolls back
+    def _dirty_keys(self) -> Set[str]:
+        state = self._transaction
+        if not transaction.get_connection().in_atomic_block or not hasattr(state, 'keys'):
+            state.keys = set()
+        return state.keys
+
+
+class CacheInvalidatingAsyncCategoryRepository(AsyncCategoryRepository):
+    """
+    Async repository whose writes drop the entries they touch from a
+    CachingCategoryRepository, so the sync views never read rows the
+    async views have since changed. Reads are not cached.
+    """
+
+    def __init__(self, repository: AsyncCategoryRepository, cache: CachingCategoryRepository) -> None:
+        self.repository = repository
+        self.sortable_fields = repository.sortable_fields
+        self.cache = cache
+
+    async def insert(self, entity: Category) -> None:
+        await self.repository.insert(entity)
+        await self._invalidate([entity.id])
+
+    async def find_by_id(self, entity_id: str | UniqueEntityId) -> Category:
+        return await self.repository.find_by_id(entity_id)
+
+    async def find_version(self, entity_id: str | UniqueEntityId) -> CategoryVersion:
+        return await self.repository.find_version(entity_id)
+
+    async def find_all(self) -> List[Category]:
+        return await self.repository.find_all()
+
+    async def update(self, entity: Category) -> None:
+        try:
+            await self.repository.update(entity)
+        finally:
+            await self._invalidate([entity.id])
+
+    async def delete(self, entity_id: str | UniqueEntityId) -> None:
+        try:
+            await self.repository.delete(entity_id)
+        finally:
+            await self._invalidate([entity_id])
+
+    async def search(self, input_params: CategoryRepository.SearchParams) -> CategoryRepository.SearchResult:
+        return await self.repository.search(input_params)
+
+    async def _invalidate(self, entity_ids: List[str | UniqueEntityId]) -> None:
+        await sync_to_async(self.cache.invalidate)(entity_ids)
@@ -1,4 +1,10 @@
-from .api import CategoryResource 
+from .api import (
+    AsyncCategoryResource,
+    CategoryBatchResource,
+    CategoryExportResource,
+    CategoryResource
+)
+from django.conf import settings
 from django.urls import path
 
 from core.category.application.use_cases import CreateCategoryUseCase
@@ -34,11 +40,37 @@ def __init_category_resource():
     }
 
 
+def __init_async_category_resource():
+    return {
+        'create_use_case': container.use_case_category_create_category_async,
+        'list_use_case': container.use_case_category_list_categories_async,
+        'get_use_case': container.use_case_category_get_category_async,
+        'update_use_case': container.use_case_category_update_category_async,
+        'delete_use_case': container.use_case_category_delete_category_async
+    }
+
+
+def __category_view():
+    if settings.CATEGORY_ASYNC_VIEWS:
+        return AsyncCategoryResource.as_view(**__init_async_category_resource())
+    return CategoryResource.as_view(**__init_category_resource())
+
+
+def __init_category_batch_resource():
+    return {
+        'create_use_case': container.use_case_category_create_categories,
+        'update_use_case': container.use_case_category_update_categories,
+        'delete_use_case': container.use_case_category_delete_categories
+    }
+
+
 urlpatterns = [
-    path('categories', CategoryResource.as_view(
-        **__init_category_resource()
+    path('categories/batch', CategoryBatchResource.as_view(
+        **__init_category_batch_resource()
     )),
-    path('categories/<uuid:id>', CategoryResource.as_view(
-        **__init_category_resource()
+    path('categories/export', CategoryExportResource.as_view(
+        export_use_case=container.use_case_category_export_categories
     )),
+    path('categories', __category_view()),
+    path('categories/<uuid:id>', __category_view()),
 ]
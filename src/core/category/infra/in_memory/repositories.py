@@ -1,11 +1,32 @@
-from typing import List
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from core.category.domain.entities import Category
-from core.category.domain.repositories import CategoryRepository
+from core.category.domain.events import CategoryDeleted
+from core.category.domain.repositories import CategoryRepository, CategoryVersion
 from core.__seedwork.domain.repositories import InMemorySearchableRepository
+from core.__seedwork.domain.value_objects import UniqueEntityId
+
+TRIGRAM_SIZE = 3
+
+
+def _trigrams(value: str) -> Set[str]:
+    return {value[i:i + TRIGRAM_SIZE] for i in range(len(value) - TRIGRAM_SIZE + 1)}
 
 
 class CategoryInMemoryRepository(CategoryRepository, InMemorySearchableRepository):
     sortable_fields: List[str] = ["name", "created_at"]
+    name_index_enabled: bool = True
+    _name_index: Optional[Dict[str, Set[int]]] = None
+    _indexed_names: Optional[Dict[int, str]] = None
+
+    def find_version(self, entity_id: str | UniqueEntityId) -> CategoryVersion:
+        entity = self.find_by_id(entity_id)
+        return CategoryVersion(entity.version, entity.updated_at)
+
+    def stream(self, input_params: CategoryRepository.SearchParams) -> Iterator[Category]:
+        items = self._apply_filter(
+            self._get_filter_candidates(input_params.filter), input_params.filter
+        ) if input_params.filter else self._stored_items()
+        return iter(self._apply_sort(items, input_params.sort, input_params.sort_dir))
 
     def _apply_filter(self, items: List[Category], filter_param: str = None) -> List[Category]:
         if filter_param:
@@ -17,9 +38,65 @@ class CategoryInMemoryRepository(CategoryRepository, InMemorySearchableRepositor
 
         return items
 
-    def _apply_sort(self, items: List[Category], sort: str = None, sort_dir: str = None) -> List[Category]:
-        print()
+    def _resolve_sort(self, sort: str = None, sort_dir: str = None) -> Tuple[str, str]:
         if sort:
-            return super()._apply_sort(items, sort, sort_dir)
+            return sort, sort_dir
+
+        return "created_at", "desc"
+
+    def _get_filter_candidates(self, filter_param: str) -> List[Category]:
+        if not self.name_index_enabled or not filter_param:
+            return self._stored_items()
+
+        trigrams = _trigrams(filter_param.lower())
+        if not trigrams:
+            return self._stored_items()
+
+        name_index = self._get_name_index()
+        postings = sorted(
+            (name_index.get(trigram, set()) for trigram in trigrams), key=len)
+        slots = postings[0].intersection(*postings[1:])
+        return [self._entities[slot] for slot in sorted(slots)]
+
+    def _get_name_index(self) -> Dict[str, Set[int]]:
+        if self._name_index is None:
+            self._name_index = {}
+            self._indexed_names = {}
+            for slot, entity in self._entities.items():
+                self._index_name(slot, entity.name)
+        return self._name_index
+
+    def _index_name(self, slot: int, name: str) -> None:
+        name = name.lower()
+        self._indexed_names[slot] = name
+        for trigram in _trigrams(name):
+            self._name_index.setdefault(trigram, set()).add(slot)
+
+    def _unindex_name(self, slot: int) -> None:
+        for trigram in _trigrams(self._indexed_names.pop(slot)):
+            postings = self._name_index[trigram]
+            postings.discard(slot)
+            if not postings:
+                del self._name_index[trigram]
+
+    def _on_added(self, slot: int, entity: Category) -> None:
+        super()._on_added(slot, entity)
+        if self._name_index is not None:
+            self._index_name(slot, entity.name)
+
+    def _on_replaced(self, slot: int, entity: Category) -> None:
+        super()._on_replaced(slot, entity)
+        if self._name_index is not None and self._indexed_names[slot] != entity.name.lower():
+            self._unindex_name(slot)
+            self._index_name(slot, entity.name)
+
+    # a deleted entity can no longer carry its event, so it is stored here
+    def _on_removed(self, slot: int, entity: Category) -> None:
+        super()._on_removed(slot, entity)
+        self.events.append(CategoryDeleted.of(entity.id))
+        if self._name_index is not None:
+            self._unindex_name(slot)
 
-        return super()._apply_sort(items, "created_at", "desc")
+    def _on_reindexed(self) -> None:
+        super()._on_reindexed()
+        self._name_index = None
@@ -69,7 +69,7 @@ class CategoryInvalidBodyFixture:
                     body={'name': faker.with_invalid_name_not_a_string().name}),
                 exception=ValidationError({
                     'name': [
-                        ErrorDetail('Not a valid string', 'invalid')
+                        ErrorDetail('Not a valid string.', 'invalid')
                     ],
                 })),
             description_not_a_str=HttpExpect(
@@ -83,7 +83,7 @@ class CategoryInvalidBodyFixture:
                         ErrorDetail('This field is required.', 'required')
                     ],
                     'description': [
-                        ErrorDetail('Not a valid string', 'invalid')
+                        ErrorDetail('Not a valid string.', 'invalid')
                     ],
                 })),
             is_active_none=HttpExpect(
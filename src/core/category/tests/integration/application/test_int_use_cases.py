@@ -3,7 +3,10 @@ import unittest
 import pytest
 
 import datetime
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from core.__seedwork.domain.exceptions import NotFoundException
+from core.__seedwork.infra.django_app.unit_of_work import DjangoUnitOfWork
 from core.category.application.dto import CategoryOutput, CategoryOutputMapper
 from core.category.application.use_cases import CreateCategoryUseCase, DeleteCategoryUseCase, GetCategoryUseCase, ListCategoriesUseCase, UpdateCategoryUseCase
 from core.category.domain.entities import Category
@@ -401,4 +404,75 @@ class TestDeleteCategoryUseCaseInt(unittest.TestCase):
         self.assertEqual(
             assert_error.exception.args[0],
             f"Entity not found using ID '{entity.id}'"
-        )
\ No newline at end of file
+        )
+
+
+@pytest.mark.django_db
+class TestUnitOfWorkUseCasesInt(unittest.TestCase):
+
+    unit_of_work: DjangoUnitOfWork
+    repo: CategoryDjangoRepository
+
+    def setUp(self) -> None:
+        self.unit_of_work = DjangoUnitOfWork()
+        self.repo = CategoryDjangoRepository()
+        self.create_use_case = CreateCategoryUseCase(self.repo, self.unit_of_work)
+        self.update_use_case = UpdateCategoryUseCase(self.repo, self.unit_of_work)
+        self.delete_use_case = DeleteCategoryUseCase(self.repo, self.unit_of_work)
+
+    def test_batches_the_writes_of_many_use_cases(self):
+        existing = Category.fake().a_category().build()
+        removed = Category.fake().a_category().build()
+        self.repo.bulk_insert([existing, removed])
+
+        with CaptureQueriesContext(connection) as context:
+            with self.unit_of_work:
+                outputs = [
+                    self.create_use_case.execute(CreateCategoryUseCase.Input(name=f'Movie {index}'))
+                    for index in range(100)
+                ]
+                # the update of a category created in the unit needs no query
+                self.update_use_case.execute(UpdateCategoryUseCase.Input(
+                    id=outputs[0].id, name='Movie updated', is_active=False))
+                self.update_use_case.execute(UpdateCategoryUseCase.Input(
+                    id=existing.id, name='Existing updated'))
+                self.delete_use_case.execute(DeleteCategoryUseCase.Input(id=removed.id))
+        # one SELECT for the existing category, one statement per kind of
+        # write and its outbox INSERT, plus the savepoints the bulk operations
+        # open
+        self.assertLessEqual(len(context.captured_queries), 16)
+
+        self.assertEqual(self.repo.model.objects.count(), 101)
+        created = self.repo.find_by_id(outputs[0].id)
+        self.assertEqual(created.name, 'Movie updated')
+        self.assertFalse(created.is_active)
+        self.assertEqual(self.repo.find_by_id(existing.id).name, 'Existing updated')
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id(removed.id)
+
+    def test_rolls_back_every_use_case_on_exception(self):
+        existing = Category.fake().a_category().build()
+        self.repo.insert(existing)
+        self.unit_of_work.flush_size = 10
+
+        with self.assertRaises(RuntimeError):
+            with self.unit_of_work:
+                for index in range(25):
+                    self.create_use_case.execute(CreateCategoryUseCase.Input(name=f'Movie {index}'))
+                self.update_use_case.execute(UpdateCategoryUseCase.Input(
+                    id=existing.id, name='Existing updated'))
+                self.assertEqual(self.repo.model.objects.count(), 21)
+                raise RuntimeError()
+
+        self.assertEqual(self.repo.model.objects.count(), 1)
+        self.assertEqual(self.repo.find_by_id(existing.id).name, existing.name)
+
+    def test_rolls_back_when_a_deferred_delete_is_not_found(self):
+        with self.assertRaises(NotFoundException):
+            with self.unit_of_work:
+                self.create_use_case.execute(CreateCategoryUseCase.Input(name='Movie'))
+                self.delete_use_case.execute(
+                    DeleteCategoryUseCase.Input(id='af46842e-027d-4c91-b259-3a3642144ba4'))
+
+        self.assertEqual(self.repo.model.objects.count(), 0)
+        self.assertFalse(self.unit_of_work.active)
@@ -1,6 +1,10 @@
 import unittest
+from unittest.mock import patch
+from rest_framework import serializers
 from core.__seedwork.domain.exceptions import EntityValidationException, ValidationException
+from core.__seedwork.domain.validators import CompiledDRFValidator, CompiledRules
 from core.category.domain.entities import Category
+from core.category.domain.validators import CategoryValidatorFactory
 
 
 # class TestCategoryIntegration(unittest.TestCase):
@@ -164,3 +168,35 @@ class TestCategoryIntegration(unittest.TestCase):
             category.update('Movie 3', 'A description')
         except EntityValidationException as exception:
             self.fail(f'Some prop is not valid. Error: {exception.args[0]}')
+
+    def test_validated_props_skip_only_the_props_they_cover(self):
+        validator = CategoryValidatorFactory.create()
+        validator.validate({'name': 'Movie', 'description': 'description'})
+        validated = validator.validated_props()
+
+        with patch.object(CompiledRules, 'run', autospec=True, side_effect=CompiledRules.run) as spy_run:
+            category = Category(name='Movie', description='description', validated=validated)
+            category.update('Movie', 'description', validated=validated)
+        self.assertEqual([call.args[2] for call in spy_run.call_args_list], [{'name', 'description'}] * 2)
+
+        # a token does not vouch for other values, other props or other rules
+        with self.assertRaises(EntityValidationException) as assert_error:
+            Category(name='Movie', description=5, validated=validated)
+        self.assertEqual(assert_error.exception.error, {'description': ['Not a valid string.']})
+        with self.assertRaises(EntityValidationException):
+            Category(name='Movie', is_active='yes', validated=validated)
+        with self.assertRaises(EntityValidationException):
+            category.update('a' * 256, 'description', validated=validated)
+
+        other_validator = CompiledDRFValidatorStub()
+        other_validator.validate({'name': 'a' * 256})
+        with self.assertRaises(EntityValidationException):
+            Category(name='a' * 256, validated=other_validator.validated_props())
+
+
+class StubRules(serializers.Serializer):  # pylint: disable=abstract-method
+    name = serializers.CharField()
+
+
+class CompiledDRFValidatorStub(CompiledDRFValidator):
+    rules = StubRules
@@ -0,0 +1,97 @@
+import io
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.management import call_command
+from django.test import AsyncRequestFactory
+from core.category.domain.entities import Category
+from core.category.domain.repositories import CategoryRepository
+from core.category.infra.django_app.api import AsyncCategoryResource
+from django_app import container
+
+
+@pytest.mark.django_db
+class TestAsyncCategoryResourceInt:
+    repo: CategoryRepository
+
+    @classmethod
+    def setup_class(cls):
+        cls.repo = container.repository_category_django_orm()
+        cls.view = staticmethod(AsyncCategoryResource.as_view(
+            create_use_case=container.use_case_category_create_category_async,
+            list_use_case=container.use_case_category_list_categories_async,
+            get_use_case=container.use_case_category_get_category_async,
+            update_use_case=container.use_case_category_update_category_async,
+            delete_use_case=container.use_case_category_delete_category_async
+        ))
+        cls.factory = AsyncRequestFactory()
+
+    def request(self, method: str, path: str, data=None, id: str = None, headers=None):
+        request = getattr(self.factory, method)(
+            path, data=json.dumps(data) if data is not None else None,
+            content_type='application/json', headers=headers)
+        kwargs = {'id': id} if id else {}
+        response = async_to_sync(self.view)(request, **kwargs)
+        return response.render() if hasattr(response, 'render') else response
+
+    def test_is_async(self):
+        assert AsyncCategoryResource.view_is_async
+
+    def test_crud(self):
+        response = self.request('post', '/categories', {'name': 'Movie'})
+        assert response.status_code == 201
+        category_id = response.data['id']
+        assert self.repo.find_by_id(category_id).name == 'Movie'
+
+        response = self.request(
+            'put', f'/categories/{category_id}',
+            {'name': 'Movie changed', 'is_active': False}, id=category_id)
+        assert response.status_code == 200
+        assert response.data['name'] == 'Movie changed'
+        assert self.repo.find_by_id(category_id).is_active is False
+
+        response = self.request('get', f'/categories/{category_id}', id=category_id)
+        assert response.status_code == 200
+        assert response.data['name'] == 'Movie changed'
+        etag = response['ETag']
+        response = self.request(
+            'get', f'/categories/{category_id}', id=category_id, headers={'If-None-Match': etag})
+        assert response.status_code == 304
+
+        response = self.request('delete', f'/categories/{category_id}', id=category_id)
+        assert response.status_code == 204
+        assert self.repo.find_by_ids([category_id]) == []
+
+    def test_validation_errors(self):
+        response = self.request('post', '/categories', {'name': ''})
+        assert response.status_code == 400
+        assert response.data == {'name': ['This field may not be blank.']}
+
+        response = self.request('get', '/categories/fake', id='fake')
+        assert response.status_code == 400
+
+    def test_list(self):
+        self.repo.bulk_insert([Category(name=f'Movie {index}') for index in range(3)])
+
+        response = self.request('get', '/categories?per_page=2&sort=name&sort_dir=asc')
+        assert response.status_code == 200
+        assert [item['name'] for item in response.data['data']] == ['Movie 0', 'Movie 1']
+        assert response.data['meta']['total'] == 3
+
+        response = self.request(
+            'get', '/categories?per_page=2&sort=name&sort_dir=asc',
+            headers={'If-None-Match': response['ETag']})
+        assert response.status_code == 304
+
+
+# the sync requests run on other threads, which only see committed rows
+@pytest.mark.django_db(transaction=True)
+def test_benchmark_category_views_command():
+    container.repository_category_django_orm().bulk_insert(
+        [Category(name=f'Movie {index}') for index in range(3)])
+    out = io.StringIO()
+    call_command('benchmark_category_views', requests=5, concurrency=2, stdout=out)
+    lines = out.getvalue().splitlines()
+    assert [line.split(':')[0].strip() for line in lines] == ['sync', 'async']
+    assert all('5 requests, concurrency 2' in line for line in lines)
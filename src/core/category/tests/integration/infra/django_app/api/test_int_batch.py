@@ -0,0 +1,130 @@
+import pytest
+from rest_framework.exceptions import ValidationError
+from core.__seedwork.infra.testing.helpers import make_request
+from core.category.domain.entities import Category
+from core.category.domain.repositories import CategoryRepository
+from core.category.infra.django_app.api import CategoryBatchResource
+from core.category.infra.django_app.repositories import CategoryDjangoRepository
+from django_app import container
+
+
+@pytest.mark.django_db
+class TestCategoryBatchResourceInt:
+    resource: CategoryBatchResource
+    repo: CategoryRepository
+
+    @classmethod
+    def setup_class(cls):
+        cls.repo = CategoryDjangoRepository()
+        cls.resource = CategoryBatchResource(
+            create_use_case=container.use_case_category_create_categories,
+            update_use_case=container.use_case_category_update_categories,
+            delete_use_case=container.use_case_category_delete_categories,
+            max_items=3
+        )
+
+    @pytest.mark.parametrize('http_method', ['post', 'put', 'delete'])
+    @pytest.mark.parametrize('send_data, expected_error', [
+        ({}, 'Expected a list of items but got type "dict".'),
+        ([], 'This list may not be empty.'),
+        ([{}] * 4, 'Ensure this field has no more than 3 elements.'),
+    ])
+    def test_validation_errors(self, http_method: str, send_data, expected_error: str):
+        request = make_request(http_method=http_method, send_data=send_data)
+        with pytest.raises(ValidationError) as assert_exception:
+            getattr(self.resource, http_method)(request)
+        assert assert_exception.value.detail == [expected_error]
+
+    def test_post_method(self):
+        request = make_request(http_method='post', send_data=[
+            {'name': 'Movie'},
+            {'name': ''},
+            {'name': 'Documentary', 'description': 'description', 'is_active': False},
+        ])
+        response = self.resource.post(request)
+
+        assert response.status_code == 207
+        results = response.data['data']
+        assert [result['status'] for result in results] == [201, 400, 201]
+        assert results[1]['errors'] == {'name': ['This field may not be blank.']}
+        for result in (results[0], results[2]):
+            category = self.repo.find_by_id(result['data']['id'])
+            assert result['data']['name'] == category.name
+            assert result['data']['is_active'] == category.is_active
+
+        response = self.resource.post(make_request(http_method='post', send_data=[{'name': 'Anime'}]))
+        assert response.status_code == 201
+
+    def test_items_follow_the_rules_of_single_writes(self):
+        request = make_request(http_method='post', send_data=[
+            {'name': 'Movie', 'is_active': 'yes'},
+            {'name': 'Anime', 'description': None},
+            {'name': 12345, 'description': ''},
+        ])
+        response = self.resource.post(request)
+
+        results = response.data['data']
+        assert [result['status'] for result in results] == [201, 400, 400]
+        assert results[0]['data']['is_active'] is True
+        assert results[1]['errors'] == {'description': ['This field may not be null.']}
+        assert results[2]['errors'] == {'description': ['This field may not be blank.']}
+
+        movie = self.repo.find_by_id(results[0]['data']['id'])
+        request = make_request(http_method='put', send_data=[
+            {'id': movie.id, 'name': 'Movie', 'description': None},
+            {'id': 'fake id', 'name': ''},
+            {'id': movie.id, 'name': 12345, 'is_active': 'false'},
+        ])
+        response = self.resource.put(request)
+
+        results = response.data['data']
+        assert [result['status'] for result in results] == [400, 400, 200]
+        assert results[0]['errors'] == {'description': ['This field may not be null.']}
+        assert results[1]['errors'] == {
+            'id': ['Must be a valid UUID.'], 'name': ['This field may not be blank.']}
+        movie = self.repo.find_by_id(movie.id)
+        assert (movie.name, movie.is_active) == ('12345', False)
+
+    def test_put_method(self):
+        movie = Category(name='Movie')
+        documentary = Category(name='Documentary')
+        self.repo.bulk_insert([movie, documentary])
+
+        request = make_request(http_method='put', send_data=[
+            {'id': movie.id, 'name': 'Movie changed', 'is_active': False},
+            {'id': 'af46842e-027d-4c91-b259-3a3642144ba4', 'name': 'fake'},
+            {'id': documentary.id, 'name': 'a' * 256},
+        ])
+        response = self.resource.put(request)
+
+        assert response.status_code == 207
+        results = response.data['data']
+        assert [result['status'] for result in results] == [200, 404, 400]
+        assert results[0]['data']['name'] == 'Movie changed'
+        assert results[1]['errors'] == {
+            'id': ["Entity not found using ID 'af46842e-027d-4c91-b259-3a3642144ba4'"]}
+        assert results[2]['errors'] == {
+            'name': ['Ensure this field has no more than 255 characters.']}
+
+        movie_changed = self.repo.find_by_id(movie.id)
+        assert movie_changed.name == 'Movie changed'
+        assert movie_changed.is_active is False
+        assert self.repo.find_by_id(documentary.id).name == 'Documentary'
+
+    def test_delete_method(self):
+        movie = Category(name='Movie')
+        self.repo.insert(movie)
+
+        request = make_request(http_method='delete', send_data=[
+            movie.id, 'fake id', 'af46842e-027d-4c91-b259-3a3642144ba4'
+        ])
+        response = self.resource.delete(request)
+
+        assert response.status_code == 207
+        assert response.data['data'] == [
+            {'index': 0, 'status': 200},
+            {'index': 1, 'status': 400, 'errors': {'id': ['Must be a valid UUID.']}},
+            {'index': 2, 'status': 404, 'errors': {
+                'id': ["Entity not found using ID 'af46842e-027d-4c91-b259-3a3642144ba4'"]}},
+        ]
+        assert self.repo.find_by_ids([movie.id]) == []
@@ -0,0 +1,83 @@
+import pytest
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+from rest_framework.test import APIClient
+from core.category.domain.entities import Category
+from core.category.domain.repositories import CategoryRepository
+from django_app import container
+
+
+@pytest.mark.django_db
+class TestCategoryResourceConditionalGetInt:
+    client: APIClient
+    repo: CategoryRepository
+
+    def setup_method(self):
+        self.client = APIClient()
+        self.repo = container.repository_category_cached()
+
+    def test_get_object_answers_not_modified(self):
+        category = Category(name='Movie')
+        self.repo.insert(category)
+        url = f'/categories/{category.id}'
+
+        response = self.client.get(url)
+        assert response.status_code == 200
+        etag = response['ETag']
+        last_modified = response['Last-Modified']
+        assert etag.startswith('"1-')
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        assert response['ETag'] == etag
+        assert len(context.captured_queries) <= 1
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        assert response.status_code == 304
+
+        category.update(name='Movie changed', description=None)
+        self.repo.update(category)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response['ETag'] != etag
+        assert response.json()['name'] == 'Movie changed'
+
+    def test_list_answers_not_modified(self):
+        categories = [Category(name=f'Movie {index}') for index in range(3)]
+        self.repo.bulk_insert(categories)
+        url = '/categories?per_page=2&filter=movie'
+
+        response = self.client.get(url)
+        assert response.status_code == 200
+        etag = response['ETag']
+        assert 'Last-Modified' not in response
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        assert response['ETag'] == etag
+        assert not any('SUM(' in query['sql'] for query in context.captured_queries)
+
+        self.repo.delete(categories[2].id)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response['ETag'] != etag
+        assert response.json()['meta']['total'] == 2
+
+    def test_list_etag_follows_writes_that_backdate_updated_at(self):
+        category = Category(name='Movie')
+        self.repo.insert(category)
+        url = '/categories?filter=movie'
+        etag = self.client.get(url)['ETag']
+
+        # an import keeps the updated_at of its source, which can be older
+        imported = Category.hydrate(**{
+            **category.to_dict(), 'unique_entity_id': category.unique_entity_id,
+            'name': 'Movie imported', 'updated_at': category.created_at
+        })
+        self.repo.bulk_upsert([imported])
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response.json()['data'][0]['name'] == 'Movie imported'
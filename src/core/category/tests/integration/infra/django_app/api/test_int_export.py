@@ -0,0 +1,82 @@
+import csv
+import io
+import json
+from datetime import timedelta
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.utils import timezone
+from rest_framework.test import APIClient
+from core.category.domain.entities import Category
+from core.category.domain.repositories import CategoryRepository
+from django_app import container
+
+
+@pytest.mark.django_db
+class TestCategoryExportResourceInt:
+    client: APIClient
+    repo: CategoryRepository
+
+    def setup_method(self):
+        self.client = APIClient()
+        self.repo = container.repository_category_django_orm()
+        created_at = timezone.now()
+        self.categories = [
+            Category(name='Movie', description='with "quotes", commas', created_at=created_at),
+            Category(name='Documentary', is_active=False,
+                     created_at=created_at + timedelta(seconds=1)),
+            Category(name='Anime movie', created_at=created_at + timedelta(seconds=2)),
+        ]
+        self.repo.bulk_insert(self.categories)
+
+    def test_export_ndjson(self):
+        response = self.client.get('/categories/export?format=ndjson')
+
+        assert response.status_code == 200
+        assert response.streaming
+        assert response['Content-Type'] == 'application/x-ndjson; charset=utf-8'
+        assert response['Content-Disposition'] == 'attachment; filename="categories.ndjson"'
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {
+                'id': category.id,
+                'name': category.name,
+                'description': category.description,
+                'is_active': category.is_active,
+                'created_at': category.created_at.isoformat().replace('+00:00', 'Z'),
+            }
+            for category in self.categories[::-1]
+        ]
+
+    def test_export_streams_an_async_iterator_under_asgi(self):
+        async def export():
+            response = await AsyncClient().get('/categories/export?format=ndjson')
+            return response, [chunk async for chunk in response.streaming_content]
+
+        response, chunks = async_to_sync(export)()
+
+        assert response.status_code == 200
+        assert response.is_async
+        lines = b''.join(chunks).decode().splitlines()
+        assert [json.loads(line)['id'] for line in lines] == [
+            category.id for category in self.categories[::-1]
+        ]
+
+    def test_export_csv_with_search_options(self):
+        response = self.client.get('/categories/export?format=csv&filter=movie&sort=name')
+
+        assert response.status_code == 200
+        assert response['Content-Type'] == 'text/csv; charset=utf-8'
+        rows = list(csv.reader(io.StringIO(b''.join(response.streaming_content).decode())))
+        assert rows[0] == ['id', 'name', 'description', 'is_active', 'created_at']
+        assert [row[1:4] for row in rows[1:]] == [
+            ['Anime movie', '', 'true'],
+            ['Movie', 'with "quotes", commas', 'true'],
+        ]
+
+    def test_export_negotiates_by_accept_header(self):
+        response = self.client.get('/categories/export', HTTP_ACCEPT='text/csv')
+        assert response['Content-Type'] == 'text/csv; charset=utf-8'
+
+        response = self.client.get('/categories/export', HTTP_ACCEPT='application/json')
+        assert response.status_code == 406
@@ -1,4 +1,5 @@
 import pytest
+from rest_framework.parsers import MultiPartParser
 from rest_framework.request import Request
 from rest_framework.test import APIRequestFactory
 from core.__seedwork.infra.testing.helpers import make_request
@@ -50,3 +51,11 @@ class TestCategoryResourcePostMethodInt:
                          **http_expect.response.body}
         for key, value in expected_data.items():
             assert response.data[key] == value
+
+    def test_post_form_data(self):
+        request = Request(APIRequestFactory().post(
+            '/categories', {'name': 'Movie', 'is_active': 'false'}, format='multipart'),
+            parsers=[MultiPartParser()])
+        response = self.resource.post(request)
+        assert response.status_code == 201
+        assert (response.data['name'], response.data['is_active']) == ('Movie', False)
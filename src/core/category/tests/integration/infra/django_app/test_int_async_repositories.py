@@ -0,0 +1,121 @@
+import unittest
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.core.paginator import EmptyPage
+from core.__seedwork.domain.exceptions import NotFoundException
+from core.category.domain.entities import Category
+from core.category.domain.repositories import CategoryRepository
+from core.category.infra.django_app.repositories import (
+    CacheInvalidatingAsyncCategoryRepository,
+    CachingCategoryRepository,
+    CategoryDjangoAsyncRepository,
+    CategoryDjangoRepository
+)
+
+
+@pytest.mark.django_db
+class TestCategoryDjangoAsyncRepositoryInt(unittest.TestCase):
+
+    repo: CategoryDjangoAsyncRepository
+    sync_repo: CategoryDjangoRepository
+
+    def setUp(self):
+        self.repo = CategoryDjangoAsyncRepository()
+        self.sync_repo = CategoryDjangoRepository()
+
+    def test_crud(self):
+        category = Category(name='Movie')
+        async_to_sync(self.repo.insert)(category)
+        self.assertEqual(async_to_sync(self.repo.find_by_id)(category.id), category)
+        self.assertEqual(async_to_sync(self.repo.find_all)(), [category])
+
+        category.update(name='Movie changed', description=None)
+        async_to_sync(self.repo.update)(category)
+        self.assertEqual(self.sync_repo.find_by_id(category.id).name, 'Movie changed')
+        self.assertEqual(
+            async_to_sync(self.repo.find_version)(category.id),
+            self.sync_repo.find_version(category.id)
+        )
+
+        async_to_sync(self.repo.delete)(category.id)
+        for method in (self.repo.find_by_id, self.repo.find_version, self.repo.delete):
+            with self.assertRaises(NotFoundException) as assert_error:
+                async_to_sync(method)(category.id)
+            self.assertEqual(
+                assert_error.exception.args[0], f"Entity not found using ID '{category.id}'")
+        with self.assertRaises(NotFoundException):
+            async_to_sync(self.repo.find_by_id)('fake id')
+        with self.assertRaises(NotFoundException):
+            async_to_sync(self.repo.update)(category)
+
+    def test_search_gives_the_same_results_as_the_sync_repository(self):
+        self.sync_repo.bulk_insert([
+            Category(name=name) for name in ['Movie', 'Documentary', 'movie 2', 'Anime', 'Movies']
+        ])
+        arrange = [
+            {},
+            {'page': 2, 'per_page': 2},
+            {'per_page': 2, 'sort': 'name', 'sort_dir': 'desc', 'filter': 'mov'},
+            {'per_page': 2, 'count_mode': 'estimated'},
+            {'per_page': 2, 'filter': 'ie', 'count_mode': 'none'},
+            {'per_page': 2, 'sort': 'name', 'cursor': '*'},
+        ]
+        for params in arrange:
+            with self.subTest(params=params):
+                search_params = CategoryRepository.SearchParams(**params)
+                result = async_to_sync(self.repo.search)(search_params)
+                self.assertEqual(result, self.sync_repo.search(search_params))
+                if result.next_cursor:
+                    next_params = CategoryRepository.SearchParams(
+                        **{**params, 'cursor': result.next_cursor})
+                    self.assertEqual(
+                        async_to_sync(self.repo.search)(next_params),
+                        self.sync_repo.search(next_params)
+                    )
+
+        out_of_range = CategoryRepository.SearchParams(page=9, per_page=2)
+        with self.assertRaises(EmptyPage):
+            self.sync_repo.search(out_of_range)
+        with self.assertRaises(EmptyPage):
+            async_to_sync(self.repo.search)(out_of_range)
+
+
+# writes inside a transaction are cached differently, so these tests commit
+@pytest.mark.django_db(transaction=True)
+class TestCacheInvalidatingAsyncCategoryRepositoryInt(unittest.TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.cached = CachingCategoryRepository(CategoryDjangoRepository())
+        self.repo = CacheInvalidatingAsyncCategoryRepository(
+            CategoryDjangoAsyncRepository(), self.cached)
+
+    def test_writes_drop_the_cached_entries(self):
+        category = Category(name='Movie')
+        with self.assertRaises(NotFoundException):
+            self.cached.find_by_id(category.id)
+        async_to_sync(self.repo.insert)(category)
+        self.assertEqual(self.cached.find_by_id(category.id), category)
+
+        category.deactivate()
+        async_to_sync(self.repo.update)(category)
+        self.assertFalse(self.cached.find_by_id(category.id).is_active)
+        self.assertEqual(self.cached.find_version(category.id).version, category.version)
+
+        async_to_sync(self.repo.delete)(category.id)
+        with self.assertRaises(NotFoundException):
+            self.cached.find_by_id(category.id)
+        self.assertEqual(self.cached.misses, 4)
+
+    def test_failed_writes_still_drop_the_cached_entries(self):
+        category = Category(name='Movie')
+        self.cached.insert(category)
+        self.cached.find_by_id(category.id)
+        CategoryDjangoRepository().delete(category.id)
+
+        with self.assertRaises(NotFoundException):
+            async_to_sync(self.repo.update)(category)
+        with self.assertRaises(NotFoundException):
+            self.cached.find_by_id(category.id)
@@ -0,0 +1,51 @@
+import io
+import json
+import pytest
+from django.core.management import CommandError, call_command
+from core.category.infra.django_app.benchmarks.use_cases import SCENARIOS
+from core.category.infra.django_app.models import CategoryModel, CategoryOutboxModel
+
+
+def benchmark(baseline, **options):
+    stdout = io.StringIO()
+    call_command('benchmark_category_use_cases', rows=[20], iterations=3, warmup=1,
+                 baseline=str(baseline), stdout=stdout, **options)
+    return stdout.getvalue()
+
+
+@pytest.mark.django_db
+class TestBenchmarkCategoryUseCasesCommandInt:
+
+    def test_save_and_compare_with_the_baselines(self, tmp_path):
+        baseline = tmp_path / 'baselines.json'
+
+        stdout = benchmark(baseline, save_baseline=True)
+
+        assert f'Saved {len(SCENARIOS) * 2} baselines' in stdout
+        results = json.loads(baseline.read_text(encoding='utf-8'))['results']
+        assert sorted(results) == sorted(
+            f'{repository}/20/{scenario}' for repository in ('django', 'in_memory') for scenario in SCENARIOS)
+        assert results['django/20/get']['operations'] == 3
+        assert set(results['django/20/get']) == {'operations', 'ops_per_sec', 'p50_us', 'p99_us'}
+        # the rows are seeded and written to a throwaway database
+        assert not CategoryModel.objects.exists()
+        assert not CategoryOutboxModel.objects.exists()
+
+        stdout = benchmark(baseline, repository=['in_memory'], scenario=['get'], threshold=0.99)
+        assert 'in_memory/20/get: 3 ops' in stdout
+        assert '1 benchmarks, 1 compared with a baseline, no regression.' in stdout
+
+    def test_fail_when_the_throughput_regresses(self, tmp_path):
+        baseline = tmp_path / 'baselines.json'
+        baseline.write_text(json.dumps({'results': {
+            'in_memory/20/get': {'operations': 3, 'ops_per_sec': 1e12, 'p50_us': 0.0, 'p99_us': 0.0}
+        }}), encoding='utf-8')
+
+        with pytest.raises(CommandError) as assert_error:
+            benchmark(baseline, repository=['in_memory'], scenario=['get', 'create'])
+        assert str(assert_error.value).startswith('Throughput regressed by more than 25%: in_memory/20/get ')
+
+    def test_validate_the_options(self, tmp_path):
+        with pytest.raises(CommandError) as assert_error:
+            benchmark(tmp_path / 'baselines.json', threshold=1)
+        assert str(assert_error.value) == '--threshold must be a fraction between 0 and 1.'
@@ -0,0 +1,126 @@
+import io
+import json
+import os
+from unittest.mock import patch
+import pytest
+from django.core.management import CommandError, call_command
+from rest_framework.test import APIClient
+from core.category.domain.entities import Category
+from core.category.infra.django_app.models import CategoryModel, CategoryOutboxModel
+from core.category.infra.django_app.repositories import CategoryDjangoRepository
+
+
+def import_categories(path, **options):
+    stdout, stderr = io.StringIO(), io.StringIO()
+    call_command('import_categories', str(path), stdout=stdout, stderr=stderr, **options)
+    return stdout.getvalue(), stderr.getvalue()
+
+
+@pytest.mark.django_db
+class TestImportCategoriesCommandInt:
+
+    def test_import_ndjson_skips_invalid_records(self, tmp_path):
+        path = tmp_path / 'categories.ndjson'
+        path.write_text('\n'.join([
+            json.dumps({'name': 'Movie', 'description': 'description'}),
+            '',
+            '{not json',
+            json.dumps({'name': 'Documentary', 'is_active': False,
+                        'created_at': '2022-01-01T00:00:00Z'}),
+            json.dumps({'name': ''}),
+            json.dumps(['Anime']),
+            json.dumps({'id': 'fake id', 'name': 'Anime'}),
+        ]), encoding='utf-8')
+
+        stdout, stderr = import_categories(path, batch_size=2)
+
+        assert 'Imported 2 categories, skipped 4' in stdout
+        assert stderr.splitlines()[0].startswith('Line 3: {"non_field_errors": ["Invalid JSON:')
+        assert stderr.splitlines()[1:] == [
+            'Line 5: {"name": ["This field may not be blank."]}',
+            'Line 6: {"non_field_errors": ["Expected a JSON object."]}',
+            'Line 7: {"id": ["Must be a valid UUID."]}',
+        ]
+        models = {model.name: model for model in CategoryModel.objects.all()}
+        assert sorted(models) == ['Documentary', 'Movie']
+        assert models['Movie'].description == 'description'
+        assert models['Movie'].is_active is True
+        assert models['Documentary'].is_active is False
+        assert models['Documentary'].created_at.isoformat() == '2022-01-01T00:00:00+00:00'
+        assert models['Documentary'].updated_at == models['Documentary'].created_at
+        assert not os.path.exists(f'{path}.checkpoint')
+        assert sorted(CategoryOutboxModel.objects.values_list('event_name', 'aggregate_id')) == sorted(
+            ('CategoryCreated', str(model.id)) for model in models.values())
+
+    def test_import_an_export(self, tmp_path):
+        categories = [
+            Category(name='Movie', description='with "quotes", commas'),
+            Category(name='Documentary', is_active=False),
+        ]
+        CategoryDjangoRepository().bulk_insert(categories)
+        response = APIClient().get('/categories/export?format=csv')
+        path = tmp_path / 'categories.csv'
+        path.write_bytes(b''.join(response.streaming_content))
+        CategoryModel.objects.all().delete()
+
+        stdout, _ = import_categories(path)
+        assert 'Imported 2 categories, skipped 0' in stdout
+        assert sorted(CategoryDjangoRepository().find_all(), key=lambda item: item.name) == \
+            sorted(categories, key=lambda item: item.name)
+
+        # the records carry their ids, so importing them again adds nothing
+        stdout, stderr = import_categories(path)
+        assert 'Imported 0 categories, skipped 2' in stdout
+        assert f"Entity already exists using ID '{categories[0].id}'" in stderr
+        assert CategoryModel.objects.count() == 2
+
+    def test_import_skips_ids_repeated_within_a_batch(self, tmp_path):
+        entity_id = 'af46842e-027d-4c91-b259-3a3642144ba4'
+        path = tmp_path / 'categories.ndjson'
+        path.write_text('\n'.join([
+            json.dumps({'id': entity_id, 'name': 'Movie'}),
+            json.dumps({'name': 'Documentary'}),
+            json.dumps({'id': entity_id.upper(), 'name': 'Movie again'}),
+        ]), encoding='utf-8')
+
+        stdout, stderr = import_categories(path, batch_size=3)
+
+        assert 'Imported 2 categories, skipped 1' in stdout
+        assert stderr.splitlines() == [
+            f'Line 3: {{"id": ["ID \'{entity_id}\' is repeated from line 1."]}}',
+        ]
+        assert CategoryModel.objects.get(pk=entity_id).name == 'Movie'
+        assert not os.path.exists(f'{path}.checkpoint')
+
+    def test_resume_after_failure(self, tmp_path):
+        path = tmp_path / 'categories.ndjson'
+        path.write_text(
+            ''.join(json.dumps({'name': f'Movie {index}'}) + '\n' for index in range(5)),
+            encoding='utf-8')
+        bulk_insert = CategoryDjangoRepository.bulk_insert
+        calls = []
+
+        def failing_bulk_insert(repository, entities):
+            calls.append(len(entities))
+            if len(calls) == 2:
+                raise RuntimeError('connection lost')
+            bulk_insert(repository, entities)
+
+        with patch.object(CategoryDjangoRepository, 'bulk_insert', failing_bulk_insert):
+            with pytest.raises(RuntimeError):
+                import_categories(path, batch_size=2)
+        assert CategoryModel.objects.count() == 2
+        assert path.with_name('categories.ndjson.checkpoint').read_text() == '2'
+
+        stdout, _ = import_categories(path, batch_size=2)
+        assert stdout.startswith('Resuming after line 2.')
+        assert 'Imported 3 categories' in stdout
+        assert sorted(CategoryModel.objects.values_list('name', flat=True)) == \
+            [f'Movie {index}' for index in range(5)]
+        assert not os.path.exists(f'{path}.checkpoint')
+
+    def test_invalid_options(self, tmp_path):
+        with pytest.raises(CommandError, match='Cannot tell the format'):
+            import_categories(tmp_path / 'categories.txt')
+        with pytest.raises(CommandError, match='does not exist'):
+            import_categories(tmp_path / 'categories.csv')
@@ -1,6 +1,7 @@
 
 # pylint: disable=unexpected-keyword-arg,no-member
 import unittest
+from unittest.mock import patch
 import pytest
 from django.utils import timezone
 from core.category.infra.django_app.models import CategoryModel
@@ -29,6 +30,24 @@ class TestCategoryModelMapper(unittest.TestCase):
         self.assertTrue(entity.is_active)
         self.assertEqual(entity.created_at, created_at)
 
+    def test_row_to_entity(self):
+        created_at = timezone.now()
+        model = CategoryModel.objects.create(
+            id='af46842e-027d-4c91-b259-3a3642144ba4',
+            name='Movie',
+            description='Movie description',
+            is_active=True,
+            created_at=created_at
+        )
+        row = CategoryModel.objects.values_list(
+            *CategoryModelMapper.ROW_FIELDS).get(pk=model.id)
+
+        with patch.object(Category, 'validate') as mock_validate:
+            entity = CategoryModelMapper.row_to_entity(row)
+            mock_validate.assert_not_called()
+
+        self.assertEqual(entity, CategoryModelMapper.to_entity(model))
+
     def test_to_model(self):
         entity = Category(
             name='Movie',
@@ -12,7 +12,8 @@ class TestCategoryModelInt(unittest.TestCase):
         self.assertEqual(table_name, 'categories')
         
         fields_name = tuple(field.name for field in CategoryModel._meta.fields)
-        self.assertEqual(fields_name, ('id', 'name', 'description', 'is_active', 'created_at'))
+        self.assertEqual(fields_name, (
+            'id', 'name', 'description', 'is_active', 'created_at', 'updated_at', 'version'))
         
         id_field: models.UUIDField = CategoryModel.id.field
         self.assertIsInstance(id_field, models.UUIDField)
@@ -0,0 +1,147 @@
+import io
+from unittest.mock import patch
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.management import CommandError, call_command
+from rest_framework.test import APIClient
+from core.__seedwork.application.events import InMemoryEventPublisher
+from core.__seedwork.domain.exceptions import NotFoundException
+from core.__seedwork.infra.django_app.outbox import OutboxRelay
+from core.category.domain.entities import Category
+from core.category.domain.events import CategoryCreated
+from core.category.infra.django_app.models import CategoryOutboxModel
+from core.category.infra.django_app.repositories import (
+    CategoryDjangoAsyncRepository,
+    CategoryDjangoRepository
+)
+from django_app import container
+
+
+def outbox():
+    return list(CategoryOutboxModel.objects.order_by('position').values_list(
+        'event_name', 'aggregate_id', 'payload__version'))
+
+
+@pytest.mark.django_db
+class TestCategoryOutboxInt:
+
+    def test_repository_writes_store_the_events(self):
+        repo = CategoryDjangoRepository()
+        category = Category(name='Movie')
+        repo.insert(category)
+        others = [Category(name='Documentary'), Category(name='Anime')]
+        repo.bulk_insert(others)
+
+        category.update(name='Movie changed', description=None)
+        category.deactivate()
+        repo.update(category)
+        others[0].activate()
+        others[1].deactivate()
+        repo.bulk_update(others)
+        repo.update(category)
+        repo.delete(category.id.upper())
+        repo.bulk_delete([other.id for other in others])
+
+        assert outbox() == [
+            ('CategoryCreated', category.id, 1),
+            ('CategoryCreated', others[0].id, 1),
+            ('CategoryCreated', others[1].id, 1),
+            ('CategoryUpdated', category.id, 2),
+            ('CategoryUpdated', category.id, 3),
+            ('CategoryUpdated', others[1].id, 2),
+            ('CategoryDeleted', category.id, None),
+            ('CategoryDeleted', others[0].id, None),
+            ('CategoryDeleted', others[1].id, None),
+        ]
+        row = CategoryOutboxModel.objects.order_by('position').first()
+        assert row.payload == {
+            'name': 'Movie',
+            'description': None,
+            'is_active': True,
+            'created_at': category.created_at.isoformat(),
+            'version': 1
+        }
+
+    def test_a_failed_write_stores_no_event(self):
+        repo = CategoryDjangoRepository()
+        category = Category(name='Movie')
+        category.update(name='Movie changed', description=None)
+        with pytest.raises(NotFoundException):
+            repo.update(category)
+        with pytest.raises(NotFoundException):
+            repo.delete(category.id)
+        with pytest.raises(NotFoundException):
+            repo.bulk_delete([category.id])
+        assert not outbox()
+
+    def test_async_repository_writes_store_the_events(self):
+        repo = CategoryDjangoAsyncRepository()
+        category = Category(name='Movie')
+        async_to_sync(repo.insert)(category)
+        category.update(name='Movie changed', description=None)
+        async_to_sync(repo.update)(category)
+
+        category.update(name='Movie changed again', description=None)
+        async_to_sync(repo.delete)(category.id)
+        with pytest.raises(NotFoundException):
+            async_to_sync(repo.update)(category)
+
+        assert outbox() == [
+            ('CategoryCreated', category.id, 1),
+            ('CategoryUpdated', category.id, 2),
+            ('CategoryDeleted', category.id, None),
+        ]
+
+    def test_post_stores_the_created_event(self):
+        response = APIClient().post('/categories', {'name': 'Movie'}, format='json')
+        assert response.status_code == 201
+        assert outbox() == [('CategoryCreated', response.data['id'], 1)]
+
+    def test_relay_publishes_and_deletes_in_order(self):
+        repo = CategoryDjangoRepository()
+        categories = [Category(name=f'Movie {index}') for index in range(5)]
+        repo.bulk_insert(categories)
+        publisher = InMemoryEventPublisher()
+        relay = OutboxRelay(CategoryOutboxModel, publisher, batch_size=2)
+
+        assert relay.relay_batch() == 2
+        assert [message.aggregate_id for message in publisher.messages] == [
+            category.id for category in categories[:2]]
+        assert len(outbox()) == 3
+
+        assert relay.drain() == 3
+        assert relay.drain() == 0
+        assert not outbox()
+        message = publisher.messages[-1]
+        assert message.event_name == CategoryCreated.__name__
+        assert message.payload['name'] == 'Movie 4'
+
+    def test_relay_keeps_the_batch_the_publisher_rejected(self):
+        CategoryDjangoRepository().insert(Category(name='Movie'))
+        publisher = InMemoryEventPublisher()
+        relay = OutboxRelay(CategoryOutboxModel, publisher)
+
+        with patch.object(publisher, 'publish', side_effect=ConnectionError()):
+            with pytest.raises(ConnectionError):
+                relay.drain()
+        assert len(outbox()) == 1
+
+        assert relay.drain() == 1
+        assert len(publisher.messages) == 1
+
+    def test_relay_command(self):
+        CategoryDjangoRepository().bulk_insert([Category(name='Movie'), Category(name='Anime')])
+        publisher = InMemoryEventPublisher()
+        stdout = io.StringIO()
+        with container.event_publisher.override(publisher):
+            call_command('relay_category_events', once=True, stdout=stdout)
+
+        assert stdout.getvalue().splitlines() == [
+            'Published 2 category events.',
+            'Published 2 category events in total.'
+        ]
+        assert [message.payload['name'] for message in publisher.messages] == ['Movie', 'Anime']
+        assert not outbox()
+
+        with pytest.raises(CommandError, match='--batch-size must be positive.'):
+            call_command('relay_category_events', once=True, batch_size=0)
@@ -1,18 +1,43 @@
 from datetime import datetime, timedelta
+import io
+from typing import Iterator, List
 import unittest
 
 import pytest
 
 from model_bakery import baker
 from model_bakery.recipe import seq
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.sql import emit_post_migrate_signal
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from core.__seedwork.domain.exceptions import NotFoundException
+from core.__seedwork.domain.repositories import CURSOR_START
 from core.__seedwork.domain.value_objects import UniqueEntityId
 from core.category.domain.entities import Category
-from core.category.domain.repositories import CategoryRepository
+from core.category.domain.repositories import (
+    CategoryRepository,
+    CategoryVersion
+)
 from core.category.infra.django_app.mappers import CategoryModelMapper
 from core.category.infra.django_app.models import CategoryModel
-from core.category.infra.django_app.repositories import CategoryDjangoRepository
+from core.category.infra.django_app.name_search import NAME_SEARCH_TABLE, has_name_search
+from core.category.infra.django_app.repositories import (
+    CachingCategoryRepository,
+    CategoryDjangoRepository
+)
+
+
+# the kind of each statement run, without the savepoints of the atomic
+# blocks the test case already wraps in its own transaction
+def statements(context: CaptureQueriesContext) -> List[str]:
+    return [
+        query['sql'].split()[0] for query in context.captured_queries
+        if 'SAVEPOINT' not in query['sql']
+    ]
+
 
 @pytest.mark.django_db
 class TestCategoryDjangoRepositoryInt(unittest.TestCase):
@@ -21,6 +46,7 @@ class TestCategoryDjangoRepositoryInt(unittest.TestCase):
     
     def setUp(self):
         self.repo = CategoryDjangoRepository()
+        cache.clear()
     
     
     def test_insert(self):
@@ -114,6 +140,27 @@ class TestCategoryDjangoRepositoryInt(unittest.TestCase):
             "Entity not found using ID 'af46842e-027d-4c91-b259-3a3642144ba4'"
         )
 
+    def test_update_and_delete_run_a_single_query(self):
+        category = Category(name='Movie')
+        self.repo.insert(category)
+        category.update(name='Movie changed')
+
+        # each followed by the outbox INSERT of its event
+        with CaptureQueriesContext(connection) as context:
+            self.repo.update(category)
+        self.assertListEqual(statements(context), ['UPDATE', 'INSERT'])
+
+        with CaptureQueriesContext(connection) as context:
+            self.repo.delete(category.id)
+        self.assertListEqual(statements(context), ['DELETE', 'INSERT'])
+
+        with CaptureQueriesContext(connection) as context:
+            with self.assertRaises(NotFoundException):
+                self.repo.update(category)
+            with self.assertRaises(NotFoundException):
+                self.repo.delete(category.id)
+        self.assertListEqual(statements(context), ['UPDATE', 'DELETE'])
+
     def test_delete(self):
         category = Category(name='Movie')
         self.repo.insert(category)
@@ -412,3 +459,494 @@ class TestCategoryDjangoRepositoryInt(unittest.TestCase):
             sort_dir='asc',
             filter='TEST'
         ))
+
+    def test_search_by_cursor(self):
+        created_at = timezone.now()
+        models = CategoryModel.objects.bulk_create([
+            CategoryModel(
+                id=UniqueEntityId().id,
+                name=name,
+                description=None,
+                is_active=True,
+                created_at=created_at + timedelta(seconds=index % 2)
+            ) for index, name in enumerate(['b', 'a', 'test', 'c', 'a', 'TeSt'])
+        ])
+
+        arrange = [
+            {'sort': 'name', 'sort_dir': 'asc', 'filter': None},
+            {'sort': 'name', 'sort_dir': 'desc', 'filter': None},
+            {'sort': None, 'sort_dir': None, 'filter': None},
+            {'sort': 'name', 'sort_dir': 'asc', 'filter': 'TEST'},
+        ]
+        for item in arrange:
+            sort = item['sort'] or 'created_at'
+            is_desc = item['sort_dir'] != 'asc'
+            expected = sorted(
+                [
+                    model for model in models
+                    if not item['filter'] or item['filter'].lower() in model.name.lower()
+                ],
+                key=lambda model, sort=sort: (getattr(model, sort), str(model.id)),
+                reverse=is_desc
+            )
+
+            walked = []
+            cursor = CURSOR_START
+            while cursor:
+                search_result = self.repo.search(CategoryRepository.SearchParams(
+                    per_page=4,
+                    sort=item['sort'],
+                    sort_dir=item['sort_dir'],
+                    filter=item['filter'],
+                    cursor=cursor
+                ))
+                self.assertEqual(search_result.total, len(expected))
+                walked.extend(search_result.items)
+                cursor = search_result.next_cursor
+
+            self.assertEqual(
+                walked,
+                [CategoryModelMapper.to_entity(model) for model in expected],
+                f"The output using cursor on {item} is different"
+            )
+
+    def test_search_count_modes(self):
+        baker.make(CategoryModel, _quantity=5)
+
+        search_result = self.repo.search(CategoryRepository.SearchParams(
+            page=2, per_page=2, count_mode='none'))
+        self.assertEqual(len(search_result.items), 2)
+        self.assertIsNone(search_result.total)
+        self.assertIsNone(search_result.last_page)
+        self.assertTrue(search_result.has_more)
+
+        search_result = self.repo.search(CategoryRepository.SearchParams(
+            page=3, per_page=2, count_mode='none'))
+        self.assertEqual(len(search_result.items), 1)
+        self.assertFalse(search_result.has_more)
+
+        search_result = self.repo.search(CategoryRepository.SearchParams(
+            per_page=2, count_mode='estimated'))
+        self.assertEqual(search_result.total, 5)
+        self.assertEqual(search_result.last_page, 3)
+        self.assertFalse(search_result.total_capped)
+
+        baker.make(CategoryModel)
+        self.repo.count_estimate_limit = 4
+        with CaptureQueriesContext(connection) as context:
+            search_result = self.repo.search(CategoryRepository.SearchParams(
+                page=2, per_page=2, count_mode='estimated'))
+        self.assertEqual(search_result.total, 4)
+        self.assertTrue(search_result.total_capped)
+        self.assertIsNone(search_result.last_page)
+        self.assertTrue(search_result.has_more)
+        self.assertIn('LIMIT 5', context.captured_queries[-1]['sql'])
+        self.assertNotIn('ORDER BY', context.captured_queries[-1]['sql'])
+
+        search_result = self.repo.search(CategoryRepository.SearchParams(
+            per_page=2, count_mode='exact'))
+        self.assertEqual(search_result.total, 6)
+
+    def _search_names(self, filter_param: str):
+        with CaptureQueriesContext(connection) as context:
+            search_result = self.repo.search(CategoryRepository.SearchParams(
+                per_page=50, sort='name', sort_dir='asc', filter=filter_param))
+        used_index = any(f'{NAME_SEARCH_TABLE} MATCH' in query['sql'] for query in context.captured_queries)
+        return [item.name for item in search_result.items], search_result.total, used_index
+
+    def test_search_filter_uses_name_search_index(self):
+        names = ['Movie', 'MOVIES', 'my movie', 'Documentary', 'Ação', 'AÇÃO', '50% off', 'say "hi"']
+        for name in names:
+            baker.make(CategoryModel, name=name)
+
+        arrange = [
+            ('movie', ['MOVIES', 'Movie', 'my movie'], True),
+            ('ção', ['Ação'], True),
+            ('% o', ['50% off'], True),
+            ('"hi"', ['say "hi"'], True),
+            ('zzz', [], True),
+            ('ov', ['MOVIES', 'Movie', 'my movie'], False),
+        ]
+        for filter_param, expected_names, expected_used_index in arrange:
+            with self.subTest(filter=filter_param):
+                found_names, total, used_index = self._search_names(filter_param)
+                self.assertEqual(found_names, expected_names)
+                self.assertEqual(total, len(expected_names))
+                self.assertEqual(used_index, expected_used_index)
+
+    def test_name_search_index_follows_updates_and_deletes(self):
+        category = Category(name='Movie')
+        self.repo.insert(category)
+
+        category.update('Documentary')
+        self.repo.update(category)
+        self.assertEqual(self._search_names('movie')[0], [])
+        self.assertEqual(self._search_names('document')[0], ['Documentary'])
+
+        self.repo.delete(category.id)
+        self.assertEqual(self._search_names('document')[0], [])
+
+    def test_search_filter_without_name_search_index(self):
+        baker.make(CategoryModel, name='Movie')
+        self.repo.name_search_enabled = False
+        self.assertEqual(self._search_names('movie'), (['Movie'], 1, False))
+
+    def test_backfill_category_name_search_command(self):
+        baker.make(CategoryModel, name='Movie')
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {NAME_SEARCH_TABLE}({NAME_SEARCH_TABLE}) VALUES ('delete-all')")
+        self.assertEqual(self._search_names('movie')[0], [])
+
+        call_command('backfill_category_name_search', stdout=io.StringIO())
+        self.assertEqual(self._search_names('movie')[0], ['Movie'])
+
+    def test_name_search_is_repaired_after_migrate(self):
+        # what a migration that rebuilds the categories table leaves behind
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP TRIGGER {NAME_SEARCH_TABLE}_ai')
+        baker.make(CategoryModel, name='Movie')
+        self.assertFalse(has_name_search())
+        self.assertEqual(self._search_names('movie'), (['Movie'], 1, False))
+
+        emit_post_migrate_signal(verbosity=0, interactive=False, db=connection.alias)
+
+        self.assertTrue(has_name_search())
+        self.repo = CategoryDjangoRepository()
+        self.assertEqual(self._search_names('movie'), (['Movie'], 1, True))
+
+    def test_bulk_update(self):
+        categories = [Category(name=f'Movie {index}') for index in range(5)]
+        self.repo.bulk_insert(categories)
+        self.repo.batch_size = 2
+
+        for category in categories[:4]:
+            category.update(f'{category.name} updated', 'description')
+        self.repo.bulk_update(iter(categories[:4]))
+
+        self.assertListEqual(
+            sorted(model.name for model in CategoryModel.objects.all()),
+            ['Movie 0 updated', 'Movie 1 updated', 'Movie 2 updated', 'Movie 3 updated', 'Movie 4'])
+        self.assertEqual(self._search_names('updated')[1], 4)
+
+        fake_category = Category(
+            unique_entity_id=UniqueEntityId('af46842e-027d-4c91-b259-3a3642144ba4'), name='fake')
+        categories[4].update('Movie 4 updated')
+        with self.assertRaises(NotFoundException) as assert_error:
+            self.repo.bulk_update([categories[4], fake_category])
+        self.assertEqual(assert_error.exception.args[0],
+                         "Entity not found using ID 'af46842e-027d-4c91-b259-3a3642144ba4'")
+        self.assertEqual(CategoryModel.objects.get(pk=categories[4].id).name, 'Movie 4')
+
+    def test_bulk_upsert(self):
+        category = Category(name='Movie')
+        self.repo.insert(category)
+        self.repo.batch_size = 2
+
+        category.update('Movie updated')
+        new_categories = [Category(name='Documentary'), Category(name='Anime')]
+        self.repo.bulk_upsert([category, *new_categories])
+
+        self.assertEqual(CategoryModel.objects.count(), 3)
+        self.assertEqual(self.repo.find_by_id(category.id), category)
+        for new_category in new_categories:
+            self.assertEqual(self.repo.find_by_id(new_category.id), new_category)
+        self.assertEqual(self._search_names('updated')[0], ['Movie updated'])
+
+    def test_bulk_delete(self):
+        categories = [Category(name=f'Movie {index}') for index in range(5)]
+        self.repo.bulk_insert(categories)
+        self.repo.batch_size = 2
+
+        with self.assertRaises(NotFoundException) as assert_error:
+            self.repo.bulk_delete([categories[0].id, categories[1].id, 'fake id'])
+        self.assertEqual(assert_error.exception.args[0], "Entity not found using ID 'fake id'")
+        self.assertEqual(CategoryModel.objects.count(), 5)
+
+        with self.assertRaises(NotFoundException):
+            self.repo.bulk_delete([categories[0].id, categories[1].id, categories[1].id])
+        self.assertEqual(CategoryModel.objects.count(), 5)
+
+        self.repo.bulk_delete([
+            categories[0].unique_entity_id, categories[0].id, categories[1].id, categories[3].id
+        ])
+        self.assertListEqual(
+            sorted(model.name for model in CategoryModel.objects.all()), ['Movie 2', 'Movie 4'])
+        self.assertEqual(self._search_names('movie')[1], 2)
+
+    def test_find_by_ids(self):
+        categories = [Category(name=f'Movie {index}') for index in range(3)]
+        self.repo.bulk_insert(categories)
+        self.repo.batch_size = 1
+
+        self.assertListEqual(self.repo.find_by_ids([
+            categories[2].id, 'fake id', 'af46842e-027d-4c91-b259-3a3642144ba4',
+            categories[0].unique_entity_id, categories[2].id.upper()
+        ]), [categories[2], categories[0]])
+
+
+    def test_find_version(self):
+        categories = [Category(name=f'Movie {index}') for index in range(3)]
+        self.repo.bulk_insert(categories)
+        categories[0].update(name='Documentary', description=None)
+        self.repo.update(categories[0])
+
+        with CaptureQueriesContext(connection) as context:
+            self.assertEqual(
+                self.repo.find_version(categories[0].id),
+                CategoryVersion(2, categories[0].updated_at)
+            )
+        self.assertEqual(len(context.captured_queries), 1)
+        with self.assertRaises(NotFoundException):
+            self.repo.find_version('fake id')
+
+    def test_stream(self):
+        created_at = timezone.now()
+        categories = [
+            Category(name=f'Movie {index}', created_at=created_at + timedelta(seconds=index))
+            for index in range(5)
+        ]
+        categories.append(Category(name='Documentary', created_at=created_at - timedelta(seconds=1)))
+        self.repo.bulk_insert(categories)
+        self.repo.batch_size = 2
+
+        stream = self.repo.stream(CategoryRepository.SearchParams(filter='movie', sort='name', sort_dir='desc'))
+        self.assertIsInstance(stream, Iterator)
+        self.assertListEqual(list(stream), categories[4::-1])
+
+        with CaptureQueriesContext(connection) as context:
+            self.assertListEqual(
+                list(self.repo.stream(CategoryRepository.SearchParams())),
+                categories[4::-1] + [categories[5]]
+            )
+        self.assertEqual(len(context.captured_queries), 1)
+
+# writes inside a transaction are cached differently, so these tests commit
+@pytest.mark.django_db(transaction=True)
+class TestCachingCategoryRepositoryInt(unittest.TestCase):
+
+    repo: CachingCategoryRepository
+
+    def setUp(self):
+        cache.clear()
+        self.repo = CachingCategoryRepository(CategoryDjangoRepository())
+
+    def test_find_by_id_reads_through_the_cache(self):
+        category = Category(name='Movie')
+        self.repo.insert(category)
+
+        with CaptureQueriesContext(connection) as context:
+            self.assertEqual(self.repo.find_by_id(category.id), category)
+            self.assertEqual(self.repo.find_by_id(category.id.upper()), category)
+            self.assertEqual(self.repo.find_by_id(category.unique_entity_id), category)
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertEqual((self.repo.hits, self.repo.misses), (2, 1))
+
+    def test_cached_entities_survive_a_round_trip(self):
+        category = Category(name='Movie', description='some description')
+        self.repo.insert(category)
+
+        self.repo.find_by_id(category.id)
+        cached = self.repo.find_by_id(category.id)
+
+        self.assertEqual((self.repo.hits, self.repo.misses), (1, 1))
+        self.assertEqual(cached.id, category.id)
+        self.assertEqual(cached.to_dict(), category.to_dict())
+
+    def test_find_by_id_caches_misses(self):
+        entity_id = 'af46842e-027d-4c91-b259-3a3642144ba4'
+        with CaptureQueriesContext(connection) as context:
+            for _ in range(2):
+                with self.assertRaises(NotFoundException) as assert_error:
+                    self.repo.find_by_id(entity_id)
+                self.assertEqual(
+                    assert_error.exception.args[0],
+                    f"Entity not found using ID '{entity_id}'"
+                )
+            with self.assertRaises(NotFoundException):
+                self.repo.find_by_id('fake id')
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertEqual((self.repo.hits, self.repo.misses), (1, 1))
+
+        self.repo.insert(Category(name='Movie', unique_entity_id=UniqueEntityId(entity_id)))
+        self.assertEqual(self.repo.find_by_id(entity_id).name, 'Movie')
+
+    def test_find_by_ids_reads_through_the_cache(self):
+        categories = [Category(name=f'Movie {index}') for index in range(3)]
+        self.repo.bulk_insert(categories)
+        fake_id = 'af46842e-027d-4c91-b259-3a3642144ba4'
+        self.repo.find_by_id(categories[1].id)
+
+        with CaptureQueriesContext(connection) as context:
+            for _ in range(2):
+                self.assertListEqual(self.repo.find_by_ids([
+                    categories[2].id, 'fake id', fake_id, categories[1].id, categories[2].id
+                ]), [categories[2], categories[1]])
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertEqual((self.repo.hits, self.repo.misses), (4, 3))
+
+    def test_writes_invalidate_cached_entries(self):
+        categories = [Category(name=f'Movie {index}') for index in range(3)]
+        self.repo.bulk_insert(categories)
+        self.repo.find_by_ids([category.id for category in categories])
+
+        categories[0].update(name='Movie changed', description=None)
+        self.repo.update(categories[0])
+        self.assertEqual(self.repo.find_by_id(categories[0].id).name, 'Movie changed')
+
+        categories[1].deactivate()
+        self.repo.bulk_update([categories[1]])
+        self.assertFalse(self.repo.find_by_id(categories[1].id).is_active)
+
+        categories[2].update(name='Movie upserted', description=None)
+        self.repo.bulk_upsert([categories[2]])
+        self.assertEqual(self.repo.find_by_id(categories[2].id).name, 'Movie upserted')
+
+        self.repo.delete(categories[0].id)
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id(categories[0].id)
+
+        self.repo.bulk_delete([categories[1].id, categories[2].id])
+        self.assertListEqual(
+            self.repo.find_by_ids([categories[1].id, categories[2].id]), [])
+
+    def test_cache_reads_off_loads_from_the_repository(self):
+        writer = CachingCategoryRepository(CategoryDjangoRepository(), cache_reads=False)
+        category = Category(name='Movie')
+        self.repo.insert(category)
+        self.repo.find_by_id(category.id)
+        CategoryModel.objects.filter(id=category.id).update(name='Movie changed', version=2)
+
+        self.assertEqual(self.repo.find_by_id(category.id).name, 'Movie')
+        self.assertEqual(writer.find_by_id(category.id).name, 'Movie changed')
+        self.assertEqual(writer.find_version(category.id).version, 2)
+        self.assertEqual(writer.find_by_ids([category.id])[0].name, 'Movie changed')
+        self.assertEqual(writer.search(CategoryRepository.SearchParams()).items[0].version, 2)
+        self.assertEqual((writer.hits, writer.misses), (0, 0))
+
+        entity = writer.find_by_id(category.id)
+        entity.deactivate()
+        writer.update(entity)
+        updated = self.repo.find_by_id(category.id)
+        self.assertEqual((updated.name, updated.is_active), ('Movie changed', False))
+
+    def test_writes_rolled_back_never_reach_the_cache(self):
+        category = Category(name='Movie')
+        self.repo.insert(category)
+        self.repo.search(CategoryRepository.SearchParams(filter='mov'))
+
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                changed = self.repo.find_by_id(category.id)
+                changed.update(name='Documentary', description=None)
+                self.repo.update(changed)
+                self.assertEqual(self.repo.find_by_id(category.id).name, 'Documentary')
+                self.assertListEqual(self.repo.find_by_ids([category.id]), [changed])
+                self.assertEqual(
+                    self.repo.search(CategoryRepository.SearchParams(filter='mov')).total, 0)
+                raise RuntimeError()
+
+        self.assertEqual(self.repo.find_by_id(category.id), category)
+        self.assertEqual(self.repo.find_by_id(category.id).name, 'Movie')
+        self.assertEqual(self.repo.search(CategoryRepository.SearchParams(filter='mov')).total, 1)
+
+    def test_writes_in_a_transaction_are_invalidated_again_on_commit(self):
+        category = Category(name='Movie')
+        self.repo.insert(category)
+
+        with transaction.atomic():
+            category.update(name='Documentary', description=None)
+            self.repo.update(category)
+            # another process reads the committed row back in meanwhile
+            self.repo.cache.set(self.repo._key(category.id), Category(  # pylint: disable=protected-access
+                name='Movie', unique_entity_id=category.unique_entity_id))
+            generation = self.repo.generation
+
+        self.assertEqual(self.repo.generation, generation + 1)
+        self.assertEqual(self.repo.find_by_id(category.id).name, 'Documentary')
+
+    def test_search_results_are_cached_per_params(self):
+        self.repo.bulk_insert([Category(name=f'Movie {index}') for index in range(3)])
+        params = CategoryRepository.SearchParams(per_page=2, sort='name', sort_dir='DESC')
+
+        with CaptureQueriesContext(connection) as context:
+            result = self.repo.search(params)
+            self.assertIs(self.repo.search(
+                CategoryRepository.SearchParams(per_page='2', sort='name', sort_dir='desc')), result)
+        self.assertEqual(len(context.captured_queries), 2)
+        self.assertListEqual([item.name for item in result.items], ['Movie 2', 'Movie 1'])
+
+        other_page = self.repo.search(CategoryRepository.SearchParams(page=2, per_page=2, sort='name'))
+        self.assertIsNot(other_page, result)
+        self.assertEqual(self.repo.stats()['search_hits'], 1)
+        self.assertEqual(self.repo.stats()['search_misses'], 2)
+
+    def test_writes_bump_the_search_generation(self):
+        category = Category(name='Movie')
+        self.repo.insert(category)
+        params = CategoryRepository.SearchParams(filter='mov')
+        self.assertEqual(self.repo.search(params).total, 1)
+
+        generation = self.repo.generation
+        self.repo.insert(Category(name='Movie 2'))
+        self.assertEqual(self.repo.generation, generation + 1)
+        self.assertEqual(self.repo.search(params).total, 2)
+
+        category.update(name='Documentary', description=None)
+        self.repo.update(category)
+        self.assertEqual(self.repo.search(params).total, 1)
+
+        self.repo.delete(category.id)
+        self.assertEqual(self.repo.search(CategoryRepository.SearchParams()).total, 1)
+        self.assertEqual(self.repo.stats()['search_hits'], 0)
+
+    def test_writes_invalidate_the_searches_of_other_processes(self):
+        other = CachingCategoryRepository(CategoryDjangoRepository())
+        params = CategoryRepository.SearchParams(filter='mov')
+        self.assertEqual(other.search(params).total, 0)
+
+        self.repo.insert(Category(name='Movie'))
+
+        self.assertEqual(other.generation, self.repo.generation)
+        self.assertEqual(other.search(params).total, 1)
+        self.assertEqual(other.stats()['search_hits'], 0)
+
+    def test_search_cache_evicts_least_recently_used(self):
+        self.repo.search_cache_size = 2
+        self.repo.bulk_insert([Category(name=f'Movie {index}') for index in range(3)])
+        first, second, third = (
+            CategoryRepository.SearchParams(page=page, per_page=1) for page in range(1, 4))
+        self.repo.search(first)
+        self.repo.search(second)
+        self.repo.search(first)
+        self.repo.search(third)
+        self.assertEqual(self.repo.stats()['search_size'], 2)
+
+        with CaptureQueriesContext(connection) as context:
+            self.repo.search(first)
+            self.repo.search(third)
+        self.assertEqual(len(context.captured_queries), 0)
+
+        with CaptureQueriesContext(connection) as context:
+            self.repo.search(second)
+        self.assertGreater(len(context.captured_queries), 0)
+
+    def test_search_cache_expires_entries(self):
+        self.repo.search_ttl = 0
+        params = CategoryRepository.SearchParams()
+        self.repo.search(params)
+        self.repo.search(params)
+        self.assertEqual(self.repo.stats()['search_misses'], 2)
+
+    def test_find_version_reads_cached_entries(self):
+        category = Category(name='Movie')
+        self.repo.insert(category)
+        self.repo.find_by_id(category.id)
+
+        with CaptureQueriesContext(connection) as context:
+            self.assertEqual(
+                self.repo.find_version(category.id), CategoryVersion(1, category.updated_at))
+        self.assertEqual(len(context.captured_queries), 0)
+
+        self.repo.delete(category.id)
+        with self.assertRaises(NotFoundException):
+            self.repo.find_version(category.id)
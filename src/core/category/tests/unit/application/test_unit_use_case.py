@@ -4,15 +4,35 @@ from typing import Optional
 from unittest.mock import patch
 from django.utils import timezone
 from core.__seedwork.application.dto import PaginationOutput, SearchInput
+from core.__seedwork.application.unit_of_work import InMemoryUnitOfWork
 from core.__seedwork.application.use_cases import UseCase
 from core.__seedwork.domain.exceptions import NotFoundException
+from core.__seedwork.domain.validators import CompiledRules, ValidatedProps
 from core.category.application.dto import CategoryOutput, CategoryOutputMapper
-from core.category.application.use_cases import CreateCategoryUseCase, DeleteCategoryUseCase, GetCategoryUseCase, ListCategoriesUseCase, UpdateCategoryUseCase
+from core.__seedwork.application.dto import BatchItemOutput
+from core.category.application.use_cases import (
+    CreateCategoriesUseCase,
+    CreateCategoryUseCase,
+    DeleteCategoriesUseCase,
+    DeleteCategoryUseCase,
+    GetCategoryUseCase,
+    ListCategoriesUseCase,
+    UpdateCategoriesUseCase,
+    UpdateCategoryUseCase
+)
 from core.category.domain.entities import Category
+from core.category.domain.events import CategoryUpdated
 from core.category.domain.repositories import CategoryRepository
+from core.category.domain.validators import CategoryValidatorFactory
 from core.category.infra.in_memory.repositories import CategoryInMemoryRepository
 
 
+def validate_props(props: dict) -> ValidatedProps:
+    validator = CategoryValidatorFactory.create()
+    assert validator.validate(props)
+    return validator.validated_props()
+
+
 class TestCreateCategoryUseCaseUnit(unittest.TestCase):
     use_case: CreateCategoryUseCase
     category_repo: CategoryInMemoryRepository
@@ -29,7 +49,8 @@ class TestCreateCategoryUseCaseUnit(unittest.TestCase):
                          {
                              'name': str,
                              'description': Optional[str],
-                             'is_active': Optional[bool]
+                             'is_active': Optional[bool],
+                             'validated': Optional[ValidatedProps]
                          })
         # pylint: disable=E1101
         description_field = CreateCategoryUseCase.Input.__dataclass_fields__[
@@ -306,7 +327,8 @@ class TestUpdateCategoryUseCase(unittest.TestCase):
             'id': str,
             'name': str,
             'description': Optional[str],
-            'is_active': Optional[bool]
+            'is_active': Optional[bool],
+            'validated': Optional[ValidatedProps]
         })
         # pylint: disable=no-member
         description_field = UpdateCategoryUseCase.Input.__dataclass_fields__[
@@ -433,6 +455,37 @@ class TestUpdateCategoryUseCase(unittest.TestCase):
                 UpdateCategoryUseCase.Output(**i['expected'])
             )
 
+    def test_execute_applies_the_input_as_one_change(self):
+        category = Category(name='Movie')
+        self.category_repo.items = [category]
+
+        self.use_case.execute(
+            UpdateCategoryUseCase.Input(id=category.id, name='Documentary', is_active=False))
+
+        found = self.category_repo.find_by_id(category.id)
+        self.assertEqual((found.name, found.is_active, found.version), ('Documentary', False, 2))
+        updated, = (
+            event for event in self.category_repo.events if isinstance(event, CategoryUpdated))
+        self.assertEqual((updated.name, updated.is_active, updated.version), ('Documentary', False, 2))
+
+    def test_execute_is_rolled_back_with_the_unit_of_work(self):
+        category = Category(name='Movie')
+        self.category_repo.items = [category]
+        unit_of_work = InMemoryUnitOfWork()
+        use_case = UpdateCategoryUseCase(self.category_repo, unit_of_work)
+
+        with self.assertRaises(RuntimeError):
+            with unit_of_work:
+                use_case.execute(UpdateCategoryUseCase.Input(id=category.id, name='Documentary'))
+                raise RuntimeError()
+
+        found = self.category_repo.find_by_id(category.id)
+        self.assertEqual((found.name, found.version), ('Movie', 1))
+        self.assertEqual(self.category_repo.search(
+            CategoryRepository.SearchParams(filter='movie')).items, [category])
+        self.assertEqual(self.category_repo.search(
+            CategoryRepository.SearchParams(filter='documentary')).items, [])
+
 
 class TestDeleteCategoryUseCase(unittest.TestCase):
 
@@ -470,3 +523,126 @@ class TestDeleteCategoryUseCase(unittest.TestCase):
             self.use_case.execute(request)
             spy_delete.assert_called_once()
             self.assertCountEqual(self.category_repo.items, [])
+
+
+class TestCreateCategoriesUseCase(unittest.TestCase):
+
+    use_case: CreateCategoriesUseCase
+    category_repo: CategoryInMemoryRepository
+
+    def setUp(self) -> None:
+        self.category_repo = CategoryInMemoryRepository()
+        self.use_case = CreateCategoriesUseCase(self.category_repo)
+
+    def test_execute(self):
+        with patch.object(
+            self.category_repo,
+            'bulk_insert',
+            wraps=self.category_repo.bulk_insert
+        ) as spy_bulk_insert:
+            output = self.use_case.execute(CreateCategoriesUseCase.Input(items=[
+                CreateCategoryUseCase.Input(name='Movie'),
+                CreateCategoryUseCase.Input(name='a' * 256),
+                CreateCategoryUseCase.Input(name='Documentary', description='description', is_active=False),
+            ]))
+            spy_bulk_insert.assert_called_once()
+
+        categories = {category.name: category for category in self.category_repo.items}
+        self.assertEqual(len(categories), 2)
+        self.assertEqual(output, CreateCategoriesUseCase.Output(items=[
+            BatchItemOutput(0, data=CategoryOutputMapper.without_child().to_output(categories['Movie'])),
+            BatchItemOutput(1, errors={'name': ['Ensure this field has no more than 255 characters.']}),
+            BatchItemOutput(2, data=CategoryOutputMapper.without_child().to_output(categories['Documentary'])),
+        ]))
+        self.assertEqual(categories['Documentary'].description, 'description')
+        self.assertFalse(categories['Documentary'].is_active)
+        self.assertTrue(output.items[0].succeeded)
+        self.assertFalse(output.items[1].succeeded)
+
+    def test_execute_skips_the_props_validated_by_the_caller(self):
+        validated = validate_props({'name': 'Movie'})
+
+        with patch.object(CompiledRules, 'run', autospec=True, side_effect=CompiledRules.run) as spy_run:
+            output = self.use_case.execute(CreateCategoriesUseCase.Input(items=[
+                CreateCategoryUseCase.Input(name='Movie', validated=validated),
+                CreateCategoryUseCase.Input(name='Movie', description=5, validated=validated),
+            ]))
+        self.assertEqual([call.args[2] for call in spy_run.call_args_list], [{'name'}] * 2)
+        self.assertTrue(output.items[0].succeeded)
+        self.assertEqual(output.items[1].errors, {'description': ['Not a valid string.']})
+
+
+class TestUpdateCategoriesUseCase(unittest.TestCase):
+
+    use_case: UpdateCategoriesUseCase
+    category_repo: CategoryInMemoryRepository
+
+    def setUp(self) -> None:
+        self.category_repo = CategoryInMemoryRepository()
+        self.use_case = UpdateCategoriesUseCase(self.category_repo)
+
+    def test_execute(self):
+        movie = Category(name='Movie')
+        documentary = Category(name='Documentary', is_active=False)
+        self.category_repo.items = [movie, documentary]
+
+        with patch.object(
+            self.category_repo,
+            'bulk_update',
+            wraps=self.category_repo.bulk_update
+        ) as spy_bulk_update:
+            output = self.use_case.execute(UpdateCategoriesUseCase.Input(items=[
+                UpdateCategoryUseCase.Input(id=movie.id, name='Movie 2', is_active=False),
+                UpdateCategoryUseCase.Input(id='af46842e-027d-4c91-b259-3a3642144ba4', name='fake'),
+                UpdateCategoryUseCase.Input(id=documentary.id, name=''),
+            ]))
+            spy_bulk_update.assert_called_once_with([movie])
+
+        self.assertEqual(output.items[0], BatchItemOutput(
+            0, data=CategoryOutputMapper.without_child().to_output(movie)))
+        self.assertEqual(output.items[0].data.name, 'Movie 2')
+        self.assertFalse(output.items[0].data.is_active)
+        self.assertEqual(output.items[1], BatchItemOutput(1, errors={
+            'id': ["Entity not found using ID 'af46842e-027d-4c91-b259-3a3642144ba4'"]
+        }, not_found=True))
+        self.assertEqual(output.items[2], BatchItemOutput(
+            2, errors={'name': ['This field may not be blank.']}))
+        self.assertEqual(self.category_repo.find_by_id(documentary.id).name, 'Documentary')
+
+    def test_execute_skips_the_props_validated_by_the_caller(self):
+        movie = Category(name='Movie')
+        self.category_repo.items = [movie]
+        validated = validate_props({'name': 'Movie 2', 'description': None})
+
+        with patch.object(CompiledRules, 'run', autospec=True, side_effect=CompiledRules.run) as spy_run:
+            output = self.use_case.execute(UpdateCategoriesUseCase.Input(items=[
+                UpdateCategoryUseCase.Input(id=movie.id, name='Movie 2', validated=validated),
+            ]))
+        self.assertEqual(
+            [call.args[2] for call in spy_run.call_args_list], [{'name', 'description'}] * 2)
+        self.assertEqual(output.items[0].data.name, 'Movie 2')
+
+
+class TestDeleteCategoriesUseCase(unittest.TestCase):
+
+    use_case: DeleteCategoriesUseCase
+    category_repo: CategoryInMemoryRepository
+
+    def setUp(self) -> None:
+        self.category_repo = CategoryInMemoryRepository()
+        self.use_case = DeleteCategoriesUseCase(self.category_repo)
+
+    def test_execute(self):
+        categories = [Category(name='Movie'), Category(name='Documentary')]
+        self.category_repo.items = categories
+
+        output = self.use_case.execute(DeleteCategoriesUseCase.Input(ids=[
+            categories[0].id, 'not_found', categories[0].id
+        ]))
+
+        self.assertListEqual(self.category_repo.items, [categories[1]])
+        self.assertEqual(output, DeleteCategoriesUseCase.Output(items=[
+            BatchItemOutput(0),
+            BatchItemOutput(1, errors={'id': ["Entity not found using ID 'not_found'"]}, not_found=True),
+            BatchItemOutput(2),
+        ]))
@@ -1,8 +1,9 @@
 import unittest
-from datetime import datetime
+from datetime import datetime, timezone
 from dataclasses import FrozenInstanceError, is_dataclass
 from unittest.mock import patch
 from core.category.domain.entities import Category
+from core.category.domain.events import CategoryCreated, CategoryUpdated
 
 
 class TestCategoryUnit(unittest.TestCase):
@@ -60,3 +61,85 @@ class TestCategoryUnit(unittest.TestCase):
             category.update(name='Games', description='description')
             self.assertEqual(category.name, 'Games')
             self.assertEqual(category.description, 'description')
+
+    def test_changes_move_updated_at_and_version(self):
+        created_at = datetime(2022, 1, 1, tzinfo=timezone.utc)
+        category = Category(name='Movies', created_at=created_at)
+        self.assertEqual(category.updated_at, created_at)
+        self.assertEqual(category.version, 1)
+
+        category.update(name='Movies', description=None)
+        category.activate()
+        self.assertEqual(category.updated_at, created_at)
+        self.assertEqual(category.version, 1)
+
+        category.update(name='Games', description=None)
+        self.assertGreater(category.updated_at, created_at)
+        self.assertEqual(category.version, 2)
+
+        category.deactivate()
+        category.deactivate()
+        self.assertEqual(category.version, 3)
+        category.activate()
+        self.assertEqual(category.version, 4)
+
+    def test_to_dict_and_from_dict(self):
+        created_at = datetime.now()
+        category = Category(
+            name='Movies', description='description', is_active=False, created_at=created_at)
+        category_dict = category.to_dict()
+        self.assertDictEqual(category_dict, {
+            'id': category.id,
+            'name': 'Movies',
+            'description': 'description',
+            'is_active': False,
+            'created_at': created_at,
+            'updated_at': created_at,
+            'version': 1,
+        })
+        self.assertEqual(Category.from_dict(category_dict), category)
+
+    def test_records_its_creation_and_changes(self):
+        category = Category(name='Movies')
+        created, = category.pull_events()
+        self.assertIsInstance(created, CategoryCreated)
+        self.assertEqual(created.aggregate_id, category.id)
+        self.assertEqual(created.occurred_on, category.created_at)
+        self.assertEqual(created.to_payload(), {
+            'name': 'Movies',
+            'description': None,
+            'is_active': True,
+            'created_at': category.created_at,
+            'version': 1,
+        })
+
+        category.update(name='Movies', description=None)
+        self.assertEqual(category.events, ())
+
+        category.update(name='Games', description=None)
+        category.deactivate()
+        updated, deactivated = category.pull_events()
+        self.assertIsInstance(updated, CategoryUpdated)
+        self.assertEqual((updated.name, updated.is_active, updated.version), ('Games', True, 2))
+        self.assertEqual((deactivated.name, deactivated.is_active, deactivated.version), ('Games', False, 3))
+        self.assertEqual(deactivated.occurred_on, category.updated_at)
+
+        self.assertEqual(Category.hydrate(**category.to_dict()).events, ())
+
+    def test_change_moves_the_version_once_per_change_set(self):
+        category = Category(name='Movies')
+        category.pull_events()
+
+        category.change(name='Movies', description=None, is_active=True)
+        self.assertEqual((category.version, category.events), (1, ()))
+
+        category.change(name='Games', description='description', is_active=False)
+        updated, = category.pull_events()
+        self.assertEqual(category.version, 2)
+        self.assertEqual(
+            (updated.name, updated.description, updated.is_active, updated.version),
+            ('Games', 'description', False, 2))
+
+        category.change(name='Games', description='description')
+        self.assertFalse(category.is_active)
+        self.assertEqual(category.version, 2)
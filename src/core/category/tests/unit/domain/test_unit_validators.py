@@ -72,3 +72,17 @@ class TestCategoryValidatorUnit(unittest.TestCase):
             self.assertTrue(is_valid)
             # print(self.validator.validated_data)
             self.assertDictEqual(data['data'], self.validator.validated_data)
+
+    def test_validate_many(self):
+        errors = self.validator.validate_many([
+            {'name': 'Movie'},
+            {'name': 'a' * 256},
+            {'name': 'Documentary', 'description': None, 'is_active': False},
+        ])
+        self.assertDictEqual(errors, {
+            1: {'name': ['Ensure this field has no more than 255 characters.']}
+        })
+        self.assertListEqual(self.validator.validated_data, [
+            {'name': 'Movie'},
+            {'name': 'Documentary', 'description': None, 'is_active': False},
+        ])
@@ -1,7 +1,10 @@
 from collections import namedtuple
-from datetime import datetime
+from datetime import datetime, timezone
+import io
 import unittest
+import uuid
 from unittest import mock
+from core.__seedwork.application.dto import VersionOutput
 from core.__seedwork.infra.django_app.serializers import UUIDSerializer
 from core.category.application.dto import CategoryOutput
 from core.category.application.use_cases import (
@@ -12,6 +15,8 @@ from core.category.application.use_cases import (
     DeleteCategoryUseCase
 )
 from core.category.infra.django_app.api import CategoryResource
+from django.core.management import call_command
+from rest_framework.exceptions import ErrorDetail, ValidationError
 from rest_framework.test import APIRequestFactory
 from rest_framework.request import Request
 
@@ -19,23 +24,25 @@ from core.category.infra.django_app.serializers import CategorySerializer
 from core.category.tests.helpers import init_category_resource_all_none
 
 
-class StubCategorySerializer:
-    validated_data = None
-
-    def is_valid(self, raise_exception: bool):
-        pass
-
-
 class TestCategoryResourceUnit(unittest.TestCase):
 
-    @mock.patch.object(CategorySerializer, '__new__')
-    def test_category_to_response(self, mock_serializer):
-        mock_serializer.return_value = namedtuple(
-            'Faker', ['data'])(data='test')
-        data = CategoryResource.category_to_response('output')
-        mock_serializer.assert_called_with(
-            CategorySerializer, instance='output')
-        self.assertEqual(data, 'test')
+    def test_category_to_response(self):
+        output = CategoryOutput(
+            id='af46842e-027d-4c91-b259-3a3642144ba4',
+            name='Movie',
+            description=None,
+            is_active=True,
+            created_at=datetime(2022, 1, 1, 10, 30, 0, 123456, tzinfo=timezone.utc)
+        )
+        data = CategoryResource.category_to_response(output)
+        self.assertEqual(data, {
+            'id': 'af46842e-027d-4c91-b259-3a3642144ba4',
+            'name': 'Movie',
+            'description': None,
+            'is_active': True,
+            'created_at': '2022-01-01T10:30:00.123456Z'
+        })
+        self.assertEqual(data, CategorySerializer(instance=output).data)
 
     @mock.patch.object(UUIDSerializer, '__new__')
     def test_validate_id_method(self, mock_serializer):
@@ -48,10 +55,13 @@ class TestCategoryResourceUnit(unittest.TestCase):
             UUIDSerializer, data={'id': 'fake id'})
         mock_serializer_is_valid.assert_called_with(raise_exception=True)
 
+        mock_serializer.reset_mock()
+        CategoryResource.validate_id(uuid.UUID('af46842e-027d-4c91-b259-3a3642144ba4'))
+        mock_serializer.assert_not_called()
+
     @mock.patch.object(CategoryResource, 'category_to_response')
     def test_post_method(self, mock_category_to_response):
-        stub_serializer = StubCategorySerializer()
-        send_data = {'name': 'movie'}
+        send_data = {'name': 'movie', 'created_at': 'ignored'}
         expected_response = {
             'id': 'c31d3c48-9a2d-42d0-9c5f-400249e5556b',
             'name': 'movie',
@@ -59,10 +69,9 @@ class TestCategoryResourceUnit(unittest.TestCase):
             'is_active': True,
             'created_at': datetime.now()
         }
-        with mock.patch.object(CategorySerializer, '__new__', return_value=stub_serializer) as mock_serializer:
-            stub_serializer.validated_data = send_data
-            stub_serializer.is_valid = mock.MagicMock()
-
+        with mock.patch.object(
+            CategoryResource, 'validate_body', wraps=CategoryResource.validate_body
+        ) as spy_validate_body:
             mock_create_use_case = mock.Mock(CreateCategoryUseCase)
             mock_create_use_case.execute.return_value = CreateCategoryUseCase.Output(
                 **expected_response
@@ -81,10 +90,12 @@ class TestCategoryResourceUnit(unittest.TestCase):
             request = Request(_request)
             request._full_data = send_data
             response = resource.post(request)
-            stub_serializer.is_valid.assert_called_with(raise_exception=True)
+            spy_validate_body.assert_called_once_with(send_data)
             mock_create_use_case.execute.assert_called_with(CreateCategoryUseCase.Input(
                 name='movie'
             ))
+            input_param = mock_create_use_case.execute.call_args.args[0]
+            self.assertEqual(dict(input_param.validated.props), {'name': 'movie'})
             mock_category_to_response.assert_called_with(
                 mock_create_use_case.execute.return_value)
             self.assertEqual(response.status_code, 201)
@@ -95,10 +106,41 @@ class TestCategoryResourceUnit(unittest.TestCase):
                 'is_active': True,
                 'created_at': expected_response['created_at']
             })
-        mock_serializer.assert_called_with(CategorySerializer, data=send_data)
+
+    def test_validate_body(self):
+        validated = CategoryResource.validate_body(
+            {'name': 'Movie', 'is_active': False, 'version': 10})
+        self.assertEqual(dict(validated.props), {'name': 'Movie', 'is_active': False})
+
+        # what the API serializer converts, the domain rules then accept
+        validated = CategoryResource.validate_body({'name': 1, 'is_active': 'true'})
+        self.assertEqual(dict(validated.props), {'name': '1', 'is_active': True})
+
+        with self.assertRaises(ValidationError) as assert_error:
+            CategoryResource.validate_body(
+                {'name': 'Movie', 'description': None, 'is_active': 'maybe'})
+        self.assertEqual(assert_error.exception.detail, {
+            'description': [ErrorDetail('This field may not be null.', 'null')],
+            'is_active': [ErrorDetail('Must be a valid boolean.', 'invalid')],
+        })
+
+        with self.assertRaises(ValidationError) as assert_error:
+            CategoryResource.validate_body({'name': 'a' * 256, 'description': ''})
+        self.assertEqual(assert_error.exception.detail, {
+            'description': [ErrorDetail('This field may not be blank.', 'blank')],
+        })
+
+        # the serializer sets no length, the domain rules do
+        with self.assertRaises(ValidationError) as assert_error:
+            CategoryResource.validate_body({'name': 'a' * 256})
+        self.assertEqual(list(assert_error.exception.detail), ['name'])
+
+        with self.assertRaises(ValidationError) as assert_error:
+            CategoryResource.validate_body(['Movie'])
+        self.assertEqual(list(assert_error.exception.detail), ['non_field_errors'])
 
     def test_get_method(self):
-        mock_list_use_case = mock.Mock(CreateCategoryUseCase)
+        mock_list_use_case = mock.Mock(ListCategoriesUseCase)
 
         mock_list_use_case.execute.return_value = ListCategoriesUseCase.Output(
             items=[
@@ -135,6 +177,8 @@ class TestCategoryResourceUnit(unittest.TestCase):
             filter='test'
         ))
         self.assertEqual(response.status_code, 200)
+        self.assertRegex(response['ETag'], r'^"[0-9a-f]{32}"$')
+        self.assertNotIn('Last-Modified', response)
         # self.assertEqual(response.data, {
         #     'items': [
         #         {
@@ -173,6 +217,8 @@ class TestCategoryResourceUnit(unittest.TestCase):
         mock_get_use_case.execute.return_value = GetCategoryUseCase.Output(
             **expected_response
         )
+        mock_get_use_case.get_version.return_value = VersionOutput(
+            '1-1640995200.000000', datetime(2022, 1, 1, tzinfo=timezone.utc))
 
         mock_category_to_response.return_value = {
             **expected_response
@@ -195,6 +241,8 @@ class TestCategoryResourceUnit(unittest.TestCase):
             mock_get_use_case.execute.return_value)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data, expected_response)
+        self.assertEqual(response['ETag'], '"1-1640995200.000000"')
+        self.assertEqual(response['Last-Modified'], 'Sat, 01 Jan 2022 00:00:00 GMT')
 
     # @mock.patch.object(CategoryResource, 'category_to_response')
     # @mock.patch.object(CategoryResource, 'validate_id')
@@ -258,3 +306,11 @@ class TestCategoryResourceUnit(unittest.TestCase):
             id='c31d3c48-9a2d-42d0-9c5f-400249e5556b'
         ))
         self.assertEqual(response.status_code, 204)
+
+    def test_benchmark_category_rendering_command(self):
+        stdout = io.StringIO()
+        call_command('benchmark_category_rendering', per_page=3, iterations=2, stdout=stdout)
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].startswith('object: serializers'))
+        self.assertTrue(lines[1].startswith('page of 3: serializers'))
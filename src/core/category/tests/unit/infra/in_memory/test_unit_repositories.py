@@ -2,6 +2,8 @@
 import unittest
 from datetime import timedelta, datetime
 from core.category.domain.entities import Category
+from core.__seedwork.domain.exceptions import NotFoundException
+from core.category.domain.repositories import CategoryRepository, CategoryVersion
 from core.category.infra.in_memory.repositories import CategoryInMemoryRepository
 
 
@@ -54,3 +56,91 @@ class TestCategoryInMemoryRepositoryUnit(unittest.TestCase):
         # pylint: disable=protected-access
         items_filtered = self.repo._apply_sort(items, "name", "desc")
         self.assertListEqual(items_filtered, [items[0], items[1], items[2]])
+
+    def test_search_filter_with_name_index_matches_scan(self):
+        self.repo.items = [
+            Category(name=name) for name in
+            ['Movie', 'Documentary', 'Anime', 'MOVIES', 'Horror movie', 'Mo', 'Série']
+        ]
+        self.repo.search(CategoryRepository.SearchParams(filter='movie'))
+        self.repo.insert(Category(name='Action Movie'))
+        category = self.repo.find_by_id(self.repo.items[1].id)
+        category.update(name='Movie documentary')
+        self.repo.update(category)
+        self.repo.delete(self.repo.items[0].id)
+
+        for filter_param in ['mov', 'MOVIE', 'o', 'mo', 'série', 'xyz', 'ie d']:
+            expected = [
+                item for item in self.repo.items
+                if filter_param.lower() in item.name.lower()
+            ]
+            # pylint: disable=protected-access
+            candidates = self.repo._get_filter_candidates(filter_param)
+            self.assertListEqual(
+                self.repo._apply_filter(candidates, filter_param), expected)
+
+    def test_search_filter_without_name_index(self):
+        self.repo.name_index_enabled = False
+        items = [Category(name='Movie'), Category(name='Anime')]
+        self.repo.items = items
+        # pylint: disable=protected-access
+        self.assertListEqual(self.repo._get_filter_candidates('movie'), items)
+
+    def test_bulk_operations_keep_name_index(self):
+        self.repo.items = [
+            Category(name=name) for name in ['Movie', 'Documentary', 'Anime', 'Horror movie']
+        ]
+        self.repo.search(CategoryRepository.SearchParams(filter='movie'))
+
+        movie, documentary, anime, horror = self.repo.items
+        documentary.update(name='Documentary movie')
+        self.repo.bulk_upsert([documentary, Category(name='Movie night')])
+        anime.update(name='Anime series')
+        self.repo.bulk_update([anime])
+        self.repo.bulk_delete([movie.id, horror.id])
+
+        result = self.repo.search(CategoryRepository.SearchParams(filter='movie', sort='name'))
+        self.assertListEqual(
+            [item.name for item in result.items], ['Documentary movie', 'Movie night'])
+
+    def test_find_version(self):
+        created_at = datetime(2022, 1, 1)
+        movie = Category(name='Movie', created_at=created_at)
+        documentary = Category(name='Documentary', created_at=created_at + timedelta(days=1))
+        self.repo.bulk_insert([movie, documentary])
+
+        self.assertEqual(self.repo.find_version(movie.id), CategoryVersion(1, created_at))
+        with self.assertRaises(NotFoundException):
+            self.repo.find_version('af46842e-027d-4c91-b259-3a3642144ba4')
+
+        movie.update(name='Movie changed', description=None)
+        self.assertEqual(self.repo.find_version(movie.id), CategoryVersion(2, movie.updated_at))
+
+    def test_deletes_store_the_deleted_events(self):
+        categories = [Category(name=f'Movie {index}') for index in range(3)]
+        self.repo.bulk_insert(categories)
+        self.repo.events.clear()
+
+        self.repo.delete(categories[0].id)
+        self.repo.bulk_delete([categories[1].id, categories[2].unique_entity_id])
+
+        self.assertEqual(
+            [(event.event_name, event.aggregate_id) for event in self.repo.events],
+            [('CategoryDeleted', category.id) for category in categories])
+
+    def test_stream(self):
+        created_at = datetime(2022, 1, 1)
+        categories = [
+            Category(name=name, created_at=created_at + timedelta(days=index))
+            for index, name in enumerate(['b movie', 'Documentary', 'a Movie'])
+        ]
+        self.repo.bulk_insert(categories)
+
+        self.assertListEqual(
+            list(self.repo.stream(CategoryRepository.SearchParams())),
+            categories[::-1]
+        )
+        self.assertListEqual(
+            list(self.repo.stream(CategoryRepository.SearchParams(filter='movie', sort='name'))),
+            [categories[2], categories[0]]
+        )
@@ -1,6 +1,30 @@
 from dependency_injector import containers, providers
-from core.category.application.use_cases import CreateCategoryUseCase, DeleteCategoryUseCase, GetCategoryUseCase, ListCategoriesUseCase, UpdateCategoryUseCase
-from core.category.infra.django_app.repositories import CategoryDjangoRepository
+from django.conf import settings
+from core.__seedwork.application.events import FileEventPublisher
+from core.__seedwork.application.unit_of_work import InMemoryUnitOfWork
+from core.__seedwork.infra.django_app.unit_of_work import DjangoUnitOfWork
+from core.category.application.use_cases import (
+    AsyncCreateCategoryUseCase,
+    AsyncDeleteCategoryUseCase,
+    AsyncGetCategoryUseCase,
+    AsyncListCategoriesUseCase,
+    AsyncUpdateCategoryUseCase,
+    CreateCategoriesUseCase,
+    CreateCategoryUseCase,
+    DeleteCategoriesUseCase,
+    DeleteCategoryUseCase,
+    ExportCategoriesUseCase,
+    GetCategoryUseCase,
+    ListCategoriesUseCase,
+    UpdateCategoriesUseCase,
+    UpdateCategoryUseCase
+)
+from core.category.infra.django_app.repositories import (
+    CacheInvalidatingAsyncCategoryRepository,
+    CachingCategoryRepository,
+    CategoryDjangoAsyncRepository,
+    CategoryDjangoRepository
+)
 from core.category.infra.in_memory.repositories import CategoryInMemoryRepository
 
 
@@ -9,29 +33,105 @@ class Container(containers.DeclarativeContainer):
     
     repository_category_django_orm = providers.Singleton(CategoryDjangoRepository)
     
+    repository_category_cached = providers.Singleton(
+        CachingCategoryRepository,
+        repository=repository_category_django_orm
+    )
+
+    # writes load what they change from the database and drop it from the cache
+    repository_category_cache_invalidating = providers.Singleton(
+        CachingCategoryRepository,
+        repository=repository_category_django_orm,
+        cache_reads=False
+    )
+
+    unit_of_work_in_memory = providers.Singleton(InMemoryUnitOfWork)
+
+    unit_of_work_django = providers.Singleton(DjangoUnitOfWork)
+
+    event_publisher = providers.Singleton(
+        FileEventPublisher,
+        path=providers.Callable(lambda: settings.EVENTS_FILE)
+    )
+    
     use_case_category_create_category = providers.Singleton(
         CreateCategoryUseCase,
-        category_repo=repository_category_django_orm
+        category_repo=repository_category_cache_invalidating,
+        unit_of_work=unit_of_work_django
     )
     
     use_case_category_list_categories = providers.Singleton(
         ListCategoriesUseCase,
-        category_repo=repository_category_django_orm
+        category_repo=repository_category_cached
     )
     
     use_case_category_get_category = providers.Singleton(
         GetCategoryUseCase,
-        category_repo=repository_category_django_orm
+        category_repo=repository_category_cached
     )
     
     use_case_category_update_category = providers.Singleton(
         UpdateCategoryUseCase,
-        category_repo=repository_category_django_orm
+        category_repo=repository_category_cache_invalidating,
+        unit_of_work=unit_of_work_django
     )
     
     use_case_category_delete_category = providers.Singleton(
         DeleteCategoryUseCase,
+        category_repo=repository_category_cache_invalidating,
+        unit_of_work=unit_of_work_django
+    )
+
+    use_case_category_create_categories = providers.Singleton(
+        CreateCategoriesUseCase,
+        category_repo=repository_category_cache_invalidating
+    )
+
+    use_case_category_update_categories = providers.Singleton(
+        UpdateCategoriesUseCase,
+        category_repo=repository_category_cache_invalidating
+    )
+
+    use_case_category_delete_categories = providers.Singleton(
+        DeleteCategoriesUseCase,
+        category_repo=repository_category_cache_invalidating
+    )
+
+    use_case_category_export_categories = providers.Singleton(
+        ExportCategoriesUseCase,
         category_repo=repository_category_django_orm
     )
-    
-    
\ No newline at end of file
+
+    repository_category_django_orm_async = providers.Singleton(CategoryDjangoAsyncRepository)
+
+    # async writes drop what they change from the cache the sync views read
+    repository_category_django_orm_async_cache_invalidating = providers.Singleton(
+        CacheInvalidatingAsyncCategoryRepository,
+        repository=repository_category_django_orm_async,
+        cache=repository_category_cached
+    )
+
+    use_case_category_create_category_async = providers.Singleton(
+        AsyncCreateCategoryUseCase,
+        category_repo=repository_category_django_orm_async_cache_invalidating
+    )
+
+    use_case_category_list_categories_async = providers.Singleton(
+        AsyncListCategoriesUseCase,
+        category_repo=repository_category_django_orm_async
+    )
+
+    use_case_category_get_category_async = providers.Singleton(
+        AsyncGetCategoryUseCase,
+        category_repo=repository_category_django_orm_async
+    )
+
+    use_case_category_update_category_async = providers.Singleton(
+        AsyncUpdateCategoryUseCase,
+        category_repo=repository_category_django_orm_async_cache_invalidating
+    )
+
+    use_case_category_delete_category_async = providers.Singleton(
+        AsyncDeleteCategoryUseCase,
+        category_repo=repository_category_django_orm_async_cache_invalidating
+    )
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -71,6 +72,17 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "micro-videos",
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -111,3 +123,16 @@ STATIC_URL = "static/"
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+# Category views
+# The ASGI entry point (django_app/asgi.py) switches the category routes to
+# the async views
+
+CATEGORY_ASYNC_VIEWS = os.environ.get("CATEGORY_ASYNC_VIEWS", "0") == "1"
+
+
+# Domain events
+# relay_category_events publishes the category outbox through the
+# event_publisher of django_app/container.py, which appends to this file
+
+EVENTS_FILE = os.environ.get("EVENTS_FILE", BASE_DIR / "events.ndjson")